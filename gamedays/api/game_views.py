@@ -2,7 +2,8 @@ import json
 from collections import OrderedDict
 from http import HTTPStatus
 
-from rest_framework.exceptions import NotFound
+from django.db import transaction
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.generics import UpdateAPIView, RetrieveUpdateAPIView
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -13,10 +14,14 @@ from gamedays.api.serializers import (
     GameSetupSerializer,
     GameLogSerializer,
 )
-from gamedays.models import Team, Gameinfo, GameSetup, TeamLog
+from gamedays.models import Team, Gameinfo, GameSetup, ScorecardSyncEvent
+from gamedays.service.game_live_state_service import GameLiveStateService
+from gamedays.service.game_replay import GameReplay
 from gamedays.service.game_service import GameService
 from gamedays.service.gameday_service import GamedayService
-from gamedays.service.model_helper import GameresultHelper, TeamLogHelper
+from gamedays.serializers.scorecard_sync import ScorecardSyncSerializer
+from gamedays.service.optimistic_lock import VersionConflict
+from gamedays.service.scorecard_sync_service import ScorecardSyncService
 
 
 class GameLogAPIView(APIView):
@@ -31,67 +36,21 @@ class GameLogAPIView(APIView):
                 )
             except Gameinfo.DoesNotExist:
                 raise NotFound(detail=f"No game found for gameId {game_id}")
-        gamelog = (
-            Gameinfo.objects.filter(id=game_id)
-            .annotate(
-                home_id=GameresultHelper.get_gameresult_team_subquery(
-                    is_home=True, team_column="id"
-                ),
-                home=GameresultHelper.get_gameresult_team_subquery(
-                    is_home=True, team_column="name"
-                ),
-                away_id=GameresultHelper.get_gameresult_team_subquery(
-                    is_home=False, team_column="id"
-                ),
-                away=GameresultHelper.get_gameresult_team_subquery(
-                    is_home=False, team_column="name"
-                ),
-                score_home_overall=GameresultHelper.get_gameresult_score(
-                    True, True, True
-                ),
-                score_home_fh=GameresultHelper.get_gameresult_score(True, is_fh=True),
-                score_home_sh=GameresultHelper.get_gameresult_score(True, is_sh=True),
-                score_away_overall=GameresultHelper.get_gameresult_score(
-                    False, True, True
-                ),
-                score_away_fh=GameresultHelper.get_gameresult_score(False, is_fh=True),
-                score_away_sh=GameresultHelper.get_gameresult_score(False, is_sh=True),
-            )
-            .values(*GameLogSerializer.ALL_FIELD_VALUES, "home_id", "away_id")
-        )
-        if not gamelog.exists():
+        try:
+            gamelog = GameLiveStateService.get_gamelog(game_id)
+        except Gameinfo.DoesNotExist:
             raise NotFound(detail=f"No game found for gameId {game_id}")
-        gamelog = list(gamelog)[0]
-        gamelog.update(
-            {
-                GameLogSerializer.TEAMLOG_HOME: list(
-                    TeamLog.objects.filter(gameinfo=game_id, team=gamelog["home_id"])
-                    .exclude(event__in=TeamLogHelper.EXCLUDED_EVENTS)
-                    .order_by("-sequence")
-                    .values()
-                )
-            }
-        )
-        gamelog.update(
-            {
-                GameLogSerializer.TEAMLOG_AWAY: list(
-                    TeamLog.objects.filter(gameinfo=game_id, team=gamelog["away_id"])
-                    .exclude(event__in=TeamLogHelper.EXCLUDED_EVENTS)
-                    .order_by("-sequence")
-                    .values()
-                )
-            }
-        )
         return Response(GameLogSerializer(instance=gamelog).data)
 
     def post(self, request, *args, **kwargs):
         try:
             data = request.data
-            game_service = GameService(data.get("gameId"))
-            gamelog = game_service.create_gamelog(
-                data.get("team"), data.get("event"), request.user, data.get("half")
-            )
-            game_service.update_score(gamelog)
+            with transaction.atomic():
+                game_service = GameService(data.get("gameId"))
+                gamelog = game_service.create_gamelog(
+                    data.get("team"), data.get("event"), request.user, data.get("half")
+                )
+                game_service.update_score(gamelog)
             return Response(
                 json.loads(gamelog.as_json(), object_pairs_hook=OrderedDict),
                 status=HTTPStatus.CREATED,
@@ -108,9 +67,10 @@ class GameLogAPIView(APIView):
     def delete(self, request: Request, *args, **kwargs):
         game_id = kwargs.get("id")
         try:
-            game_service = GameService(game_id)
-            gamelog = game_service.delete_gamelog(request.data.get("sequence"))
-            game_service.update_score(gamelog)
+            with transaction.atomic():
+                game_service = GameService(game_id)
+                gamelog = game_service.delete_gamelog(request.data.get("sequence"))
+                game_service.update_score(gamelog)
             return Response(
                 json.loads(gamelog.as_json(), object_pairs_hook=OrderedDict),
                 status=HTTPStatus.OK,
@@ -120,11 +80,96 @@ class GameLogAPIView(APIView):
                 detail=f"Could not delete team logs ... gameId {game_id} not found"
             )
 
+    @staticmethod
+    def _expected_version(request: Request) -> int | None:
+        """The version of the game the client has read, see scorecard/README.md."""
+        version = request.data.get("version")
+        if version is None:
+            return None
+        if isinstance(version, bool) or not str(version).isdigit():
+            raise ValidationError(detail="version must be a positive number")
+        return int(version)
+
+    @staticmethod
+    def _conflict(game_id, conflict: VersionConflict) -> Response:
+        """The write was rolled back, the client retries based on the current gamelog."""
+        gamelog = GameService(game_id).get_gamelog()
+        return Response(
+            {
+                "detail": str(conflict),
+                "gamelog": json.loads(gamelog.as_json(), object_pairs_hook=OrderedDict),
+            },
+            status=HTTPStatus.CONFLICT,
+        )
+
+
+class GameLogSyncAPIView(APIView):
+    """Applies the events a scorecard recorded offline, see ScorecardSyncService."""
+
+    def post(self, request: Request, *args, **kwargs):
+        game_id = kwargs.get("id")
+        serializer = ScorecardSyncSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            result = ScorecardSyncService(game_id, request.user).sync(
+                serializer.validated_data["events"]
+            )
+        except Gameinfo.DoesNotExist:
+            raise NotFound(
+                detail=f"Could not sync team logs ... gameId {game_id} not found"
+            )
+        except Team.DoesNotExist:
+            raise NotFound(detail="Could not sync team logs ... team not found")
+        except ScorecardSyncEvent.DoesNotExist as error:
+            raise NotFound(detail=f"Could not sync team logs ... {error}")
+        except VersionConflict as conflict:
+            # the batch was rolled back, the scorecard resends it
+            return GameLogAPIView._conflict(game_id, conflict)
+        return Response(
+            {
+                "applied": result.applied,
+                "skipped": result.skipped,
+                "gamelog": json.loads(
+                    result.gamelog.as_json(), object_pairs_hook=OrderedDict
+                ),
+            },
+            status=HTTPStatus.OK,
+        )
+
+
+class GameLogReplayAPIView(APIView):
+    """State of a game after a play (`?sequence=17`) or after the latest play."""
+
+    def get(self, request: Request, *args, **kwargs):
+        game_id = kwargs.get("id")
+        sequence = request.query_params.get("sequence")
+        if sequence is not None and not sequence.isdigit():
+            raise ValidationError(detail="sequence must be a positive number")
+        try:
+            gameinfo = Gameinfo.objects.get(pk=game_id)
+        except Gameinfo.DoesNotExist:
+            raise NotFound(detail=f"No game found for gameId {game_id}")
+        state = GameReplay(gameinfo).replay(
+            int(sequence) if sequence is not None else None
+        )
+        return Response(
+            {
+                **state.as_dict(),
+                "home_score": state.home_score,
+                "away_score": state.away_score,
+            }
+        )
+
 
 class GameHalftimeAPIView(APIView):
     def put(self, request, *args, **kwargs):
         game_service = GameService(kwargs.get("pk"))
-        game_service.update_halftime(request.user)
+        try:
+            game_service.update_halftime(
+                request.user, GameLogAPIView._expected_version(request)
+            )
+        except VersionConflict as conflict:
+            return GameLogAPIView._conflict(kwargs.get("pk"), conflict)
         return Response()
 
 
@@ -135,7 +180,12 @@ class GameFinalizeUpdateView(UpdateAPIView):
     def update(self, request, *args, **kwargs):
         pk = kwargs.get("pk")
         game_service = GameService(pk)
-        game_service.update_game_finished(request.user)
+        try:
+            game_service.update_game_finished(
+                request.user, GameLogAPIView._expected_version(request)
+            )
+        except VersionConflict as conflict:
+            return GameLogAPIView._conflict(pk, conflict)
         game_setup, _ = GameSetup.objects.get_or_create(gameinfo_id=pk)
         serializer = GameFinalizer(instance=game_setup, data=request.data)
         if serializer.is_valid():
@@ -160,13 +210,20 @@ class GameSetupCreateOrUpdateView(RetrieveUpdateAPIView):
 
     def update(self, request, *args, **kwargs):
         pk = kwargs.get("pk")
-        game_setup, is_game_setup_created = GameSetup.objects.get_or_create(
-            gameinfo_id=pk
-        )
+        try:
+            with transaction.atomic():
+                game_setup, is_game_setup_created = GameSetup.objects.get_or_create(
+                    gameinfo_id=pk
+                )
+                if is_game_setup_created:
+                    game_service = GameService(pk)
+                    game_service.update_gamestart(
+                        request.user, GameLogAPIView._expected_version(request)
+                    )
+        except VersionConflict as conflict:
+            # the game setup is rolled back as well, the next request creates it
+            return GameLogAPIView._conflict(pk, conflict)
         serializer = GameSetupSerializer(instance=game_setup, data=request.data)
-        if is_game_setup_created:
-            game_service = GameService(pk)
-            game_service.update_gamestart(request.user)
         if serializer.is_valid():
             serializer.save()
             return Response(serializer.data, status=HTTPStatus.OK)
@@ -185,7 +242,12 @@ class GamesToWhistleAPIView(APIView):
 class GamePossessionAPIView(APIView):
     def put(self, request, *args, **kwargs):
         game_service = GameService(kwargs.get("pk"))
-        game_service.update_team_in_possesion(request.data.get("team"))
+        try:
+            game_service.update_team_in_possesion(
+                request.data.get("team"), GameLogAPIView._expected_version(request)
+            )
+        except VersionConflict as conflict:
+            return GameLogAPIView._conflict(kwargs.get("pk"), conflict)
         return Response()
 
 
@@ -100,7 +100,9 @@ class GameinfoSerializer(ModelSerializer):
             "gameFinished",
             "halftime_score",
             "final_score",
+            "version",
         ]
+        read_only_fields = ["version"]
         extra_kwargs = {
             "gameStarted": {"format": "%H:%M"},
             "gameHalftime": {"format": "%H:%M"},
@@ -190,7 +192,9 @@ class GameLogSerializer(Serializer):
         )
         name = obj[self.HOME_TEAM] if is_home else obj[self.AWAY_TEAM]
         if name is None:
-            name = GamedayPlaceholderService.resolve_placeholder(obj[self.ID], is_home)
+            name = GamedayPlaceholderService.resolve_from_context(
+                self.context, obj[self.ID], is_home
+            )
         return {
             "name": name,
             "score": obj[score_key],
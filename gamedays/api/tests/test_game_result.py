@@ -66,3 +66,40 @@ class TestGameResult(WebTest):
 
         gameday.refresh_from_db()
         assert gameday.status == Gameday.STATUS_COMPLETED
+
+    def test_update_with_current_version(self):
+        DBSetup().g62_status_empty()
+        game = Gameinfo.objects.first()
+
+        url = reverse("api-game-result", kwargs={"pk": game.pk})
+        response = self.app.patch_json(
+            url,
+            {"halftime_score": {"home": 7, "away": 0}, "version": game.version},
+            headers=DBSetup().get_token_header(),
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json["version"] == game.version + 1
+
+    def test_update_with_outdated_version_conflicts(self):
+        DBSetup().g62_status_empty()
+        game = Gameinfo.objects.first()
+        url = reverse("api-game-result", kwargs={"pk": game.pk})
+        self.app.patch_json(
+            url,
+            {"halftime_score": {"home": 14, "away": 6}, "version": 0},
+            headers=DBSetup().get_token_header(),
+        )
+
+        response = self.app.patch_json(
+            url,
+            {"final_score": {"home": 28, "away": 12}, "version": 0},
+            headers=DBSetup().get_token_header(),
+            expect_errors=True,
+        )
+
+        assert response.status_code == HTTPStatus.CONFLICT
+        assert response.json["current"]["version"] == 1
+        assert response.json["current"]["halftime_score"] == {"home": 14, "away": 6}
+        game.refresh_from_db()
+        assert game.status != Gameinfo.STATUS_COMPLETED
@@ -3,6 +3,8 @@ from rest_framework.routers import DefaultRouter
 
 from gamedays.api.game_views import (
     GameLogAPIView,
+    GameLogSyncAPIView,
+    GameLogReplayAPIView,
     GameHalftimeAPIView,
     GameFinalizeUpdateView,
     GameSetupCreateOrUpdateView,
@@ -15,6 +17,7 @@ from gamedays.api.views import (
     GameinfoUpdateAPIView,
     GamedayRetrieveUpdate,
     GamedayScheduleView,
+    GamedayJsonView,
     GameOfficialCreateOrUpdateView,
     GamedayPublishAPIView,
     GameResultUpdateAPIView,
@@ -27,7 +30,10 @@ from gamedays.api.views import (
 from gamedays.constants import (
     API_GAMEDAY_WHISTLEGAMES,
     API_GAMEDAY_LIST,
+    API_GAMEDAY_JSON,
     API_GAMELOG,
+    API_GAMELOG_SYNC,
+    API_GAMELOG_REPLAY,
     API_CONFIG_SCORECARD_PENALTIES,
     API_GAME_POSSESSION,
     API_GAME_FINALIZE,
@@ -106,12 +112,23 @@ urlpatterns = [
         GamedayScheduleView.as_view(),
         name="api-gameday-schedule",
     ),
+    path(
+        "gameday/<int:pk>/json/<str:document>",
+        GamedayJsonView.as_view(),
+        name=API_GAMEDAY_JSON,
+    ),
     path(
         "gameday/<int:pk>/officials/<str:team>",
         GamesToWhistleAPIView.as_view(),
         name=API_GAMEDAY_WHISTLEGAMES,
     ),
     path("gamelog/<int:id>", GameLogAPIView.as_view(), name=API_GAMELOG),
+    path("gamelog/<int:id>/sync", GameLogSyncAPIView.as_view(), name=API_GAMELOG_SYNC),
+    path(
+        "gamelog/<int:id>/replay",
+        GameLogReplayAPIView.as_view(),
+        name=API_GAMELOG_REPLAY,
+    ),
     path(
         "game/<int:pk>/setup",
         GameSetupCreateOrUpdateView.as_view(),
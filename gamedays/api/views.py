@@ -3,7 +3,11 @@ from collections import OrderedDict
 from datetime import datetime
 
 from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response, quote_etag
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.exceptions import NotFound
@@ -40,6 +44,9 @@ from gamedays.service.gameday_service import (
     TABLE_HEADERS,
     HtmlAndJsonRendering,
 )
+from gamedays.service.gameday_json_service import GamedayJsonService
+from gamedays.service.optimistic_lock import VersionConflict, save_with_version
+from gamedays.service.placeholder_service import GamedayPlaceholderService
 from gamedays.service.gameday_settings import (
     TEAM_DESCRIPTION,
     PF,
@@ -235,6 +242,27 @@ class GamedayScheduleView(APIView):
         return Response(json.loads(response, object_pairs_hook=OrderedDict))
 
 
+class GamedayJsonView(APIView):
+    """Schedule, tables and player statistics of a gameday for embedding."""
+
+    # noinspection PyMethodMayBeStatic
+    def get(self, request: Request, pk: int, document: str):
+        if document not in GamedayJsonService.DOCUMENTS:
+            raise NotFound(f"Unknown document {document}")
+        json_service = GamedayJsonService(pk)
+        etag = quote_etag(json_service.get_etag(document))
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+        # the content is already encoded, so it is not rendered by DRF
+        response = HttpResponse(
+            json_service.get_json(document), content_type="application/json"
+        )
+        response["ETag"] = etag
+        response["Cache-Control"] = "no-cache"
+        return response
+
+
 class GamedayCreateView(CreateAPIView):
     serializer_class = GamedaySerializer
 
@@ -262,20 +290,34 @@ class GamedayPublishAPIView(APIView):
 class GameResultUpdateAPIView(APIView):
     def patch(self, request, *args, **kwargs):
         pk = kwargs.get("pk")
+        try:
+            game = self._update(pk, request.data)
+        except VersionConflict as conflict:
+            return Response(
+                {
+                    "detail": str(conflict),
+                    "current": GameinfoSerializer(Gameinfo.objects.get(pk=pk)).data,
+                },
+                status=status.HTTP_409_CONFLICT,
+            )
+        return Response(GameinfoSerializer(game).data, status=status.HTTP_200_OK)
+
+    @transaction.atomic
+    def _update(self, pk, data) -> Gameinfo:
         game = get_object_or_404(Gameinfo, pk=pk)
 
-        halftime_score = request.data.get("halftime_score")
-        final_score = request.data.get("final_score")
+        halftime_score = data.get("halftime_score")
+        final_score = data.get("final_score")
 
         if halftime_score is not None:
             if game.status == Gameinfo.STATUS_PUBLISHED or game.status == "Geplant":
                 game.status = Gameinfo.STATUS_IN_PROGRESS
             # Sync to Gameresult records
             Gameresult.objects.filter(gameinfo=game, isHome=True).update(
-                fh=halftime_score.get("home")
+                fh=halftime_score.get("home"), version=F("version") + 1
             )
             Gameresult.objects.filter(gameinfo=game, isHome=False).update(
-                fh=halftime_score.get("away")
+                fh=halftime_score.get("away"), version=F("version") + 1
             )
 
         if final_score is not None:
@@ -297,13 +339,18 @@ class GameResultUpdateAPIView(APIView):
             )
 
             Gameresult.objects.filter(gameinfo=game, isHome=True).update(
-                fh=home_fh, sh=final_score.get("home", 0) - (home_fh or 0)
+                fh=home_fh,
+                sh=final_score.get("home", 0) - (home_fh or 0),
+                version=F("version") + 1,
             )
             Gameresult.objects.filter(gameinfo=game, isHome=False).update(
-                fh=away_fh, sh=final_score.get("away", 0) - (away_fh or 0)
+                fh=away_fh,
+                sh=final_score.get("away", 0) - (away_fh or 0),
+                version=F("version") + 1,
             )
 
-        game.save()
+        # the whole update is rolled back if the game was changed since the client read it
+        save_with_version(game, data.get("version"))
 
         # Update gameday status
         gameday = game.gameday
@@ -317,7 +364,7 @@ class GameResultUpdateAPIView(APIView):
             gameday.status = Gameday.STATUS_COMPLETED
             gameday.save()
 
-        return Response(GameinfoSerializer(game).data, status=status.HTTP_200_OK)
+        return game
 
 
 class SeasonViewSet(viewsets.ReadOnlyModelViewSet):
@@ -345,7 +392,11 @@ class GameResultsListView(APIView):
             )
 
         games = Gameinfo.objects.filter(gameday=gameday)
-        serializer = GameInfoSerializer(games, many=True)
+        serializer = GameInfoSerializer(
+            games,
+            many=True,
+            context=GamedayPlaceholderService.serializer_context([gameday.pk]),
+        )
         return Response(serializer.data)
 
 
@@ -363,6 +414,17 @@ class GameResultsUpdateView(APIView):
 
         serializer = GameResultsUpdateSerializer(game, data=request.data)
         if serializer.is_valid():
-            serializer.save()
+            try:
+                serializer.save()
+            except VersionConflict as conflict:
+                return Response(
+                    {
+                        "detail": str(conflict),
+                        "current": GameInfoSerializer(
+                            Gameinfo.objects.get(pk=game_pk)
+                        ).data,
+                    },
+                    status=status.HTTP_409_CONFLICT,
+                )
             return Response(status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -12,7 +12,10 @@ LEAGUE_GAMEDAY_GAMEINFOS_DELETE = "league-gameday-gameinfos-delete"
 LEAGUE_GAMEDAY_GAMEINFOS_WIZARD = "league-gameday-gameinfos-wizard"
 API_GAMEDAY_WHISTLEGAMES = "api-gameday-whistlegames"
 API_GAMEDAY_LIST = "api-gameday-list"
+API_GAMEDAY_JSON = "api-gameday-json"
 API_GAMELOG = "api-gamelog"
+API_GAMELOG_SYNC = "api-gamelog-sync"
+API_GAMELOG_REPLAY = "api-gamelog-replay"
 API_CONFIG_SCORECARD_PENALTIES = "api-config-scorecard-penalties"
 API_GAME_POSSESSION = "api-game-possession"
 API_GAME_FINALIZE = "api-game-finalize"
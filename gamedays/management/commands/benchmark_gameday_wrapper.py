@@ -0,0 +1,115 @@
+import random
+from datetime import date, time
+from itertools import combinations
+from statistics import mean
+from time import perf_counter
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from gamedays.models import Gameday, Gameinfo, Gameresult, League, Season, Team
+from gamedays.service.model_records import GamedayRecords
+from gamedays.service.model_wrapper import GamedayModelWrapper
+
+GROUP_STANDINGS = ["Gruppe 1", "Gruppe 2"]
+FINAL_STANDINGS = ["HF", "P5", "P3", "P1"]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compares GamedayModelWrapper and GamedayRecords on generated gamedays, "
+        "the generated data is rolled back afterwards"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--teams",
+            nargs="+",
+            type=int,
+            default=[4, 8, 12, 16],
+            help="Teams per gameday",
+        )
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        backends = [GamedayModelWrapper, GamedayRecords]
+        self.stdout.write(
+            f"{'teams':>5} " + " ".join(f"{b.__name__:>20}" for b in backends)
+        )
+        for number_teams in options["teams"]:
+            with transaction.atomic():
+                gameday_id = self._create_gameday(number_teams)
+                timings = [
+                    self._measure(backend, gameday_id, options["repeat"])
+                    for backend in backends
+                ]
+                transaction.set_rollback(True)
+            self.stdout.write(
+                f"{number_teams:>5} " + " ".join(f"{t:>17.2f} ms" for t in timings)
+            )
+
+    @staticmethod
+    def _measure(backend, gameday_id: int, repeat: int) -> float:
+        durations = []
+        for _ in range(repeat):
+            start = perf_counter()
+            wrapper = backend(gameday_id)
+            # the lookups of a schedule update after the group stage
+            for standing in GROUP_STANDINGS + FINAL_STANDINGS:
+                wrapper.is_finished(standing)
+            for place in range(1, 3):
+                for index in range(len(GROUP_STANDINGS)):
+                    wrapper.get_team_by_qualify_for(place, index)
+                for standing in GROUP_STANDINGS:
+                    wrapper.get_team_by(place, standing)
+            wrapper.get_teams_by("HF", 2)
+            durations.append(perf_counter() - start)
+        return mean(durations) * 1000
+
+    @staticmethod
+    def _create_gameday(number_teams: int) -> int:
+        rng = random.Random(number_teams)
+        gameday = Gameday.objects.create(
+            name=f"Benchmark {number_teams}",
+            season=Season.objects.get_or_create(name="benchmark")[0],
+            league=League.objects.get_or_create(name="benchmark")[0],
+            date=date.today(),
+            start=time(10),
+            author=User.objects.get_or_create(username="benchmark")[0],
+        )
+        teams = [
+            Team.objects.create(
+                name=f"benchmark {number_teams}-{i}",
+                description=f"benchmark team {number_teams}-{i}",
+            )
+            for i in range(number_teams)
+        ]
+        groups = [teams[i :: len(GROUP_STANDINGS)] for i in range(len(GROUP_STANDINGS))]
+
+        def create_game(stage, standing, home, away, finished):
+            gameinfo = Gameinfo.objects.create(
+                gameday=gameday,
+                scheduled=time(10),
+                field=1,
+                officials=home,
+                status="beendet" if finished else "Geplant",
+                stage=stage,
+                standing=standing,
+            )
+            for team, is_home in ((home, True), (away, False)):
+                Gameresult.objects.create(
+                    gameinfo=gameinfo,
+                    team=team,
+                    isHome=is_home,
+                    fh=rng.randint(0, 4) if finished else None,
+                    sh=rng.randint(0, 4) if finished else None,
+                    pa=rng.randint(0, 8) if finished else None,
+                )
+
+        for standing, group in zip(GROUP_STANDINGS, groups):
+            for home, away in combinations(group, 2):
+                create_game("Vorrunde", standing, home, away, True)
+        for standing in FINAL_STANDINGS:
+            create_game("Finalrunde", standing, groups[0][0], groups[1][0], False)
+        return gameday.pk
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from gamedays.models import Gameinfo
+from gamedays.service.game_service import GameService
+
+
+class Command(BaseCommand):
+    help = "Replays the gamelog of games and repairs stored scores which differ from it"
+
+    def add_arguments(self, parser):
+        parser.add_argument("gameday_ids", nargs="+", type=int)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report games with differing scores",
+        )
+
+    def handle(self, *args, **options):
+        game_ids = Gameinfo.objects.filter(
+            gameday__in=options["gameday_ids"]
+        ).values_list("pk", flat=True)
+        repaired = 0
+        for game_id in game_ids:
+            game_service = GameService(game_id)
+            if options["dry_run"]:
+                differs = not game_service.verify_score()
+            else:
+                differs = game_service.repair_score()
+            if not differs:
+                continue
+            repaired += 1
+            self.stdout.write(f"Score of game {game_id} differs from its gamelog")
+        action = "Found" if options["dry_run"] else "Repaired"
+        self.stdout.write(
+            self.style.SUCCESS(f"{action} {repaired} of {len(game_ids)} games")
+        )
@@ -2,7 +2,8 @@ import json
 import pathlib
 
 from gamedays.models import Team, Gameinfo, Gameresult
-from gamedays.service.model_wrapper import GamedayModelWrapper
+from gamedays.service.gameday_registry import GamedayRegistry
+from gamedays.service.model_records import GamedayRecords
 
 
 class UpdateGameEntry:
@@ -71,7 +72,7 @@ class ScheduleUpdate:
         gameresult.save()
 
     def update(self):
-        gmw = GamedayModelWrapper(self.gameday_id)
+        gmw = GamedayRegistry.get(GamedayRecords, self.gameday_id)
         for update_entry in self.data:
             if gmw.is_finished(update_entry["pre_finished"]) and not gmw.is_finished(
                 update_entry["name"]
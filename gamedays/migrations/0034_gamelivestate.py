@@ -0,0 +1,34 @@
+# Generated by Django 6.0.4 on 2026-10-17 04:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gamedays', '0033_alter_team_location'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GameLiveState',
+            fields=[
+                ('gameinfo', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='live_state', serialize=False, to='gamedays.gameinfo')),
+                ('home_name', models.CharField(blank=True, max_length=100, null=True)),
+                ('home_description', models.CharField(blank=True, max_length=255, null=True)),
+                ('home_fh', models.SmallIntegerField(null=True)),
+                ('home_sh', models.SmallIntegerField(null=True)),
+                ('away_name', models.CharField(blank=True, max_length=100, null=True)),
+                ('away_description', models.CharField(blank=True, max_length=255, null=True)),
+                ('away_fh', models.SmallIntegerField(null=True)),
+                ('away_sh', models.SmallIntegerField(null=True)),
+                ('status', models.CharField(max_length=100)),
+                ('in_possession', models.CharField(blank=True, max_length=100, null=True)),
+                ('last_sequence', models.PositiveSmallIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('away', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='gamedays.team')),
+                ('home', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='gamedays.team')),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.4 on 2026-10-17 04:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gamedays', '0034_gamelivestate'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gamelivestate',
+            name='score_synced',
+            field=models.BooleanField(default=False),
+        ),
+    ]
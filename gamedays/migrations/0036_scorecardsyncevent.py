@@ -0,0 +1,27 @@
+# Generated by Django 6.0.4 on 2026-10-17 04:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gamedays', '0035_gamelivestate_score_synced'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScorecardSyncEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=64)),
+                ('action', models.CharField(max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('gameinfo', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='gamedays.gameinfo')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('gameinfo', 'key'), name='unique_scorecard_sync_event_key')],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 6.0.4 on 2026-10-17 04:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gamedays', '0036_scorecardsyncevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GameStateSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sequence', models.PositiveSmallIntegerField()),
+                ('state', models.JSONField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('gameinfo', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='gamedays.gameinfo')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('gameinfo', 'sequence'), name='unique_game_state_snapshot')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.4 on 2026-10-17 04:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("gamedays", "0037_gamestatesnapshot"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="gameinfo",
+            name="version",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="gameresult",
+            name="version",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 6.0.4 on 2026-10-17 05:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gamedays', '0038_gameinfo_gameresult_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GamedaySnapshot',
+            fields=[
+                ('gameday', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='snapshot', serialize=False, to='gamedays.gameday')),
+                ('document', models.JSONField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.4 on 2026-10-17 06:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gamedays', '0039_gamedaysnapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scorecardsyncevent',
+            name='sequence',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -153,6 +153,8 @@ class Gameinfo(models.Model):
     in_possession = models.CharField(
         max_length=100, blank=True, null=True, default=None
     )
+    # incremented by versioned writes, see gamedays.service.optimistic_lock
+    version = models.PositiveIntegerField(default=0)
 
     objects: QuerySet["Gameinfo"] = models.Manager()
 
@@ -176,6 +178,7 @@ class Gameresult(models.Model):
     sh = models.SmallIntegerField(null=True)
     pa = models.PositiveSmallIntegerField(null=True)
     isHome = models.BooleanField(default=False)
+    version = models.PositiveIntegerField(default=0)
 
     objects: QuerySet["Gameresult"] = models.Manager()
 
@@ -263,6 +266,110 @@ class TeamLog(models.Model):
         )
 
 
+class GameLiveState(models.Model):
+    """
+    Denormalized read model of a running game (teams, half scores, status,
+    possession and the last tick), maintained on write by the GameLiveStateService.
+    """
+
+    gameinfo = models.OneToOneField(
+        Gameinfo,
+        on_delete=models.CASCADE,
+        related_name="live_state",
+        primary_key=True,
+    )
+    home = models.ForeignKey(
+        Team, on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+    home_name = models.CharField(max_length=100, null=True, blank=True)
+    home_description = models.CharField(max_length=255, null=True, blank=True)
+    home_fh = models.SmallIntegerField(null=True)
+    home_sh = models.SmallIntegerField(null=True)
+    away = models.ForeignKey(
+        Team, on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+    away_name = models.CharField(max_length=100, null=True, blank=True)
+    away_description = models.CharField(max_length=255, null=True, blank=True)
+    away_fh = models.SmallIntegerField(null=True)
+    away_sh = models.SmallIntegerField(null=True)
+    status = models.CharField(max_length=100)
+    in_possession = models.CharField(max_length=100, null=True, blank=True)
+    last_sequence = models.PositiveSmallIntegerField(default=0)
+    # scores of the gameresults match the gamelog and can be updated incrementally
+    score_synced = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects: QuerySet["GameLiveState"] = models.Manager()
+
+    def __str__(self):
+        return (
+            f"{self.gameinfo_id}: {self.home_name} {self.home_fh}/{self.home_sh} - "
+            f"{self.away_name} {self.away_fh}/{self.away_sh} [{self.status}]"
+        )
+
+
+class GameStateSnapshot(models.Model):
+    """State of a game folded from its TeamLog up to a sequence, see GameReplay."""
+
+    gameinfo = models.ForeignKey(Gameinfo, on_delete=models.CASCADE)
+    sequence = models.PositiveSmallIntegerField()
+    state = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects: QuerySet["GameStateSnapshot"] = models.Manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["gameinfo", "sequence"], name="unique_game_state_snapshot"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.gameinfo_id}__#{self.sequence}"
+
+
+class ScorecardSyncEvent(models.Model):
+    """Idempotency key of an event which was synced by a scorecard."""
+
+    gameinfo = models.ForeignKey(Gameinfo, on_delete=models.CASCADE)
+    key = models.CharField(max_length=64)
+    action = models.CharField(max_length=20)
+    # sequence of the play a create event was stored as, deletes can refer to its key
+    sequence = models.PositiveIntegerField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects: QuerySet["ScorecardSyncEvent"] = models.Manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["gameinfo", "key"], name="unique_scorecard_sync_event_key"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.gameinfo_id}__{self.key} {self.action}"
+
+
+class GamedaySnapshot(models.Model):
+    """Computed tables and game recaps of a completed gameday, see GamedaySnapshotService."""
+
+    gameday = models.OneToOneField(
+        Gameday,
+        on_delete=models.CASCADE,
+        related_name="snapshot",
+        primary_key=True,
+    )
+    document = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects: QuerySet["GamedaySnapshot"] = models.Manager()
+
+    def __str__(self):
+        return f"{self.gameday_id}__{self.created_at}"
+
+
 class UserProfile(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True)
     avatar = models.ImageField('Avatar', upload_to="media/teammanager/avatars", blank=True, null=True)
@@ -1,5 +1,7 @@
+from django.db import transaction
 from rest_framework import serializers
 from gamedays.models import Gameresult, Gameinfo
+from gamedays.service.optimistic_lock import save_with_version
 from gamedays.service.placeholder_service import GamedayPlaceholderService
 
 
@@ -8,21 +10,27 @@ class GameResultSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Gameresult
-        fields = ["id", "team_id", "team_name", "fh", "sh", "pa", "isHome"]
+        fields = ["id", "team_id", "team_name", "fh", "sh", "pa", "isHome", "version"]
 
     def get_team_name(self, obj):
         if obj.team:
             return obj.team.name
 
-        return GamedayPlaceholderService.resolve_placeholder(
-            obj.gameinfo_id, obj.isHome
+        return GamedayPlaceholderService.resolve_from_context(
+            self.context, obj.gameinfo_id, obj.isHome
         )
-        return GamedayPlaceholderService.resolve_placeholder(obj.gameinfo_id, obj.isHome)
 
 
 class GameResultsUpdateSerializer(serializers.Serializer):
+    """
+    Results and the game are saved with compare-and-swap against the given versions
+    (or the versions read here), a VersionConflict rolls back the whole update.
+    """
+
     results = GameResultSerializer(many=True)
+    version = serializers.IntegerField(required=False)
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         results_data = validated_data.get("results", [])
 
@@ -39,7 +47,7 @@ class GameResultsUpdateSerializer(serializers.Serializer):
                 result.fh = result_data.get("fh", result.fh)
                 result.sh = result_data.get("sh", result.sh)
                 result.pa = result_data.get("pa", result.pa)
-                result.save()
+                save_with_version(result, result_data.get("version"))
 
                 if result.isHome:
                     home_fh = result.fh or 0
@@ -52,7 +60,7 @@ class GameResultsUpdateSerializer(serializers.Serializer):
 
         # Update status
         instance.status = Gameinfo.STATUS_COMPLETED
-        instance.save()
+        save_with_version(instance, validated_data.get("version"))
 
         return instance
 
@@ -78,6 +86,7 @@ class GameInfoSerializer(serializers.ModelSerializer):
             "results",
             "halftime_score",
             "final_score",
+            "version",
         ]
         read_only_fields = [
             "id",
@@ -85,12 +94,13 @@ class GameInfoSerializer(serializers.ModelSerializer):
             "results",
             "halftime_score",
             "final_score",
+            "version",
         ]
 
     def get_results(self, obj):
         """Get all results for this game"""
         results = Gameresult.objects.filter(gameinfo=obj)
-        return GameResultSerializer(results, many=True).data
+        return GameResultSerializer(results, many=True, context=self.context).data
 
     def _get_scores(self, obj):
         results = Gameresult.objects.filter(gameinfo=obj)
@@ -0,0 +1,45 @@
+from rest_framework import serializers
+
+from gamedays.service.scorecard_sync_service import (
+    ACTIONS,
+    ACTION_CREATE,
+    ACTION_DELETE,
+    ACTION_POSSESSION,
+)
+
+
+class ScorecardSyncEventSerializer(serializers.Serializer):
+    key = serializers.CharField(max_length=64)
+    action = serializers.ChoiceField(choices=ACTIONS)
+    team = serializers.CharField(required=False)
+    event = serializers.ListField(child=serializers.DictField(), required=False)
+    half = serializers.IntegerField(required=False)
+    sequence = serializers.IntegerField(required=False, min_value=1)
+    # key of the create event of the play to delete, instead of its sequence
+    create_key = serializers.CharField(max_length=64, required=False)
+
+    REQUIRED_FIELDS = {
+        ACTION_CREATE: ["team", "event", "half"],
+        ACTION_POSSESSION: ["team"],
+    }
+
+    def validate(self, attrs):
+        missing = [
+            field
+            for field in self.REQUIRED_FIELDS.get(attrs["action"], [])
+            if field not in attrs
+        ]
+        if missing:
+            raise serializers.ValidationError(
+                {field: f"Required for action {attrs['action']}" for field in missing}
+            )
+        references = [field for field in ("sequence", "create_key") if field in attrs]
+        if attrs["action"] == ACTION_DELETE and len(references) != 1:
+            raise serializers.ValidationError(
+                {"sequence": "Either sequence or create_key for action delete"}
+            )
+        return attrs
+
+
+class ScorecardSyncSerializer(serializers.Serializer):
+    events = ScorecardSyncEventSerializer(many=True, allow_empty=False)
@@ -39,7 +39,7 @@ class TableContextBuilder:
 
         return {
             "table": table.to_dict(orient="records"),
-            "columns": table.columns,
+            "columns": list(table.columns),
             "is_empty": False,
             "html": None,
         }
@@ -1,4 +1,5 @@
 from gamedays.models import Gameinfo, Gameresult, GamedayDesignerState
+from gamedays.service.game_live_state_service import GameLiveStateService
 
 
 class CanvasBracketProgressionService:
@@ -60,3 +61,5 @@ class CanvasBracketProgressionService:
         except Gameinfo.DoesNotExist:
             return
         Gameresult.objects.filter(gameinfo=gi, isHome=is_home).update(team=team)
+        # update() skips the Gameresult signals, which would invalidate the live state
+        GameLiveStateService.invalidate(gi.pk)
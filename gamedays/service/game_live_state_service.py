@@ -0,0 +1,106 @@
+from django.db.models import Max
+
+from gamedays.api.serializers import GameLogSerializer
+from gamedays.models import GameLiveState, Gameinfo, Gameresult, TeamLog
+from gamedays.service.model_helper import TeamLogHelper
+
+
+class GameLiveStateService:
+    """
+    Maintains the GameLiveState read model of a game.
+
+    GameService refreshes the state inside the same transaction as its writes. Writes
+    outside of GameService (admin, schedule resolution, ...) only invalidate the state,
+    which is rebuilt with the next read.
+    """
+
+    @staticmethod
+    def refresh(gameinfo: Gameinfo, score_synced: bool | None = None) -> GameLiveState:
+        values = {
+            "status": gameinfo.status,
+            "in_possession": gameinfo.in_possession,
+            "last_sequence": TeamLog.objects.filter(gameinfo=gameinfo).aggregate(
+                last_sequence=Max("sequence")
+            )["last_sequence"]
+            or 0,
+        }
+        for gameresult in Gameresult.objects.filter(gameinfo=gameinfo).select_related(
+            "team"
+        ):
+            prefix = "home" if gameresult.isHome else "away"
+            team = gameresult.team
+            values.update(
+                {
+                    f"{prefix}_id": gameresult.team_id,
+                    f"{prefix}_name": team.name if team else None,
+                    f"{prefix}_description": team.description if team else None,
+                    f"{prefix}_fh": gameresult.fh,
+                    f"{prefix}_sh": gameresult.sh,
+                }
+            )
+        if score_synced is not None:
+            values["score_synced"] = score_synced
+        live_state, _ = GameLiveState.objects.update_or_create(
+            gameinfo=gameinfo, defaults=values
+        )
+        return live_state
+
+    @staticmethod
+    def invalidate(game_id: int) -> None:
+        GameLiveState.objects.filter(gameinfo_id=game_id).delete()
+
+    @classmethod
+    def get(cls, game_id: int) -> GameLiveState:
+        try:
+            return GameLiveState.objects.select_related("gameinfo").get(
+                gameinfo_id=game_id
+            )
+        except GameLiveState.DoesNotExist:
+            return cls.refresh(Gameinfo.objects.get(pk=game_id))
+
+    @classmethod
+    def get_gamelog_values(cls, game_id: int) -> dict:
+        """Header of the gamelog (teams and scores) as expected by the GameLogSerializer."""
+        live_state = cls.get(game_id)
+        return {
+            GameLogSerializer.ID: live_state.gameinfo_id,
+            GameLogSerializer.GAME_HALFTIME: live_state.gameinfo.gameHalftime,
+            GameLogSerializer.HOME_TEAM: live_state.home_name,
+            GameLogSerializer.AWAY_TEAM: live_state.away_name,
+            GameLogSerializer.SCORE_HOME_OVERALL: cls._get_score(
+                live_state.home_fh, live_state.home_sh
+            ),
+            GameLogSerializer.SCORE_HOME_FH: live_state.home_fh or 0,
+            GameLogSerializer.SCORE_HOME_SH: live_state.home_sh or 0,
+            GameLogSerializer.SCORE_AWAY_OVERALL: cls._get_score(
+                live_state.away_fh, live_state.away_sh
+            ),
+            GameLogSerializer.SCORE_AWAY_FH: live_state.away_fh or 0,
+            GameLogSerializer.SCORE_AWAY_SH: live_state.away_sh or 0,
+            "home_id": live_state.home_id,
+            "away_id": live_state.away_id,
+        }
+
+    @classmethod
+    def get_gamelog(cls, game_id: int) -> dict:
+        """Gamelog with the entries of both teams, read with two queries."""
+        gamelog = cls.get_gamelog_values(game_id)
+        entries = {gamelog["home_id"]: [], gamelog["away_id"]: []}
+        for teamlog in (
+            TeamLog.objects.filter(
+                gameinfo=game_id, team__in=[gamelog["home_id"], gamelog["away_id"]]
+            )
+            .exclude(event__in=TeamLogHelper.EXCLUDED_EVENTS)
+            .order_by("-sequence")
+            .values()
+        ):
+            entries[teamlog["team_id"]].append(teamlog)
+        gamelog[GameLogSerializer.TEAMLOG_HOME] = entries[gamelog["home_id"]]
+        gamelog[GameLogSerializer.TEAMLOG_AWAY] = entries[gamelog["away_id"]]
+        return gamelog
+
+    @staticmethod
+    def _get_score(first_half, second_half) -> int:
+        if first_half is None or second_half is None:
+            return 0
+        return first_half + second_half
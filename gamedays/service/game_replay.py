@@ -0,0 +1,139 @@
+from dataclasses import dataclass, field, asdict
+
+from gamedays.models import Gameinfo, Gameresult, GameStateSnapshot, TeamLog
+from gamedays.service.model_helper import TeamLogHelper
+
+
+@dataclass
+class GameState:
+    """State of a game after all plays up to `sequence`."""
+
+    home_id: int | None = None
+    away_id: int | None = None
+    sequence: int = 0
+    home_fh: int = 0
+    home_sh: int = 0
+    away_fh: int = 0
+    away_sh: int = 0
+    # team which gained the ball with the latest turnover/interception
+    possession_team_id: int | None = None
+    possession_sequence: int | None = None
+    deleted_sequences: list = field(default_factory=list)
+
+    @property
+    def home_score(self) -> int:
+        return self.home_fh + self.home_sh
+
+    @property
+    def away_score(self) -> int:
+        return self.away_fh + self.away_sh
+
+    def apply(self, teamlog: dict) -> None:
+        self.sequence = teamlog["sequence"]
+        if teamlog["isDeleted"]:
+            if self.sequence not in self.deleted_sequences:
+                self.deleted_sequences.append(self.sequence)
+            return
+        if teamlog["event"] in TeamLogHelper.EXCLUDED_EVENTS:
+            return
+        if teamlog["cop"]:
+            self.possession_team_id = teamlog["team"]
+            self.possession_sequence = self.sequence
+        if teamlog["half"] not in (1, 2):
+            return
+        if teamlog["team"] == self.home_id:
+            side = "home"
+        elif teamlog["team"] == self.away_id:
+            side = "away"
+        else:
+            return
+        half = "fh" if teamlog["half"] == 1 else "sh"
+        setattr(
+            self, f"{side}_{half}", getattr(self, f"{side}_{half}") + teamlog["value"]
+        )
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class GameReplay:
+    """
+    Folds the TeamLog of a game into its GameState at any sequence.
+
+    Every SNAPSHOT_INTERVAL sequences the folded state is stored as GameStateSnapshot
+    by the write path (see store_snapshots), so a replay only has to process the
+    entries after the latest snapshot. replay() itself never writes. Snapshots from a
+    sequence on are dropped as soon as an entry of that sequence changes.
+    Deleted plays are folded as deleted, as the log does not record when they were
+    deleted.
+    """
+
+    SNAPSHOT_INTERVAL = 10
+    TEAMLOG_FIELDS = ["sequence", "team", "half", "event", "value", "cop", "isDeleted"]
+
+    def __init__(self, gameinfo: Gameinfo):
+        self.gameinfo = gameinfo
+        teams = dict(
+            Gameresult.objects.filter(gameinfo=gameinfo).values_list("isHome", "team")
+        )
+        self.home_id = teams.get(True)
+        self.away_id = teams.get(False)
+
+    @staticmethod
+    def invalidate_snapshots(game_id: int, from_sequence: int) -> None:
+        GameStateSnapshot.objects.filter(
+            gameinfo_id=game_id, sequence__gte=from_sequence
+        ).delete()
+
+    def replay(self, sequence: int | None = None) -> GameState:
+        """Returns the state after the play `sequence`, or after the latest play."""
+        return self._replay(sequence, store_snapshots=False)
+
+    def store_snapshots(self) -> GameState:
+        """Replays all plays and stores the missing snapshots on the way."""
+        return self._replay(None, store_snapshots=True)
+
+    def _replay(self, sequence: int | None, store_snapshots: bool) -> GameState:
+        state = self._get_latest_snapshot(sequence, store_snapshots)
+        snapshot_sequence = state.sequence
+        teamlogs = TeamLog.objects.filter(
+            gameinfo=self.gameinfo, sequence__gt=state.sequence
+        )
+        if sequence is not None:
+            teamlogs = teamlogs.filter(sequence__lte=sequence)
+        new_snapshots = []
+        for teamlog in teamlogs.order_by("sequence", "pk").values(*self.TEAMLOG_FIELDS):
+            # all entries of the previous sequence are folded when the next one starts
+            if (
+                teamlog["sequence"] != state.sequence
+                and state.sequence - snapshot_sequence >= self.SNAPSHOT_INTERVAL
+            ):
+                new_snapshots.append(self._create_snapshot(state))
+                snapshot_sequence = state.sequence
+            state.apply(teamlog)
+        if state.sequence - snapshot_sequence >= self.SNAPSHOT_INTERVAL:
+            new_snapshots.append(self._create_snapshot(state))
+        if store_snapshots:
+            GameStateSnapshot.objects.bulk_create(new_snapshots, ignore_conflicts=True)
+        return state
+
+    def _get_latest_snapshot(
+        self, sequence: int | None, drop_outdated: bool = False
+    ) -> GameState:
+        snapshots = GameStateSnapshot.objects.filter(gameinfo=self.gameinfo)
+        if sequence is not None:
+            snapshots = snapshots.filter(sequence__lte=sequence)
+        snapshot = snapshots.order_by("-sequence").first()
+        if snapshot is not None:
+            state = GameState(**snapshot.state)
+            if (state.home_id, state.away_id) == (self.home_id, self.away_id):
+                return state
+            # teams changed (e.g. resolved placeholders), the snapshots are outdated
+            if drop_outdated:
+                self.invalidate_snapshots(self.gameinfo.pk, 0)
+        return GameState(home_id=self.home_id, away_id=self.away_id)
+
+    def _create_snapshot(self, state: GameState) -> GameStateSnapshot:
+        return GameStateSnapshot(
+            gameinfo=self.gameinfo, sequence=state.sequence, state=state.as_dict()
+        )
@@ -1,7 +1,14 @@
-from gamedays.models import Team, TeamLog
+from django.db import transaction
+
+from gamedays.models import Gameinfo, Gameresult, Team, TeamLog
+from gamedays.service.game_live_state_service import GameLiveStateService
+from gamedays.service.game_replay import GameReplay
+from gamedays.service.gameday_data_version import GamedayDataVersion
+from gamedays.service.gameday_snapshot_service import GamedaySnapshotService
 from gamedays.service.gamelog import GameLog, GameLogCreator
 from gamedays.service.wrapper.gameinfo_wrapper import GameinfoWrapper
 from gamedays.service.wrapper.gameresult_wrapper import GameresultWrapper
+from league_table.service.league_table_service import LeagueTableService
 
 
 class GameService(object):
@@ -10,17 +17,23 @@ class GameService(object):
         self.gameinfo: GameinfoWrapper = GameinfoWrapper.from_id(game_id)
         self.gameresult: GameresultWrapper = GameresultWrapper(self.gameinfo.gameinfo)
 
-    def update_halftime(self, user):
-        self.gameinfo.set_halftime_to_now()
+    @transaction.atomic
+    def update_halftime(self, user, expected_version: int | None = None):
+        self.gameinfo.set_halftime_to_now(expected_version)
         self._create_log_entry("2. Halbzeit gestartet", user)
+        self._refresh_live_state()
 
-    def update_gamestart(self, user):
-        self.gameinfo.set_gamestarted_to_now()
+    @transaction.atomic
+    def update_gamestart(self, user, expected_version: int | None = None):
+        self.gameinfo.set_gamestarted_to_now(expected_version)
         self._create_log_entry("Spiel gestartet", user)
+        self._refresh_live_state()
 
-    def update_game_finished(self, user):
-        self.gameinfo.set_game_finished_to_now()
+    @transaction.atomic
+    def update_game_finished(self, user, expected_version: int | None = None):
+        self.gameinfo.set_game_finished_to_now(expected_version)
         self._create_log_entry("Spiel beendet", user)
+        self._refresh_live_state()
 
     def get_gamelog(self):
         return GameLog(self.gameinfo.gameinfo)
@@ -28,10 +41,40 @@ class GameService(object):
     def create_gamelog(self, team_name, event, user, half):
         # ToDo extract to TeamWrapper
         team = Team.objects.get(name=team_name)
-        gamelog = GameLogCreator(self.gameinfo.gameinfo, team, event, user, half)
-        return gamelog.create()
+        gamelog = GameLogCreator(
+            self.gameinfo.gameinfo, team, event, user, half
+        ).create()
+        if gamelog.created_sequence % GameReplay.SNAPSHOT_INTERVAL == 0:
+            GameReplay(self.gameinfo.gameinfo).store_snapshots()
+        return gamelog
 
+    @transaction.atomic
     def update_score(self, gamelog: GameLog):
+        """
+        Applies the score changes of the gamelog incrementally. Falls back to the full
+        recomputation if the changes are unknown or the stored scores can't be trusted.
+        """
+        if gamelog.score_changes is None or not self._apply_score_changes(
+            gamelog.score_changes
+        ):
+            self.recompute_score(gamelog)
+            return
+        gamelog.score_changes = {}
+        # queryset updates send no post_save signals
+        GamedayDataVersion.bump_on_commit(self.gameinfo.gameinfo.gameday_id)
+        GamedaySnapshotService.delete_on_commit(self.gameinfo.gameinfo.gameday_id)
+        if self.gameinfo.gameinfo.status == Gameinfo.STATUS_COMPLETED:
+            LeagueTableService.update_standings_for_game_on_commit(self.game_id)
+        self._refresh_live_state(score_synced=True)
+
+    def _apply_score_changes(self, score_changes: dict) -> bool:
+        for (is_home, half), points in score_changes.items():
+            if points != 0 and self.gameresult.add_points(is_home, half, points) == 0:
+                return False
+        return True
+
+    @transaction.atomic
+    def recompute_score(self, gamelog: GameLog):
         self.gameresult.save_home_first_half(
             gamelog.get_home_firsthalf_score(), gamelog.get_away_firsthalf_score()
         )
@@ -44,6 +87,28 @@ class GameService(object):
         self.gameresult.save_away_second_half(
             gamelog.get_away_secondhalf_score(), gamelog.get_home_secondhalf_score()
         )
+        self._refresh_live_state(score_synced=True)
+
+    def verify_score(self) -> bool:
+        """Checks the stored half scores against the replayed gamelog."""
+        state = GameReplay(self.gameinfo.gameinfo).replay()
+        expected = {
+            True: (state.home_fh, state.home_sh),
+            False: (state.away_fh, state.away_sh),
+        }
+        for is_home, fh, sh in Gameresult.objects.filter(
+            gameinfo=self.gameinfo.gameinfo
+        ).values_list("isHome", "fh", "sh"):
+            if (fh or 0, sh or 0) != expected[is_home]:
+                return False
+        return True
+
+    def repair_score(self) -> bool:
+        """Recomputes the score if it differs from the gamelog, returns if it was repaired."""
+        if self.verify_score():
+            return False
+        self.recompute_score(self.get_gamelog())
+        return True
 
     def delete_gamelog(self, sequence):
         gamelog = GameLog(self.gameinfo.gameinfo)
@@ -55,5 +120,10 @@ class GameService(object):
             gameinfo_id=self.game_id, event=event_text, half=0, sequence=0, author=user
         )
 
-    def update_team_in_possesion(self, team_name):
-        self.gameinfo.update_team_in_possession(team_name)
+    @transaction.atomic
+    def update_team_in_possesion(self, team_name, expected_version: int | None = None):
+        self.gameinfo.update_team_in_possession(team_name, expected_version)
+        self._refresh_live_state()
+
+    def _refresh_live_state(self, score_synced: bool | None = None):
+        GameLiveStateService.refresh(self.gameinfo.gameinfo, score_synced)
@@ -0,0 +1,79 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+from gamedays.service.gameday_registry import GamedayRegistry
+
+
+class GamedayDataVersion:
+    """
+    Per-gameday change counter kept in the cache.
+
+    Every committed write to a game of a gameday bumps its version, so readers can
+    detect changes with a single cache lookup instead of querying the database.
+    Missing keys (cleared or evicted cache) are initialised with a time based value,
+    which keeps versions unique and therefore never matches an outdated reader.
+
+    Writes are only seen by processes sharing the cache. The versions expire after
+    TIMEOUT seconds, so with a per-process cache (LocMemCache) writes of other
+    processes (management commands, further workers) are picked up after that time.
+    """
+
+    CACHE_KEY = "gameday_data_version_{}"
+    LAST_MODIFIED_CACHE_KEY = "gameday_data_last_modified_{}"
+    TIMEOUT = 60
+
+    @classmethod
+    def _key(cls, gameday_id) -> str:
+        return cls.CACHE_KEY.format(gameday_id)
+
+    @staticmethod
+    def _initial_version() -> int:
+        return time.time_ns() // 1000
+
+    @classmethod
+    def get(cls, gameday_id) -> int:
+        return cls.get_many([gameday_id])[gameday_id]
+
+    @classmethod
+    def get_many(cls, gameday_ids) -> dict:
+        keys = {cls._key(gameday_id): gameday_id for gameday_id in gameday_ids}
+        versions = cache.get_many(keys.keys())
+        for key, gameday_id in keys.items():
+            if key not in versions:
+                cache.add(key, cls._initial_version(), timeout=cls.TIMEOUT)
+                versions[key] = cache.get(key)
+        return {keys[key]: version for key, version in versions.items()}
+
+    @classmethod
+    def get_last_modified(cls, gameday_ids) -> int | None:
+        """Returns the latest change of the given gamedays as timestamp, if known."""
+        last_modified = cache.get_many(
+            [
+                cls.LAST_MODIFIED_CACHE_KEY.format(gameday_id)
+                for gameday_id in gameday_ids
+            ]
+        )
+        return max(last_modified.values(), default=None)
+
+    @classmethod
+    def bump(cls, gameday_id) -> None:
+        key = cls._key(gameday_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, cls._initial_version(), timeout=cls.TIMEOUT)
+        cache.set(
+            cls.LAST_MODIFIED_CACHE_KEY.format(gameday_id),
+            int(time.time()),
+            timeout=cls.TIMEOUT,
+        )
+
+    @classmethod
+    def bump_on_commit(cls, gameday_id) -> None:
+        if gameday_id is None:
+            return
+        # read models memoized in this request must not outlive the write
+        GamedayRegistry.invalidate(gameday_id)
+        transaction.on_commit(lambda: cls.bump(gameday_id))
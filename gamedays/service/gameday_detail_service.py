@@ -0,0 +1,101 @@
+import pandas as pd
+from django.apps import apps
+from django.core.cache import cache
+
+from gamedays.service.builders import TableContextBuilder
+from gamedays.service.gameday_data_version import GamedayDataVersion
+from gamedays.service.gameday_service import (
+    SCHEDULE_HTML_COLUMNS,
+    EmptySchedule,
+    GamedayService,
+)
+from gamedays.service.gameday_settings import ID
+from gamedays.service.table_renderer import TableRenderer
+
+
+class GamedayDetailService:
+    """
+    Public tables of the gameday detail page.
+
+    Computing them needs the whole GamedayModelWrapper, so the rendered tables are
+    cached per gameday, keyed by the GamedayDataVersion, and recomputed after the next
+    committed write to a game of the gameday (writes of other processes: once the
+    version expired). Parts which depend on the user (official signups, staff schedule
+    and passcheck details) are not part of the cache.
+    """
+
+    CACHE_KEY = "gameday_detail_tables_{}_{}"
+    # tables of an expired version are never read again
+    CACHE_TIMEOUT = GamedayDataVersion.TIMEOUT
+
+    SCHEDULE = "schedule"
+    QUALIFY_TABLE = "qualify_table"
+    QUALIFY_TABLE_COLUMNS = "qualify_table_columns"
+    FINAL_TABLE = "final_table"
+    OFFENSE_TABLE = "offense_table"
+    DEFENSE_TABLE = "defense_table"
+    PASSCHECK_INFO_TABLE = "passcheck_info_table"
+
+    # all tables share the id, the filter of the detail page relies on it
+    TABLE_ID = "schedule"
+
+    def __init__(self, gameday_id: int):
+        self.gameday_id = gameday_id
+
+    def get_tables(self) -> dict:
+        # the version is read before the tables are computed, so a concurrent write
+        # can't be hidden behind a cached result of an older state
+        cache_key = self.CACHE_KEY.format(
+            self.gameday_id, GamedayDataVersion.get(self.gameday_id)
+        )
+        tables = cache.get(cache_key)
+        if tables is None:
+            tables = self.compute_tables()
+            cache.set(cache_key, tables, self.CACHE_TIMEOUT)
+        return tables
+
+    def get_staff_tables(self) -> dict:
+        """Schedule with game ids and the passcheck details, computed for every request."""
+        gs = GamedayService.create(self.gameday_id)
+        return {
+            self.SCHEDULE: self._render_schedule(gs.get_schedule()),
+            self.PASSCHECK_INFO_TABLE: TableRenderer.render(
+                gs.get_staff_passcheck_details(), table_id=self.TABLE_ID
+            ),
+        }
+
+    def compute_tables(self) -> dict:
+        gs = GamedayService.create(self.gameday_id)
+        qualify_table = gs.get_qualify_table()
+        final_table = gs.get_final_table()
+        qualify_table_columns = (
+            list(qualify_table.columns)
+            if isinstance(qualify_table, pd.DataFrame)
+            else []
+        )
+        if apps.is_installed("league_table"):
+            qualify_table = TableContextBuilder.build(qualify_table)
+            final_table = TableContextBuilder.build(final_table)
+        else:
+            qualify_table = TableRenderer.render(qualify_table, table_id=self.TABLE_ID)
+            final_table = TableRenderer.render(final_table, table_id=self.TABLE_ID)
+        schedule = gs.get_schedule()
+        if not isinstance(schedule, EmptySchedule):
+            del schedule[ID]
+        return {
+            self.SCHEDULE: self._render_schedule(schedule),
+            self.QUALIFY_TABLE: qualify_table,
+            self.QUALIFY_TABLE_COLUMNS: qualify_table_columns,
+            self.FINAL_TABLE: final_table,
+            self.OFFENSE_TABLE: TableRenderer.render(
+                gs.get_offense_player_statistics_table(), table_id=self.TABLE_ID
+            ),
+            self.DEFENSE_TABLE: TableRenderer.render(
+                gs.get_defense_player_statistic_table(), table_id=self.TABLE_ID
+            ),
+        }
+
+    def _render_schedule(self, schedule) -> str:
+        return TableRenderer.render(
+            schedule, html_columns=SCHEDULE_HTML_COLUMNS, table_id=self.TABLE_ID
+        )
@@ -0,0 +1,169 @@
+import json
+
+import pandas as pd
+from django.core.cache import cache
+
+from gamedays.models import Gameinfo
+from gamedays.service.gameday_data_version import GamedayDataVersion
+from gamedays.service.gameday_registry import GamedayRegistry
+from gamedays.service.gameday_service import (
+    EMPTY_DATA,
+    GamedayService,
+    HtmlAndJsonRendering,
+)
+from gamedays.service.gameday_settings import (
+    AWAY,
+    DIFF,
+    FIELD,
+    HOME,
+    ID,
+    OFFICIALS,
+    OFFICIALS_NAME,
+    PA,
+    PF,
+    POINTS_AWAY,
+    POINTS_HOME,
+    SCHEDULED,
+    STAGE,
+    STANDING,
+    STATUS,
+    TEAM_DESCRIPTION,
+    WIN_POINTS,
+)
+from gamedays.service.model_wrapper import GamedayModelWrapper
+from gamedays.service.player_statistics import (
+    DEFENSE_EVENTS,
+    INTERCEPTION,
+    ONE_EXTRA_POINT,
+    PLACE,
+    PLAYER,
+    POINTS,
+    SAFETY,
+    TOUCHDOWN,
+    TWO_EXTRA_POINTS,
+    GamedayPlayerStatistics,
+)
+
+SCHEDULE_COLUMNS = {
+    ID: ID,
+    SCHEDULED: SCHEDULED,
+    FIELD: FIELD,
+    HOME: HOME,
+    POINTS_HOME: POINTS_HOME,
+    POINTS_AWAY: POINTS_AWAY,
+    AWAY: AWAY,
+    OFFICIALS_NAME: OFFICIALS,
+    STANDING: STANDING,
+    STAGE: STAGE,
+    STATUS: STATUS,
+}
+TABLE_COLUMNS = {
+    STANDING: STANDING,
+    TEAM_DESCRIPTION: "team",
+    WIN_POINTS: WIN_POINTS,
+    PF: PF,
+    PA: PA,
+    DIFF: DIFF,
+}
+OFFENSE_COLUMNS = {
+    PLACE: "rank",
+    PLAYER: "player",
+    TOUCHDOWN: "touchdowns",
+    ONE_EXTRA_POINT: "one_extra_points",
+    TWO_EXTRA_POINTS: "two_extra_points",
+    POINTS: "points",
+}
+DEFENSE_KEYS = {INTERCEPTION: "interceptions", SAFETY: "safeties"}
+
+
+class GamedayJsonService:
+    """
+    Schedule, tables and player statistics of a gameday as JSON for embedding.
+
+    The DataFrames are encoded by pandas' JSON writer without building Python objects
+    in between. The documents are cached per GamedayDataVersion, like the tables of the
+    detail page, and the version doubles as the ETag of the document. Both change at the
+    latest when the version expires, so writes of other processes are picked up as well.
+    """
+
+    CACHE_KEY = "gameday_json_{}_{}_{}"
+    CACHE_TIMEOUT = GamedayDataVersion.TIMEOUT
+
+    SCHEDULE = "schedule"
+    QUALIFY = "qualify"
+    FINAL = "final"
+    PLAYERS = "players"
+    DOCUMENTS = [SCHEDULE, QUALIFY, FINAL, PLAYERS]
+
+    def __init__(self, gameday_id: int):
+        self.gameday_id = gameday_id
+        self.version = GamedayDataVersion.get(gameday_id)
+
+    def get_etag(self, document: str) -> str:
+        return f"{self.gameday_id}-{document}-{self.version}"
+
+    def get_json(self, document: str) -> str:
+        cache_key = self.CACHE_KEY.format(self.gameday_id, document, self.version)
+        content = cache.get(cache_key)
+        if content is None:
+            content = getattr(self, f"_get_{document}")()
+            cache.set(cache_key, content, self.CACHE_TIMEOUT)
+        return content
+
+    def _get_schedule(self) -> str:
+        try:
+            schedule = GamedayRegistry.get(
+                GamedayModelWrapper, self.gameday_id
+            ).get_schedule()
+        except Gameinfo.DoesNotExist:
+            return EMPTY_DATA
+        schedule = schedule[list(SCHEDULE_COLUMNS)].rename(columns=SCHEDULE_COLUMNS)
+        schedule[SCHEDULED] = schedule[SCHEDULED].astype(str).str[:5]
+        return self._to_json(schedule)
+
+    def _get_qualify(self) -> str:
+        return self._table_to_json(
+            GamedayService.create(self.gameday_id).get_qualify_table()
+        )
+
+    def _get_final(self) -> str:
+        return self._table_to_json(
+            GamedayService.create(self.gameday_id).get_final_table()
+        )
+
+    def _get_players(self) -> str:
+        statistics = GamedayPlayerStatistics(self.gameday_id)
+        documents = {
+            "offense": self._to_json(
+                statistics.get_offense_table().rename(columns=OFFENSE_COLUMNS)
+            )
+        }
+        for event, key in DEFENSE_KEYS.items():
+            documents[key] = self._to_json(
+                statistics.get_defense_event_table(event).rename(
+                    columns={
+                        PLACE: "rank",
+                        PLAYER: "player",
+                        DEFENSE_EVENTS[event]: "count",
+                    }
+                )
+            )
+        return (
+            "{"
+            + ",".join(
+                f"{json.dumps(key)}:{document}" for key, document in documents.items()
+            )
+            + "}"
+        )
+
+    def _table_to_json(self, table) -> str:
+        if isinstance(table, HtmlAndJsonRendering):
+            return table.to_json()
+        table = table[
+            [column for column in TABLE_COLUMNS if column in table.columns]
+        ].rename(columns=TABLE_COLUMNS)
+        return self._to_json(table)
+
+    @staticmethod
+    def _to_json(table: pd.DataFrame) -> str:
+        return table.to_json(orient="records", force_ascii=False)
@@ -0,0 +1,50 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+_entries: ContextVar[dict | None] = ContextVar("gameday_registry", default=None)
+
+
+class GamedayRegistry:
+    """
+    Memoizes read models of a gameday (GamedayModelWrapper, GamedayPlaceholderService)
+    within a scope, usually one request (see GamedayRegistryMiddleware).
+
+    The entries of a gameday are dropped as soon as one of its games is written (see
+    GamedayDataVersion.bump_on_commit), so later reads inside the same request or
+    transaction see the new state. Outside of a scope every lookup builds a new
+    instance, as before.
+    """
+
+    @staticmethod
+    @contextmanager
+    def scope():
+        if _entries.get() is not None:
+            # nested scopes share the entries of the outer scope
+            yield
+            return
+        token = _entries.set({})
+        try:
+            yield
+        finally:
+            _entries.reset(token)
+
+    @staticmethod
+    def get(factory: Callable[[int], T], gameday_id: int) -> T:
+        entries = _entries.get()
+        if entries is None:
+            return factory(gameday_id)
+        key = (factory, gameday_id)
+        if key not in entries:
+            entries[key] = factory(gameday_id)
+        return entries[key]
+
+    @staticmethod
+    def invalidate(gameday_id: int) -> None:
+        entries = _entries.get()
+        if not entries:
+            return
+        for key in [key for key in entries if key[1] == gameday_id]:
+            del entries[key]
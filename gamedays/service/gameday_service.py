@@ -2,7 +2,10 @@ import logging
 from abc import ABC, abstractmethod
 
 import pandas as pd
-from django.utils.html import format_html
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.functional import cached_property
+from django.utils.html import escape, format_html
 
 from gamedays.constants import LEAGUE_GAMEDAY_GAME_DETAIL
 from gamedays.service.placeholder_service import GamedayPlaceholderService
@@ -42,7 +45,10 @@ from gamedays.service.gameday_settings import (
     WIN_POINTS,
     ID,
 )
+from gamedays.service.gameday_data_version import GamedayDataVersion
+from gamedays.service.gameday_registry import GamedayRegistry
 from gamedays.service.model_wrapper import GamedayModelWrapper
+from gamedays.service.table_renderer import TABLE_CLASSES, TableRenderer
 
 EMPTY_DATA = "[]"
 
@@ -69,6 +75,11 @@ SCHEDULE_TABLE_HEADERS = {
     STATUS: "Status",
     GAMEINFO_ID: "Rückblick",
 }
+# cells of these schedule columns are built with format_html
+SCHEDULE_HTML_COLUMNS = [
+    SCHEDULE_TABLE_HEADERS[OFFICIALS_NAME],
+    SCHEDULE_TABLE_HEADERS[GAMEINFO_ID],
+]
 
 
 class HtmlAndJsonRendering(ABC):
@@ -170,7 +181,7 @@ class EventsTableError:
 
     def to_html(self, **kwargs) -> str:
         """Return HTML representation (matches DataFrame.to_html() interface)"""
-        return self.error_message
+        return escape(self.error_message)
 
 
 class EmptyGamedayService:
@@ -216,7 +227,7 @@ class GamedayService:
             return EmptyGamedayService()
 
     def __init__(self, pk):
-        self.gmw = GamedayModelWrapper(pk)
+        self.gmw = GamedayRegistry.get(GamedayModelWrapper, pk)
         self.gameday_pk = pk
 
     def get_schedule(self):
@@ -225,7 +236,9 @@ class GamedayService:
             GAMEINFO_ID,
         ]
         schedule = schedule[columns]
-        schedule[OFFICIALS_NAME] = schedule[OFFICIALS_NAME].apply("<i>{}</i>".format)
+        schedule[OFFICIALS_NAME] = schedule[OFFICIALS_NAME].apply(
+            lambda name: format_html("<i>{}</i>", name)
+        )
         schedule[SCHEDULED] = pd.to_datetime(
             schedule[SCHEDULED], format="%H:%M:%S"
         ).dt.strftime("%H:%M")
@@ -343,6 +356,20 @@ class EmptyGamedayGameService:
 
 
 class GamedayGameService:
+    EVENTS_TABLE_CACHE_KEY = "game_events_table_{}"
+    # writes of other processes don't delete the rows, they are picked up after that time
+    EVENTS_TABLE_CACHE_TIMEOUT = GamedayDataVersion.TIMEOUT
+    MISC_EVENTS = [CLOCK, GAME_START, SECOND_HALF_START, OVERTIME, GAME_END]
+    TEAMLOG_FIELDS = [
+        "id",
+        "team__description",
+        "event",
+        "input",
+        "player",
+        "value",
+        "half",
+    ]
+
     @classmethod
     def create(cls, game_pk):
         try:
@@ -358,19 +385,6 @@ class GamedayGameService:
             .values("team__description", "team", "isHome")
         )
 
-        self.events = pd.DataFrame(
-            TeamLog.objects.filter(gameinfo=self.game.pk)
-            .exclude(isDeleted=True)
-            .order_by("created_time")
-            .values(*[x.name for x in TeamLog._meta.local_fields], "team__description")
-        )
-
-        self.events_ready = False
-
-        if len(self.events) > 0:
-            self.events_ready = True
-            self.events = self._prepare_team_logs()
-
         self.home_team_name = "Home Team"
         self.home_team_id = 0
         self.away_team_name = "Away Team"
@@ -378,7 +392,9 @@ class GamedayGameService:
 
         if len(self.gameresult) > 0:
 
-            placeholder_service = GamedayPlaceholderService(self.game.gameday_id)
+            placeholder_service = GamedayRegistry.get(
+                GamedayPlaceholderService, self.game.gameday_id
+            )
 
             home_rows = self.gameresult[self.gameresult['isHome'] == True]
             away_rows = self.gameresult[self.gameresult['isHome'] == False]
@@ -418,48 +434,55 @@ class GamedayGameService:
         self.score_output_columns = self._score_column_mapping.values()
         self.split_score_output_columns = self._split_score_column_mapping.values()
 
-    def _prepare_team_logs(self):
-        events = self.events
-
-        misc_events = [CLOCK, GAME_START, SECOND_HALF_START, OVERTIME, GAME_END]
-
-        # events.input = events.apply(lambda x: )
-        events.team = events.apply(
-            lambda x: None if x.event in misc_events else x.event, axis=1
+    @cached_property
+    def events(self) -> list[dict]:
+        return list(
+            TeamLog.objects.filter(gameinfo=self.game.pk)
+            .exclude(isDeleted=True)
+            .order_by("pk")
+            .values(*self.TEAMLOG_FIELDS)
         )
-        events.event = events.apply(self._format_event, axis=1)
 
-        events.player = events.player.apply(
-            lambda x: "" if pd.isna(x) else f"#{str(int(x))}"
-        )
-        # events.input = events.input.apply(lambda x: '' if pd.isna(x) else f": {x}")
-        events["is_scoring_play"] = events.value > 0
-        events["event_with_player"] = events.apply(
-            self._format_event_with_player, axis=1
-        )
-        return events
+    @property
+    def events_ready(self) -> bool:
+        return len(self.events) > 0
+
+    @classmethod
+    def invalidate_events_table(cls, game_id: int) -> None:
+        cache_key = cls.EVENTS_TABLE_CACHE_KEY.format(game_id)
+        cache.delete(cache_key)
+        # a reader may have cached the old entries before the write was committed
+        transaction.on_commit(lambda: cache.delete(cache_key))
 
     @staticmethod
-    def _format_event_with_player(row: pd.Series) -> str:
-        if row.event in ["1-Extra-Punkt", "2-Extra-Punkte"] and row.value == 0:
-            return f"<s>{row.event}</s>"
+    def _format_event_with_player(row: dict) -> str:
+        if row["event"] in ["1-Extra-Punkt", "2-Extra-Punkte"] and row["value"] == 0:
+            return format_html("<s>{}</s>", row["event"])
 
-        row_input = "" if pd.isna(row.input) else row.input
+        row_input = "" if pd.isna(row["input"]) else row["input"]
 
-        if row.event == TIMEOUT:
-            return f"{row.event.strip()} @ {GamedayGameService._format_time_string(row.input)}"
+        if row["event"] == TIMEOUT:
+            return format_html(
+                "{} @ {}",
+                row["event"].strip(),
+                GamedayGameService._format_time_string(row["input"]),
+            )
 
-        return f"{row.event} {row.player} {row_input}"
+        return format_html("{} {} {}", row["event"], row["player"], row_input)
 
     @staticmethod
-    def _format_event(row: pd.Series) -> str:
-        if row.event == CLOCK:
-            return f"{row.event}: {GamedayGameService._format_time_string(row.input)}"
+    def _format_event(row: dict) -> str:
+        if row["event"] == CLOCK:
+            return format_html(
+                "{}: {}",
+                row["event"],
+                GamedayGameService._format_time_string(row["input"]),
+            )
 
-        if row.event in [GAME_START, SECOND_HALF_START, OVERTIME, GAME_END]:
-            return f"<b>{row.event}</b>"
+        if row["event"] in [GAME_START, SECOND_HALF_START, OVERTIME, GAME_END]:
+            return format_html("<b>{}</b>", row["event"])
 
-        return row.event
+        return escape(row["event"])
 
     @staticmethod
     def _format_time_string(time_string: str) -> str:
@@ -473,7 +496,7 @@ class GamedayGameService:
         if not self.events_ready:
             return EmptySplitScoreTable, True
 
-        events = self.events.copy()
+        events = pd.DataFrame(self.events)
         split_score_repaired = False
 
         ct = pd.crosstab(
@@ -493,6 +516,31 @@ class GamedayGameService:
             split_score_repaired,
         )
 
+    def get_recap(self) -> dict:
+        """Teams, score and events tables of the game as shown on the game detail page."""
+        render_configs = {"justify": "center", "table_id": "team_log_events"}
+        split_score_table, split_score_repaired = self.get_split_score_table()
+        split_score_table_html = TableRenderer.render(
+            split_score_table,
+            classes=TABLE_CLASSES + ["game-split-score-table"],
+            **render_configs,
+        )
+        if split_score_repaired:
+            split_score_table_html = f"""{split_score_table_html}</ br>
+<small>Die Aufteilung der Punkte je Halbzeit kann eventuell inkorrekt sein.</small>"""
+        return {
+            "away_team": self.away_team_name,
+            "home_team": self.home_team_name,
+            # the event cells are escaped by _format_event and _format_event_with_player
+            "events_table": TableRenderer.render(
+                self.get_events_table(),
+                html_columns=self.score_output_columns,
+                classes=TABLE_CLASSES + ["game-log-table"],
+                **render_configs,
+            ),
+            "split_score_table": split_score_table_html,
+        }
+
     def get_staff_game_end_notes(self):
         return (
             GameSetup.objects.filter(gameinfo=self.game.pk)
@@ -518,21 +566,11 @@ class GamedayGameService:
 
         return split_score_ct
 
-    def _validate_events_data(self, team_events) -> tuple[bool, list]:
-        """
-        Validate that event data contains expected teams.
+    def _validate_events_data(self, teams_in_events: list) -> bool:
+        """Validate that event data contains the teams of the game."""
+        if not teams_in_events:
+            return False
 
-        Returns:
-            (is_valid, teams_in_events) - tuple of (bool, list of team names)
-        """
-        if team_events.empty:
-            return False, []
-
-        teams_in_events = [
-            t
-            for t in team_events["team__description"].unique().tolist()
-            if t is not None and pd.notna(t)
-        ]
         expected_teams = {self.home_team_name, self.away_team_name}
         actual_teams = set(teams_in_events)
 
@@ -542,89 +580,89 @@ class GamedayGameService:
                 f"Events data mismatch for game {self.game.pk}: "
                 f"Expected {expected_teams}, got {actual_teams}"
             )
-            return False, teams_in_events
+            return False
 
-        return True, teams_in_events
+        return True
 
     def get_events_table(self):
-        if not self.events_ready:
-            return EmptyEventsTable
-        events = self.events.copy()
-
-        static_events = events[pd.isna(events.team)].copy()
-        team_events = events[~pd.isna(events.team)].copy()
-
-        # NEW: Validate data before processing
-        is_valid, teams_in_events = self._validate_events_data(team_events)
-        if not is_valid:
-            logger.error(
-                f"Cannot generate events table for game {self.game.pk} - "
-                f"event teams {teams_in_events} don't match expected "
-                f"{self.home_team_name} vs {self.away_team_name}. "
-                f"Game ID: {self.game.pk}, Gameday ID: {self.game.gameday.pk}"
+        rows = self._get_cached_events_rows()
+        if rows is None:
+            if not self.events_ready:
+                return EmptyEventsTable
+            rows, teams_in_events = self._build_events_rows()
+            if not self._validate_events_data(teams_in_events):
+                logger.error(
+                    f"Cannot generate events table for game {self.game.pk} - "
+                    f"event teams {teams_in_events} don't match expected "
+                    f"{self.home_team_name} vs {self.away_team_name}. "
+                    f"Game ID: {self.game.pk}, Gameday ID: {self.game.gameday_id}"
+                )
+                return EventsTableError(
+                    home_team=self.home_team_name,
+                    away_team=self.away_team_name,
+                    events_teams=teams_in_events,
+                    game_id=self.game.pk,
+                )
+            self._cache_events_rows(rows)
+        return pd.DataFrame(rows, columns=list(self.score_output_columns))
+
+    def _build_events_rows(self) -> tuple[list, list]:
+        """
+        Builds the rows of the events table (home event, score or game event, away
+        event) in one pass over the entries, keeping the running score of the teams.
+        """
+        scores = {self.home_team_name: 0, self.away_team_name: 0}
+        teams_in_events = {}
+        rows = []
+        previous_score = None
+        for teamlog in self.events:
+            if teamlog["event"] in self.MISC_EVENTS:
+                rows.append(("", self._format_event(teamlog), ""))
+                continue
+            team = teamlog["team__description"]
+            if team is None:
+                # without a team the entry belongs to neither side
+                continue
+            teams_in_events[team] = None
+            scores[team] = scores.get(team, 0) + teamlog["value"]
+            event = self._format_event_with_player(
+                {
+                    **teamlog,
+                    "event": self._format_event(teamlog),
+                    "player": (
+                        "" if teamlog["player"] is None else f"#{teamlog['player']}"
+                    ),
+                }
             )
-            return EventsTableError(
-                home_team=self.home_team_name,
-                away_team=self.away_team_name,
-                events_teams=teams_in_events,
-                game_id=self.game.pk,
+            # the score is only shown when it changed
+            score = f"{scores[self.home_team_name]}:{scores[self.away_team_name]}"
+            rows.append(
+                (
+                    event if team == self.home_team_name else "",
+                    score if score != previous_score else "",
+                    event if team == self.away_team_name else "",
+                )
             )
-
-        event_ct = pd.crosstab(
-            index=team_events.id,
-            columns=team_events.team__description,
-            values=team_events.event_with_player,
-            aggfunc="first",
-        ).fillna("")
-
-        event_ct = event_ct.merge(
-            right=team_events[["id", "created_time", "player"]],
-            left_index=True,
-            right_on="id",
-        )
-
-        scores_ct = pd.crosstab(
-            team_events.id,
-            team_events.team__description,
-            values=team_events.value,
-            aggfunc="sum",
-        )
-        scores_ct = scores_ct.fillna(0).astype(int).cumsum().ffill()
-        scores_ct["score"] = scores_ct.apply(
-            lambda x: f"{x[self.home_team_name]}:{x[self.away_team_name]}", axis=1
-        )
-        scores_ct["previous_score"] = scores_ct.score != scores_ct.score.shift(1)
-        scores_ct.score = scores_ct.apply(
-            lambda x: x.score if x.previous_score else "", axis=1
-        )
-
-        event_ct = event_ct.merge(
-            right=scores_ct[["score"]],
-            left_on="id",
-            right_index=True,
-            suffixes=("", ""),
-        )
-
-        event_ct = (
-            pd.concat(
-                objs=[
-                    event_ct,
-                    static_events[["id", "created_time", "event"]].rename(
-                        columns={"event": "input"}
-                    ),
-                ]
+            previous_score = score
+        return rows, list(teams_in_events)
+
+    def _get_cached_events_rows(self) -> list | None:
+        if self.game.status != FINISHED:
+            return None
+        cached = cache.get(self.EVENTS_TABLE_CACHE_KEY.format(self.game.pk))
+        # the rows are only valid for the teams they were built for
+        if cached is None or cached["teams"] != self._get_teams():
+            return None
+        return cached["rows"]
+
+    def _cache_events_rows(self, rows: list) -> None:
+        # finished games hardly change, the rows are kept until an entry is written
+        if self.game.status == FINISHED:
+            cache.set(
+                self.EVENTS_TABLE_CACHE_KEY.format(self.game.pk),
+                {"teams": self._get_teams(), "rows": rows},
+                timeout=self.EVENTS_TABLE_CACHE_TIMEOUT,
             )
-            .fillna("")
-            .sort_values("id")
-        )
 
-        event_ct.input = event_ct.apply(
-            lambda x: x.input if len(x.input) > 0 else x.score, axis=1
-        )
-        event_ct.created_time = event_ct.created_time.apply(
-            lambda x: x.strftime("%H:%M")
-        )
-
-        return event_ct.rename(columns=self._score_column_mapping)[
-            self.score_output_columns
-        ]
+    def _get_teams(self) -> tuple:
+        return self.home_team_name, self.away_team_name
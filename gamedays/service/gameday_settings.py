@@ -32,6 +32,7 @@ GROUP1 = "Gruppe 1"
 FINISHED = "beendet"
 GAME_FINISHED = "gameFinished"
 IS_HOME = "isHome"
+VERSION = "version"
 
 GAMEINFO_ID = "gameinfo"
 ID_Y = "id_y"
@@ -0,0 +1,105 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from gamedays.models import Gameday, GamedaySnapshot, Gameinfo, Gameresult, TeamLog
+from gamedays.service.gameday_data_version import GamedayDataVersion
+from gamedays.service.gameday_detail_service import GamedayDetailService
+from gamedays.service.gameday_service import GamedayGameService
+from gamedays.service.model_helper import GameinfoHelper
+
+
+class GamedaySnapshotService:
+    """
+    Frozen detail page tables and game recaps of a completed gameday.
+
+    Completed gamedays hardly change, but are visited for a long time. Their computed
+    tables and the recaps of all games are stored as one GamedaySnapshot document,
+    which the pages read instead of recomputing them. A committed write to a game of
+    the gameday deletes the snapshot (see delete_on_commit) and the next visit stores
+    a new one. Gamedays which are not completed are computed as before.
+    """
+
+    TABLES = "tables"
+    GAME_RECAP = "game_{}"
+
+    def __init__(self, gameday: Gameday):
+        self.gameday = gameday
+
+    def get_tables(self) -> dict:
+        tables = self._get(self.TABLES)
+        if tables is None:
+            return GamedayDetailService(self.gameday.pk).get_tables()
+        return tables
+
+    def get_game_recap(self, gameinfo_id: int) -> dict:
+        recap = self._get(self.GAME_RECAP.format(gameinfo_id))
+        if recap is None:
+            return GamedayGameService(gameinfo_id).get_recap()
+        return recap
+
+    def build(self) -> dict | None:
+        """Stores the snapshot of a completed gameday and returns its document."""
+        if self.gameday.status != Gameday.STATUS_COMPLETED:
+            return None
+        # like the cached tables, the snapshot is only stored if no write was
+        # committed while it was computed
+        version = GamedayDataVersion.get(self.gameday.pk)
+        document = {self.TABLES: GamedayDetailService(self.gameday.pk).compute_tables()}
+        for gameinfo_id in Gameinfo.objects.filter(gameday=self.gameday).values_list(
+            "pk", flat=True
+        ):
+            document[self.GAME_RECAP.format(gameinfo_id)] = GamedayGameService(
+                gameinfo_id
+            ).get_recap()
+        if GamedayDataVersion.get(self.gameday.pk) == version:
+            GamedaySnapshot.objects.update_or_create(
+                gameday=self.gameday, defaults={"document": document}
+            )
+        else:
+            # the snapshot stored before the gameday was reopened is outdated
+            GamedaySnapshot.objects.filter(gameday=self.gameday).delete()
+        return document
+
+    @classmethod
+    def delete_on_commit(cls, gameday_id) -> None:
+        """Deletes the snapshot of a completed gameday after the write is committed."""
+        if gameday_id is None:
+            return
+        transaction.on_commit(lambda: cls._delete(gameday_id))
+
+    @staticmethod
+    def _delete(gameday_id) -> None:
+        # a reopened gameday keeps its snapshot until it is completed again
+        GamedaySnapshot.objects.filter(
+            gameday_id=gameday_id, gameday__status=Gameday.STATUS_COMPLETED
+        ).delete()
+
+    def _get(self, key: str):
+        if self.gameday.status != Gameday.STATUS_COMPLETED:
+            return None
+        # only the requested part of the document is loaded
+        snapshot = (
+            GamedaySnapshot.objects.filter(gameday=self.gameday)
+            .values_list("pk", f"document__{key}")
+            .first()
+        )
+        if snapshot is None:
+            return self.build().get(key)
+        return snapshot[1]
+
+
+@receiver(post_save, sender=Gameinfo)
+@receiver(post_delete, sender=Gameinfo)
+def delete_gameday_snapshot_for_gameinfo(sender, instance: Gameinfo, **kwargs):
+    GamedaySnapshotService.delete_on_commit(instance.gameday_id)
+
+
+@receiver(post_save, sender=Gameresult)
+@receiver(post_delete, sender=Gameresult)
+@receiver(post_save, sender=TeamLog)
+@receiver(post_delete, sender=TeamLog)
+def delete_gameday_snapshot_for_game(sender, instance, **kwargs):
+    GamedaySnapshotService.delete_on_commit(
+        GameinfoHelper.get_gameday_id_for(instance)
+    )
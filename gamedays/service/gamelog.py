@@ -1,8 +1,13 @@
 import json
 
-from django.db.models import QuerySet
-
-from gamedays.models import Gameresult, TeamLog
+from django.db import transaction
+from django.db.models import QuerySet, Max
+
+from gamedays.models import Gameinfo, Gameresult, TeamLog
+from gamedays.service.game_replay import GameReplay
+from gamedays.service.gameday_data_version import GamedayDataVersion
+from gamedays.service.gameday_service import GamedayGameService
+from gamedays.service.gameday_snapshot_service import GamedaySnapshotService
 from gamedays.service.utils import AsJsonEncoder
 
 EXCLUDED_EVENTS = ["Strafe", "Spielzeit", "Auszeit", "First Down"]
@@ -16,33 +21,50 @@ class GameLogCreator(object):
         self.event = event
         self.user = user
 
+    @transaction.atomic
     def create(self):
         sequence = self._getSequence()
-        for entry in self.event:
-            teamlog = TeamLog()
-            teamlog.gameinfo = self.gameinfo
-            teamlog.team = self.team
-            teamlog.sequence = (
-                sequence if entry.get("name") not in EXCLUDED_EVENTS else 0
-            )
-            teamlog.cop = entry.get("name") in ["Turnover", "Interception"]
-            teamlog.event = entry.get("name")
-            teamlog.input = entry.get("input")
-            teamlog.player = entry.get("player") if entry.get("player") != "" else None
-            teamlog.value = (
-                self._getValue(entry.get("name")) if teamlog.player is not None else 0
-            )
-            teamlog.half = self.half
-            teamlog.author = self.user
-            teamlog.save()
-        return GameLog(self.gameinfo)
+        teamlogs = TeamLog.objects.bulk_create(
+            [self._create_teamlog(entry, sequence) for entry in self.event]
+        )
+        # bulk_create sends no post_save signals
+        GamedayDataVersion.bump_on_commit(self.gameinfo.gameday_id)
+        GamedaySnapshotService.delete_on_commit(self.gameinfo.gameday_id)
+        GamedayGameService.invalidate_events_table(self.gameinfo.pk)
+        gamelog = GameLog(self.gameinfo)
+        gamelog.created_sequence = sequence
+        gamelog.track_score_changes(teamlogs)
+        return gamelog
+
+    def _create_teamlog(self, entry, sequence) -> TeamLog:
+        teamlog = TeamLog()
+        teamlog.gameinfo = self.gameinfo
+        teamlog.team = self.team
+        teamlog.sequence = sequence if entry.get("name") not in EXCLUDED_EVENTS else 0
+        teamlog.cop = entry.get("name") in ["Turnover", "Interception"]
+        teamlog.event = entry.get("name")
+        teamlog.input = entry.get("input")
+        teamlog.player = entry.get("player") if entry.get("player") != "" else None
+        teamlog.value = (
+            self._getValue(entry.get("name")) if teamlog.player is not None else 0
+        )
+        teamlog.half = self.half
+        teamlog.author = self.user
+        return teamlog
 
     def _getSequence(self):
-        entryWithLatestSequence: TeamLog = (
-            TeamLog.objects.filter(gameinfo=self.gameinfo).order_by("-sequence").first()
+        # the row lock on the game serializes concurrent scorecards of the same game
+        # until the entries are inserted, so every play gets its own sequence
+        list(
+            Gameinfo.objects.select_for_update()
+            .filter(pk=self.gameinfo.pk)
+            .values_list("pk", flat=True)
         )
-        if entryWithLatestSequence:
-            return entryWithLatestSequence.sequence + 1
+        latest_sequence = TeamLog.objects.filter(gameinfo=self.gameinfo).aggregate(
+            latest_sequence=Max("sequence")
+        )["latest_sequence"]
+        if latest_sequence is not None:
+            return latest_sequence + 1
         return 1
 
     def _getValue(self, name):
@@ -63,45 +85,97 @@ class GameLogCreator(object):
 
 
 class GameLog(object):
-    home_firsthalf_entries: QuerySet[TeamLog] = None
-    away_firsthalf_entries: QuerySet[TeamLog] = None
-    home_secondhalf_entries: QuerySet[TeamLog] = None
-    away_secondhalf_entries: QuerySet[TeamLog] = None
+    """
+    Gamelog of a game, built from all TeamLog entries which are loaded with one query
+    and bucketed by team and half in a single pass.
+    """
+
+    HALVES = (1, 2)
 
     def __init__(self, gameinfo):
         self.gameinfo = gameinfo
-        home = Gameresult.objects.get(gameinfo=self.gameinfo, isHome=True).team.name
-        away = Gameresult.objects.get(gameinfo=self.gameinfo, isHome=False).team.name
-        self.gamelog = GameLogObject(gameinfo.pk, home, away)
+        teams = {
+            gameresult.isHome: gameresult.team
+            for gameresult in Gameresult.objects.filter(
+                gameinfo=self.gameinfo
+            ).select_related("team")
+        }
+        if True not in teams or False not in teams:
+            raise Gameresult.DoesNotExist(
+                f"Home or away team missing for game {gameinfo.pk}"
+            )
+        self.home_id = teams[True].pk
+        self.away_id = teams[False].pk
+        self.gamelog = GameLogObject(gameinfo.pk, teams[True].name, teams[False].name)
+        self._entries = None
+        self._scores = None
+        # points per (is_home, half) added since the gamelog was loaded,
+        # None if the score has to be recomputed from all entries
+        self.score_changes: dict | None = None
+        # sequence of the play added by GameLogCreator
+        self.created_sequence: int | None = None
+
+    def track_score_changes(self, teamlogs, reverse=False) -> None:
+        if self.score_changes is None:
+            self.score_changes = {}
+        is_home_by_team = {self.home_id: True, self.away_id: False}
+        for teamlog in teamlogs:
+            if (
+                teamlog.team_id not in is_home_by_team
+                or teamlog.half not in self.HALVES
+                or teamlog.event in EXCLUDED_EVENTS
+                or teamlog.isDeleted
+            ):
+                continue
+            key = (is_home_by_team[teamlog.team_id], teamlog.half)
+            points = -teamlog.value if reverse else teamlog.value
+            self.score_changes[key] = self.score_changes.get(key, 0) + points
+
+    def _load_entries(self):
+        if self._entries is not None:
+            return
+        self._entries = {
+            (team_id, half): []
+            for team_id in (self.home_id, self.away_id)
+            for half in self.HALVES
+        }
+        self._scores = dict.fromkeys(self._entries, 0)
+        entry: TeamLog
+        for entry in (
+            TeamLog.objects.filter(
+                gameinfo=self.gameinfo,
+                team__in=[self.home_id, self.away_id],
+                half__in=self.HALVES,
+            )
+            .exclude(event__in=EXCLUDED_EVENTS)
+            .order_by("-sequence")
+        ):
+            key = (entry.team_id, entry.half)
+            self._entries[key].append(entry)
+            if not entry.isDeleted:
+                self._scores[key] += entry.value
+
+    def _get_entries(self, team_id, half) -> list[TeamLog]:
+        self._load_entries()
+        return self._entries[(team_id, half)]
+
+    def _get_score(self, team_id, half) -> int:
+        self._load_entries()
+        return self._scores[(team_id, half)]
 
     def as_json(self):
         self.gamelog.is_first_half = self.is_firsthalf()
         self.gamelog.home.score = self.get_home_score()
         self.gamelog.away.score = self.get_away_score()
-        self.gamelog.home.firsthalf.score = self._calc_score(
-            self.get_entries_home_firsthalf()
-        )
-        self.gamelog.home.firsthalf.entries = self.create_entries_for_half(
-            self.get_entries_home_firsthalf()
-        )
-        self.gamelog.away.firsthalf.score = self._calc_score(
-            self.get_entries_away_firsthalf()
-        )
-        self.gamelog.away.firsthalf.entries = self.create_entries_for_half(
-            self.get_entries_away_firsthalf()
-        )
-        self.gamelog.home.secondhalf.score = self._calc_score(
-            self.get_entries_home_secondhalf()
-        )
-        self.gamelog.home.secondhalf.entries = self.create_entries_for_half(
-            self.get_entries_home_secondhalf()
-        )
-        self.gamelog.away.secondhalf.score = self._calc_score(
-            self.get_entries_away_secondhalf()
-        )
-        self.gamelog.away.secondhalf.entries = self.create_entries_for_half(
-            self.get_entries_away_secondhalf()
-        )
+        for team, team_id in (
+            (self.gamelog.home, self.home_id),
+            (self.gamelog.away, self.away_id),
+        ):
+            for half, half_json in ((1, team.firsthalf), (2, team.secondhalf)):
+                half_json.score = self._get_score(team_id, half)
+                half_json.entries = self.create_entries_for_half(
+                    self._get_entries(team_id, half)
+                )
         return json.dumps(self.gamelog, cls=(AsJsonEncoder))
 
     def get_home_team(self):
@@ -111,43 +185,16 @@ class GameLog(object):
         return self.gamelog.away.name
 
     def get_entries_home_firsthalf(self):
-        if self.home_firsthalf_entries:
-            return self.home_firsthalf_entries
-        self.home_firsthalf_entries = self._get_entries_for_team_and_half(
-            team=self.gamelog.home.name, half=1
-        )
-        return self.home_firsthalf_entries
+        return self._get_entries(self.home_id, 1)
 
     def get_entries_away_firsthalf(self):
-        if self.away_firsthalf_entries:
-            return self.away_firsthalf_entries
-        self.away_firsthalf_entries = self._get_entries_for_team_and_half(
-            team=self.gamelog.away.name, half=1
-        )
-        return self.away_firsthalf_entries
+        return self._get_entries(self.away_id, 1)
 
     def get_entries_home_secondhalf(self):
-        if self.home_secondhalf_entries:
-            return self.home_secondhalf_entries
-        self.home_secondhalf_entries = self._get_entries_for_team_and_half(
-            team=self.gamelog.home.name, half=2
-        )
-        return self.home_secondhalf_entries
+        return self._get_entries(self.home_id, 2)
 
     def get_entries_away_secondhalf(self):
-        if self.away_secondhalf_entries:
-            return self.away_secondhalf_entries
-        self.away_secondhalf_entries = self._get_entries_for_team_and_half(
-            team=self.gamelog.away.name, half=2
-        )
-        return self.away_secondhalf_entries
-
-    def _get_entries_for_team_and_half(self, team, half):
-        return (
-            TeamLog.objects.filter(gameinfo=self.gameinfo, team__name=team, half=half)
-            .exclude(event__in=EXCLUDED_EVENTS)
-            .order_by("-sequence")
-        )
+        return self._get_entries(self.away_id, 2)
 
     def get_home_score(self):
         return self.get_home_firsthalf_score() + self.get_home_secondhalf_score()
@@ -155,14 +202,6 @@ class GameLog(object):
     def get_away_score(self):
         return self.get_away_firsthalf_score() + self.get_away_secondhalf_score()
 
-    def _calc_score(self, half_entries):
-        sum = 0
-        entry: TeamLog
-        for entry in half_entries:
-            if not entry.isDeleted:
-                sum = sum + entry.value
-        return sum
-
     def create_entries_for_half(self, half_entries):
         result = dict()
         entry: TeamLog
@@ -196,21 +235,31 @@ class GameLog(object):
         return self.gameinfo.gameHalftime is None
 
     def get_home_firsthalf_score(self):
-        return self._calc_score(self.get_entries_home_firsthalf())
+        return self._get_score(self.home_id, 1)
 
     def get_home_secondhalf_score(self):
-        return self._calc_score(self.get_entries_home_secondhalf())
+        return self._get_score(self.home_id, 2)
 
     def get_away_firsthalf_score(self):
-        return self._calc_score(self.get_entries_away_firsthalf())
+        return self._get_score(self.away_id, 1)
 
     def get_away_secondhalf_score(self):
-        return self._calc_score(self.get_entries_away_secondhalf())
+        return self._get_score(self.away_id, 2)
 
+    @transaction.atomic
     def mark_entries_as_deleted(self, sequence):
-        TeamLog.objects.filter(gameinfo=self.gameinfo, sequence=sequence).update(
+        teamlogs = list(
+            TeamLog.objects.select_for_update().filter(
+                gameinfo=self.gameinfo, sequence=sequence, isDeleted=False
+            )
+        )
+        TeamLog.objects.filter(pk__in=[teamlog.pk for teamlog in teamlogs]).update(
             isDeleted=True
         )
+        self.track_score_changes(teamlogs, reverse=True)
+        GameReplay.invalidate_snapshots(self.gameinfo.pk, sequence)
+        GamedayGameService.invalidate_events_table(self.gameinfo.pk)
+        self._entries = None
 
 
 class Half(object):
@@ -8,7 +8,7 @@ from django.db.models import (
 )
 from django.db.models.functions import Coalesce
 
-from gamedays.models import Gameresult
+from gamedays.models import Gameinfo, Gameresult
 
 
 class GameresultHelper:
@@ -52,5 +52,19 @@ class GameresultHelper:
         )
 
 
+class GameinfoHelper:
+
+    @staticmethod
+    def get_gameday_id_for(instance) -> int | None:
+        """Returns the gameday of a Gameresult or TeamLog without loading its Gameinfo."""
+        if type(instance).gameinfo.is_cached(instance):
+            return instance.gameinfo.gameday_id
+        return (
+            Gameinfo.objects.filter(pk=instance.gameinfo_id)
+            .values_list("gameday_id", flat=True)
+            .first()
+        )
+
+
 class TeamLogHelper:
     EXCLUDED_EVENTS = ["Strafe", "Spielzeit", "Auszeit", "First Down"]
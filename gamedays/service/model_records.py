@@ -0,0 +1,233 @@
+from gamedays.models import Gameinfo, Gameresult
+from gamedays.service.gameday_registry import GamedayRegistry
+from gamedays.service.gameday_settings import FINISHED, MAIN_ROUND, QUALIIFY_ROUND
+from gamedays.service.model_wrapper import GamedayModelWrapper
+from gamedays.service.placeholder_service import GamedayPlaceholderService
+
+
+class GameRecord:
+    __slots__ = ("id", "stage", "standing", "status")
+
+    def __init__(self, id, stage, standing, status):
+        self.id = id
+        self.stage = stage
+        self.standing = standing
+        self.status = status
+
+
+class ResultRecord:
+    """One team of a game, with the same derived values as in GamedayModelWrapper."""
+
+    __slots__ = (
+        "gameinfo_id",
+        "stage",
+        "standing",
+        "team",
+        "team_id",
+        "points",
+        "pf",
+        "pa",
+        "diff",
+    )
+
+    def __init__(self, game: GameRecord, team, team_id, fh, sh, pa):
+        self.gameinfo_id = game.id
+        self.stage = game.stage
+        self.standing = game.standing
+        self.team = team
+        self.team_id = team_id
+        # unknown values stay None, like NA in the nullable pandas columns
+        self.pf = None if fh is None or sh is None else fh + sh
+        self.pa = pa
+        self.diff = None if self.pf is None or pa is None else self.pf - pa
+        self.points = 0
+        if game.status == FINISHED:
+            points_for, points_against = self.pf or 0, pa or 0
+            if points_for == points_against:
+                self.points = 1
+            elif points_for > points_against:
+                self.points = 2
+
+
+class StandingRecord:
+    __slots__ = ("standing", "team", "team_id", "points", "pf", "pa", "diff")
+
+    def __init__(self, standing, team):
+        self.standing = standing
+        self.team = team
+        self.team_id = None
+        self.points = 0
+        self.pf = 0
+        self.pa = 0
+        self.diff = 0
+
+    def add(self, result: ResultRecord):
+        # like the pandas sums, unknown values are skipped
+        if self.team_id is None:
+            self.team_id = result.team_id
+        self.points += result.points
+        self.pf += result.pf or 0
+        self.pa += result.pa or 0
+        self.diff += result.diff or 0
+
+
+class GamedayRecords:
+    """
+    Backend of the GamedayModelWrapper API built on plain records instead of DataFrames.
+
+    A gameday has a few dozen results, for which building the merged DataFrame costs
+    more than the lookups themselves. The lookups used to resolve the schedule
+    (is_finished, get_team_by, get_teams_by, get_team_by_qualify_for,
+    get_team_aggregate_by) are answered from the records with the same ordering as the
+    pandas backend. Tables and statistics are delegated to a GamedayModelWrapper, which
+    is only built when one of them is requested.
+    """
+
+    def __init__(self, pk):
+        self.gameday_id = pk
+        self._games = [
+            GameRecord(*values)
+            for values in Gameinfo.objects.filter(gameday_id=pk).values_list(
+                "id", "stage", "standing", "status"
+            )
+        ]
+        if not self._games:
+            raise Gameinfo.DoesNotExist
+        self._results = self._load_results()
+
+    def _load_results(self) -> list[ResultRecord]:
+        results_by_game = {}
+        for gameinfo_id, *values in (
+            Gameresult.objects.filter(gameinfo_id__in=[game.id for game in self._games])
+            .order_by("-isHome")
+            .values_list(
+                "gameinfo_id",
+                "isHome",
+                "team__description",
+                "team_id",
+                "fh",
+                "sh",
+                "pa",
+            )
+        ):
+            results_by_game.setdefault(gameinfo_id, []).append(values)
+        placeholders = None
+        results = []
+        # same order as the merge in GamedayModelWrapper: games in order, home first
+        for game in self._games:
+            for is_home, team, team_id, fh, sh, pa in results_by_game.get(game.id, []):
+                if team is None:
+                    if placeholders is None:
+                        placeholders = GamedayRegistry.get(
+                            GamedayPlaceholderService, self.gameday_id
+                        ).resolve_all()
+                    team = placeholders.get((game.id, is_home), "TBD")
+                results.append(ResultRecord(game, team, team_id, fh, sh, pa))
+        return results
+
+    def __getattr__(self, name):
+        # tables and statistics are only available with the pandas backend
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(GamedayRegistry.get(GamedayModelWrapper, self.gameday_id), name)
+
+    def has_finalround(self):
+        return any(game.stage == QUALIIFY_ROUND for game in self._games)
+
+    def is_finished(self, check):
+        games = [game for game in self._games if game.stage == check]
+        if not games:
+            games = [game for game in self._games if game.standing == check]
+        return all(game.status == FINISHED for game in games)
+
+    def get_qualify_team_by(self, place, standing):
+        table = [record for record in self._get_table() if record.standing == standing]
+        return table[place - 1].team
+
+    def get_team_by_points(self, place, standing, points):
+        return self._get_teams_by(standing, points)[place - 1].team
+
+    def get_team_by(self, place, standing, points=None):
+        if points is None:
+            return self.get_qualify_team_by(place, standing)
+        return self.get_team_by_points(place, standing, points)
+
+    def get_team_by_qualify_for(self, place, index):
+        nth_of_standings = self._sort_by_score(
+            self._nth_per_standing(self._get_table(), place - 1)
+        )
+        return nth_of_standings[index].team
+
+    def get_team_aggregate_by(self, aggregate_standings, aggregate_place, place):
+        table = self._sort_by_standing(
+            self._sort_by_score(
+                self._aggregate(
+                    result
+                    for result in self._results
+                    if result.standing in aggregate_standings
+                )
+            )
+        )
+        nth_of_standings = self._sort_by_score(
+            self._nth_per_standing(table, aggregate_place - 1)
+        )
+        return nth_of_standings[place - 1].team
+
+    def get_teams_by(self, standing, points):
+        return [result.team for result in self._get_teams_by(standing, points)]
+
+    def _get_teams_by(self, standing, points) -> list[ResultRecord]:
+        return [
+            result
+            for result in self._results
+            if result.standing == standing and result.points == points
+        ]
+
+    def _get_table(self) -> list[StandingRecord]:
+        return self._sort_by_standing(
+            self._sort_by_score(
+                self._aggregate(
+                    result
+                    for result in self._results
+                    if result.stage in (QUALIIFY_ROUND, MAIN_ROUND)
+                )
+            )
+        )
+
+    @staticmethod
+    def _aggregate(results) -> list[StandingRecord]:
+        standings = {}
+        for result in results:
+            if result.team is None:
+                continue
+            key = (result.standing, result.team)
+            if key not in standings:
+                standings[key] = StandingRecord(result.standing, result.team)
+            standings[key].add(result)
+        # groups are sorted by their keys, like the pandas groupby
+        return [standings[key] for key in sorted(standings)]
+
+    @staticmethod
+    def _sort_by_score(records: list) -> list:
+        # sorting with reverse=True is stable, ties keep their order like in pandas
+        return sorted(
+            records,
+            key=lambda record: (record.points, record.diff, record.pf, record.pa),
+            reverse=True,
+        )
+
+    @staticmethod
+    def _sort_by_standing(records: list) -> list:
+        return sorted(records, key=lambda record: record.standing)
+
+    @staticmethod
+    def _nth_per_standing(records: list, n: int) -> list:
+        standings = {}
+        for record in records:
+            standings.setdefault(record.standing, []).append(record)
+        nth_records = {
+            id(group[n])
+            for group in standings.values()
+            if -len(group) <= n < len(group)
+        }
+        return [record for record in records if id(record) in nth_records]
@@ -3,7 +3,7 @@ import pandas as pd
 from django.apps import apps
 from pandas import DataFrame
 
-from gamedays.models import Gameinfo, Gameresult, TeamLog
+from gamedays.models import Gameinfo, Gameresult
 from gamedays.service.gameday_settings import (
     STANDING,
     TEAM_DESCRIPTION,
@@ -33,8 +33,11 @@ from gamedays.service.gameday_settings import (
     IS_HOME,
     MAIN_ROUND,
     TEAM_ID,
+    VERSION,
 )
+from gamedays.service.gameday_registry import GamedayRegistry
 from gamedays.service.placeholder_service import GamedayPlaceholderService
+from gamedays.service.player_statistics import GamedayPlayerStatistics
 from league_table.models import LeagueSeasonConfig, LeagueRuleset
 from league_table.service.datatypes import LeagueConfigRuleset
 from league_table.service.ranking.engine import (
@@ -73,10 +76,11 @@ class GamedayModelWrapper:
         if not gameinfo.exists():
             raise Gameinfo.DoesNotExist
         self.gameday = gameinfo.first().gameday
+        self._player_statistics = None
         self._gameinfo: DataFrame = pd.DataFrame(gameinfo.values(
                 # select the fields which should be in the dataframe
                 *(
-                    [f.name for f in Gameinfo._meta.local_fields]
+                    [f.name for f in Gameinfo._meta.local_fields if f.name != VERSION]
                     + ["officials__name"]
                     + additional_columns
                 )
@@ -87,7 +91,7 @@ class GamedayModelWrapper:
 
         gameresult = pd.DataFrame(
             Gameresult.objects.filter(gameinfo_id__in=self._gameinfo['id']).order_by('-' + IS_HOME).values(
-                *([f.name for f in Gameresult._meta.local_fields] + [TEAM_DESCRIPTION, TEAM_ID])))
+                *([f.name for f in Gameresult._meta.local_fields if f.name != VERSION] + [TEAM_DESCRIPTION, TEAM_ID])))
         if gameresult.empty:
             self._games_with_result: DataFrame = pd.DataFrame()
             return
@@ -119,20 +123,19 @@ class GamedayModelWrapper:
         # Only proceed if there are missing team names
         if self._games_with_result[TEAM_DESCRIPTION].isna().any():
 
-            placeholder_service = GamedayPlaceholderService(
-                self._gameinfo["gameday"].iloc[0]
+            placeholder_service = GamedayRegistry.get(
+                GamedayPlaceholderService, int(self._gameinfo["gameday"].iloc[0])
             )
 
-            placeholder_service = GamedayPlaceholderService(self._gameinfo['gameday'].iloc[0])
-
-            # Resolve each missing row
-            for index, row in self._games_with_result[
-                self._games_with_result[TEAM_DESCRIPTION].isna()
-            ].iterrows():
-                placeholder = placeholder_service.get_placeholder(
-                    row[GAMEINFO_ID], is_home=row[IS_HOME]
+            placeholders = placeholder_service.resolve_all()
+            missing = self._games_with_result[TEAM_DESCRIPTION].isna()
+            self._games_with_result.loc[missing, TEAM_DESCRIPTION] = [
+                placeholders.get((gameinfo_id, bool(is_home)), "TBD")
+                for gameinfo_id, is_home in zip(
+                    self._games_with_result.loc[missing, GAMEINFO_ID],
+                    self._games_with_result.loc[missing, IS_HOME],
                 )
-                self._games_with_result.at[index, TEAM_DESCRIPTION] = placeholder
+            ]
 
     def get_staff_passcheck_details(self, gameday_id):
         column_mapping = {
@@ -216,112 +219,16 @@ class GamedayModelWrapper:
 
 
     def get_offense_player_statistics_table(self):
-        scoring_events = ["Touchdown", "1-Extra-Punkt", "2-Extra-Punkte"]
-
-        output_columns = ["Platz", "Spieler"] + scoring_events + ["Punkte"]
-
-        events = pd.DataFrame(
-            TeamLog.objects.filter(
-                gameinfo__in=self._gameinfo["id"],
-                isDeleted=False,
-                event__in=scoring_events,
-            )
-            .exclude(team=None)
-            .exclude(player=None)
-            .values(TEAM_DESCRIPTION, "event", "player", "value")
-        )
-
-        if events.empty:
-            return pd.DataFrame(columns=output_columns)
-
-        events["player"] = events.apply(lambda x: f"{x.team__description} #{x.player}", axis=1)
-
-        table = (
-            pd.crosstab(
-                events["player"], events["event"], values=events.event, aggfunc="count"
-            )
-            .fillna(0)
-            .astype(int)
-        )
-
-        for missing_event in set(scoring_events) - set(table.columns):
-            table[missing_event] = 0
-
-        points = events.groupby("player").value.sum()
-
-        table = (
-            table.merge(left_index=True, right=points, right_index=True)
-            .reset_index()
-            .sort_values(by="value", ascending=False)
-        )
-
-        table["Platz"] = table.value.rank(method="min", ascending=False).astype(int)
-
-        table = table.rename(columns={"player": "Spieler", "value": "Punkte"})[
-            output_columns
-        ]
-
-        return table.head(10)
+        return self._get_player_statistics().get_offense_table()
 
     def get_defense_statistic_table(self):
-        ints = (
-            self._get_player_events_table(
-                event_name="Interception", event_plural_name="Interceptions"
-            )
-            .reset_index(drop=True)
-            .astype(str)
-        )
-        safeties = (
-            self._get_player_events_table(
-                event_name="Safety (+2)",
-                event_plural_name="Safety (+2)",
-            )
-            .reset_index(drop=True)
-            .astype(str)
-        )
-
-        result = (
-            ints.merge(safeties, how="outer", left_index=True, right_index=True)
-            .fillna("")
-            .rename(
-                columns={
-                    "Platz_x": "Platz",
-                    "Platz_y": "Platz",
-                    "Spieler_x": "Spieler",
-                    "Spieler_y": "Spieler",
-                }
-            )
-        )
-
-        return result
+        return self._get_player_statistics().get_defense_table()
 
-    def _get_player_events_table(self, event_name: str, event_plural_name: str):
-        output_columns = ["Platz", "Spieler", event_plural_name]
-        events = pd.DataFrame(
-            TeamLog.objects.filter(
-                gameinfo__in=self._gameinfo["id"], isDeleted=False, event=event_name
-            )
-            .exclude(team=None)
-            .exclude(player=None)
-            .values(TEAM_DESCRIPTION, "event", "player")
-        )
-
-        if events.empty:
-            return pd.DataFrame(columns=output_columns)
-
-        events["player"] = events.apply(lambda x: f"{x.team__description} #{x.player}", axis=1)
-        events = (
-            events.groupby("player", as_index=False)
-            .event.count()
-            .sort_values(by="event", ascending=False)
-        )
-
-        events["Platz"] = events.event.rank(method="min", ascending=False).astype(int)
-        return (
-            events[["Platz", "player", "event"]]
-            .rename(columns={"player": "Spieler", "event": event_plural_name})
-            .head()
-        )
+    def _get_player_statistics(self) -> GamedayPlayerStatistics:
+        # both tables are built from the same query
+        if self._player_statistics is None:
+            self._player_statistics = GamedayPlayerStatistics(self.gameday.pk)
+        return self._player_statistics
 
     def _get_standing_list(self, standings):
         final_standing = self._games_with_result.groupby(
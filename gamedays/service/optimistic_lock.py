@@ -0,0 +1,41 @@
+from django.db import models, transaction
+from django.db.models import F
+
+
+class VersionConflict(Exception):
+    def __init__(self, instance: models.Model):
+        super().__init__(
+            f"{type(instance).__name__} {instance.pk} was changed by another request"
+        )
+        self.instance = instance
+
+
+def save_with_version(
+    instance: models.Model,
+    expected_version: int | None = None,
+    update_fields: list | None = None,
+) -> None:
+    """
+    Compare-and-swap save of a model with a `version` column.
+
+    The version is only incremented if the stored version still equals
+    `expected_version` (default: the version the instance was read with), otherwise
+    VersionConflict is raised and nothing is written. The fields are written with a
+    regular save afterwards, so the post_save signals are sent as before.
+    """
+    if expected_version is None:
+        expected_version = instance.version
+    with transaction.atomic():
+        claimed = (
+            type(instance)
+            .objects.filter(pk=instance.pk, version=expected_version)
+            .update(version=F("version") + 1)
+        )
+        if not claimed:
+            raise VersionConflict(instance)
+        instance.version = expected_version + 1
+        instance.save(
+            update_fields=(
+                None if update_fields is None else [*update_fields, "version"]
+            )
+        )
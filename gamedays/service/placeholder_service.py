@@ -1,5 +1,8 @@
 import logging
-from gamedays.models import Gameinfo, Gameday
+from collections import Counter
+
+from gamedays.models import Gameinfo, Gameday, Gameresult
+from gamedays.service.gameday_registry import GamedayRegistry
 from gameday_designer.models import ScheduleTemplate, TemplateSlot, TemplateApplication
 
 logger = logging.getLogger(__name__)
@@ -14,19 +17,25 @@ class GamedayPlaceholderService:
     when resolving placeholders for multiple games on the same gameday.
     """
 
+    # serializer context key of the placeholders from resolve_all
+    PLACEHOLDERS = "placeholders"
+
     def __init__(self, gameday_id: int):
         self.gameday_id = gameday_id
         self.gameday = Gameday.objects.filter(pk=gameday_id).first()
         self._template = None
+        self._template_loaded = False
         self._gameinfos = {
             gi.pk: gi
             for gi in Gameinfo.objects.filter(gameday_id=gameday_id)
         }
         self._slots_by_field = None
+        self._slot_orders = None
 
     def get_template(self) -> ScheduleTemplate:
-        if self._template:
+        if self._template_loaded:
             return self._template
+        self._template_loaded = True
 
         if not self.gameday:
             return None
@@ -107,30 +116,77 @@ class GamedayPlaceholderService:
             logger.warning(f"Placeholder resolution failed for game {gameinfo_id}: {str(e)}")
             return "TBD"
 
+    def _get_slot_orders(self) -> dict:
+        """
+        Slot order of every (field, scheduled) of the gameday: the number of games on the
+        field at or before that time, which matches the 'slot_order' logic used during
+        template application.
+        """
+        if self._slot_orders is not None:
+            return self._slot_orders
+
+        games_per_time = Counter((gi.field, gi.scheduled) for gi in self._gameinfos.values())
+        games_on_field = Counter()
+        self._slot_orders = {}
+        for field, scheduled in sorted(games_per_time):
+            games_on_field[field] += games_per_time[(field, scheduled)]
+            self._slot_orders[(field, scheduled)] = games_on_field[field]
+        return self._slot_orders
+
     def _find_slot_for_game(self, gi: Gameinfo) -> TemplateSlot:
         """Matches a Gameinfo to its TemplateSlot by counting previous games on the same field."""
         field_slots = self._get_slots_by_field().get(gi.field, [])
         if not field_slots:
             return None
 
-        # Count how many games (including this one) are on this field at or before this time
-        # This matches the 'slot_order' logic used during template application
-        game_index = sum(
-            1 for g in self._gameinfos.values()
-            if g.field == gi.field and g.scheduled <= gi.scheduled
-        )
+        game_index = self._get_slot_orders().get((gi.field, gi.scheduled), 0)
 
         if game_index < 1 or game_index > len(field_slots):
             return None
 
         return field_slots[game_index - 1]
 
+    def resolve_all(self) -> dict:
+        """
+        Placeholders of all unresolved results of the gameday, keyed by
+        (gameinfo_id, is_home). A result is unresolved if it has no team or is missing.
+        """
+        resolved = set(
+            Gameresult.objects.filter(
+                gameinfo__gameday_id=self.gameday_id, team__isnull=False
+            ).values_list("gameinfo_id", "isHome")
+        )
+        return {
+            (gameinfo_id, is_home): self.get_placeholder(gameinfo_id, is_home)
+            for gameinfo_id in self._gameinfos
+            for is_home in (True, False)
+            if (gameinfo_id, is_home) not in resolved
+        }
+
+    @classmethod
+    def serializer_context(cls, gameday_ids) -> dict:
+        """Serializer context with the placeholders of all given gamedays."""
+        placeholders = {}
+        for gameday_id in set(gameday_ids):
+            placeholders.update(GamedayRegistry.get(cls, gameday_id).resolve_all())
+        return {cls.PLACEHOLDERS: placeholders}
+
+    @classmethod
+    def resolve_from_context(
+        cls, context: dict, gameinfo_id: int, is_home: bool = True
+    ) -> str:
+        """Looks up the placeholder in the serializer context, falls back to a single lookup."""
+        placeholder = context.get(cls.PLACEHOLDERS, {}).get((gameinfo_id, is_home))
+        if placeholder is None:
+            return cls.resolve_placeholder(gameinfo_id, is_home)
+        return placeholder
+
     @classmethod
     def resolve_placeholder(cls, gameinfo_id: int, is_home: bool = True) -> str:
         """Utility class method for quick lookups."""
         try:
             gi = Gameinfo.objects.get(pk=gameinfo_id)
-            service = cls(gi.gameday_id)
+            service = GamedayRegistry.get(cls, gi.gameday_id)
             return service.get_placeholder(gameinfo_id, is_home)
         except Gameinfo.DoesNotExist:
             return "TBD"
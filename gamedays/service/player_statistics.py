@@ -0,0 +1,114 @@
+import pandas as pd
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+
+from gamedays.models import TeamLog
+from gamedays.service.gameday_settings import TEAM_DESCRIPTION
+
+PLACE = "Platz"
+PLAYER = "Spieler"
+POINTS = "Punkte"
+
+TOUCHDOWN = "Touchdown"
+ONE_EXTRA_POINT = "1-Extra-Punkt"
+TWO_EXTRA_POINTS = "2-Extra-Punkte"
+INTERCEPTION = "Interception"
+SAFETY = "Safety (+2)"
+
+SCORING_EVENTS = [TOUCHDOWN, ONE_EXTRA_POINT, TWO_EXTRA_POINTS]
+# column name of the defense events in the defense table
+DEFENSE_EVENTS = {INTERCEPTION: "Interceptions", SAFETY: "Safety (+2)"}
+# event names are no valid aliases for the database aggregation
+EVENT_ALIASES = {
+    event: f"event_{index}"
+    for index, event in enumerate(SCORING_EVENTS + list(DEFENSE_EVENTS))
+}
+POINTS_ALIAS = "scoring_points"
+
+
+class GamedayPlayerStatistics:
+    """
+    Player statistic tables of a gameday.
+
+    The scoring and defense events are counted per player by the database in one
+    query, the tables are ranked from these counts.
+    """
+
+    OFFENSE_TOP = 10
+    DEFENSE_TOP = 5
+
+    def __init__(self, gameday_id: int):
+        aggregations = {
+            alias: Count("pk", filter=Q(event=event))
+            for event, alias in EVENT_ALIASES.items()
+        }
+        aggregations[POINTS_ALIAS] = Coalesce(
+            Sum("value", filter=Q(event__in=SCORING_EVENTS)), 0
+        )
+        self.events = pd.DataFrame(
+            TeamLog.objects.filter(
+                gameinfo__gameday_id=gameday_id,
+                isDeleted=False,
+                event__in=EVENT_ALIASES,
+            )
+            .exclude(team=None)
+            .exclude(player=None)
+            .values(TEAM_DESCRIPTION, "player")
+            .order_by()
+            .annotate(**aggregations)
+        )
+        if not self.events.empty:
+            self.events[PLAYER] = (
+                self.events[TEAM_DESCRIPTION] + " #" + self.events["player"].astype(str)
+            )
+            self.events = self.events.sort_values(by=PLAYER)
+
+    def get_offense_table(self) -> pd.DataFrame:
+        output_columns = [PLACE, PLAYER] + SCORING_EVENTS + [POINTS]
+        scoring_aliases = [EVENT_ALIASES[event] for event in SCORING_EVENTS]
+        if self.events.empty:
+            return pd.DataFrame(columns=output_columns)
+        table = self.events[self.events[scoring_aliases].sum(axis=1) > 0].rename(
+            columns={EVENT_ALIASES[event]: event for event in SCORING_EVENTS}
+            | {POINTS_ALIAS: POINTS}
+        )
+        if table.empty:
+            return pd.DataFrame(columns=output_columns)
+        return self._rank(table, POINTS)[output_columns].head(self.OFFENSE_TOP)
+
+    def get_defense_table(self) -> pd.DataFrame:
+        ints, safeties = [
+            self.get_defense_event_table(event).reset_index(drop=True).astype(str)
+            for event in DEFENSE_EVENTS
+        ]
+        return (
+            ints.merge(safeties, how="outer", left_index=True, right_index=True)
+            .fillna("")
+            .rename(
+                columns={
+                    "Platz_x": PLACE,
+                    "Platz_y": PLACE,
+                    "Spieler_x": PLAYER,
+                    "Spieler_y": PLAYER,
+                }
+            )
+        )
+
+    def get_defense_event_table(self, event: str) -> pd.DataFrame:
+        column = DEFENSE_EVENTS[event]
+        output_columns = [PLACE, PLAYER, column]
+        if self.events.empty:
+            return pd.DataFrame(columns=output_columns)
+        table = self.events[self.events[EVENT_ALIASES[event]] > 0].rename(
+            columns={EVENT_ALIASES[event]: column}
+        )
+        if table.empty:
+            return pd.DataFrame(columns=output_columns)
+        return self._rank(table, column)[output_columns].head(self.DEFENSE_TOP)
+
+    @staticmethod
+    def _rank(table: pd.DataFrame, column: str) -> pd.DataFrame:
+        # players with the same value stay in the order of their names
+        table = table.sort_values(by=column, ascending=False, kind="stable")
+        table[PLACE] = table[column].rank(method="min", ascending=False).astype(int)
+        return table
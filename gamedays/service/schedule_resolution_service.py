@@ -4,7 +4,8 @@ from gameday_designer.models import (
     TemplateUpdateRule,
 )
 from gamedays.models import Team, Gameinfo, Gameresult, Gameday
-from gamedays.service.model_wrapper import GamedayModelWrapper
+from gamedays.service.gameday_registry import GamedayRegistry
+from gamedays.service.model_records import GamedayRecords
 from gamedays.service.placeholder_service import GamedayPlaceholderService
 
 logger = logging.getLogger(__name__)
@@ -14,9 +15,11 @@ class GamedayScheduleResolutionService:
     def __init__(self, gameday_id: int):
         self.gameday_id = gameday_id
         self.gameday = Gameday.objects.get(pk=gameday_id)
-        self.placeholder_service = GamedayPlaceholderService(gameday_id)
+        self.placeholder_service = GamedayRegistry.get(
+            GamedayPlaceholderService, gameday_id
+        )
         self.template = self.placeholder_service.get_template()
-        self.gmw = GamedayModelWrapper(gameday_id)
+        self.gmw = GamedayRegistry.get(GamedayRecords, gameday_id)
 
     def update_participants(self, finished_standing: str):
         """
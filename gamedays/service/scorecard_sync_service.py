@@ -0,0 +1,143 @@
+from django.db import transaction
+
+from gamedays.models import Gameinfo, ScorecardSyncEvent
+from gamedays.service.game_service import GameService
+from gamedays.service.gamelog import GameLog
+
+ACTION_CREATE = "create"
+ACTION_DELETE = "delete"
+ACTION_HALFTIME = "halftime"
+ACTION_FINISH = "finish"
+ACTION_POSSESSION = "possession"
+ACTIONS = [
+    ACTION_CREATE,
+    ACTION_DELETE,
+    ACTION_HALFTIME,
+    ACTION_FINISH,
+    ACTION_POSSESSION,
+]
+# the events which change the gamelog, their score changes are applied together
+GAMELOG_ACTIONS = [ACTION_CREATE, ACTION_DELETE]
+
+
+class ScorecardSyncResult:
+    def __init__(self, gamelog: GameLog, applied: list, skipped: list):
+        self.gamelog = gamelog
+        self.applied = applied
+        self.skipped = skipped
+
+
+class ScorecardSyncService:
+    """
+    Applies a batch of scorecard events, which were recorded offline, in one transaction.
+
+    Every event carries a client generated idempotency key. Keys which were already
+    synced for the game (or appear twice in the batch) are skipped, so a scorecard can
+    resend its whole queue after a lost response without creating duplicates.
+    A scorecard which is offline doesn't know the sequence of its plays, so a delete
+    event may refer to the key of the create event instead (`create_key`).
+    The score is updated once for the events between two status changes, so a
+    finished game is resolved with its final score.
+    """
+
+    def __init__(self, game_id, user):
+        self.game_id = game_id
+        self.user = user
+
+    @transaction.atomic
+    def sync(self, events: list) -> ScorecardSyncResult:
+        # the row lock serializes syncs of the same game, so replays can't interleave
+        Gameinfo.objects.select_for_update().get(pk=self.game_id)
+        game_service = GameService(self.game_id)
+        synced_keys = set(
+            ScorecardSyncEvent.objects.filter(
+                gameinfo_id=self.game_id, key__in=[event["key"] for event in events]
+            ).values_list("key", flat=True)
+        )
+        # sequences of the create events, which delete events refer to by key
+        sequences = dict(
+            ScorecardSyncEvent.objects.filter(
+                gameinfo_id=self.game_id,
+                key__in=[
+                    event["create_key"] for event in events if "create_key" in event
+                ],
+            ).values_list("key", "sequence")
+        )
+        applied, skipped = [], []
+        score_changes, score_changed = {}, False
+        for event in events:
+            if event["key"] in synced_keys:
+                skipped.append(event["key"])
+                continue
+            synced_keys.add(event["key"])
+            if event["action"] not in GAMELOG_ACTIONS and score_changed:
+                # finishing a game resolves the follow-up games from the stored score
+                self._update_score(game_service, score_changes)
+                score_changes, score_changed = {}, False
+            gamelog = self._apply(game_service, event, sequences)
+            if gamelog is not None:
+                score_changed = True
+                score_changes = self._merge(score_changes, gamelog.score_changes)
+            applied.append(event)
+
+        if score_changed:
+            self._update_score(game_service, score_changes)
+        if applied:
+            ScorecardSyncEvent.objects.bulk_create(
+                [
+                    ScorecardSyncEvent(
+                        gameinfo_id=self.game_id,
+                        key=event["key"],
+                        action=event["action"],
+                        sequence=sequences.get(event["key"]),
+                    )
+                    for event in applied
+                ]
+            )
+        return ScorecardSyncResult(
+            game_service.get_gamelog(), [event["key"] for event in applied], skipped
+        )
+
+    @staticmethod
+    def _update_score(game_service: GameService, score_changes: dict | None) -> None:
+        gamelog = game_service.get_gamelog()
+        gamelog.score_changes = score_changes
+        game_service.update_score(gamelog)
+
+    def _apply(
+        self, game_service: GameService, event: dict, sequences: dict
+    ) -> GameLog | None:
+        action = event["action"]
+        if action == ACTION_CREATE:
+            gamelog = game_service.create_gamelog(
+                event["team"], event["event"], self.user, event["half"]
+            )
+            sequences[event["key"]] = gamelog.created_sequence
+            return gamelog
+        if action == ACTION_DELETE:
+            return game_service.delete_gamelog(self._get_sequence(event, sequences))
+        if action == ACTION_HALFTIME:
+            game_service.update_halftime(self.user)
+        elif action == ACTION_FINISH:
+            game_service.update_game_finished(self.user)
+        elif action == ACTION_POSSESSION:
+            game_service.update_team_in_possesion(event["team"])
+        return None
+
+    def _get_sequence(self, event: dict, sequences: dict) -> int:
+        if "sequence" in event:
+            return event["sequence"]
+        if sequences.get(event["create_key"]) is None:
+            raise ScorecardSyncEvent.DoesNotExist(
+                f"No create event {event['create_key']} synced for game {self.game_id}"
+            )
+        return sequences[event["create_key"]]
+
+    @staticmethod
+    def _merge(score_changes: dict | None, other: dict | None) -> dict | None:
+        if score_changes is None or other is None:
+            return None
+        merged = dict(score_changes)
+        for key, points in other.items():
+            merged[key] = merged.get(key, 0) + points
+        return merged
@@ -1,11 +1,25 @@
 import logging
 
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
 from gamedays.management.schedule_update import ScheduleUpdate
-from gamedays.models import Gameinfo, GamedayDesignerState
+from gamedays.models import (
+    Gameday,
+    Gameinfo,
+    GamedayDesignerState,
+    Gameresult,
+    TeamLog,
+)
 from gameday_designer.models import TemplateApplication
+from gamedays.service.game_live_state_service import GameLiveStateService
+from gamedays.service.game_replay import GameReplay
+from gamedays.service.gameday_data_version import GamedayDataVersion
+from gamedays.service.gameday_registry import GamedayRegistry
+from gamedays.service.gameday_service import GamedayGameService
+from gamedays.service.gameday_snapshot_service import GamedaySnapshotService
+from gamedays.service.model_helper import GameinfoHelper
 from gamedays.service.schedule_resolution_service import (
     GamedayScheduleResolutionService,
 )
@@ -16,6 +30,8 @@ logger = logging.getLogger(__name__)
 @receiver(post_save, sender=Gameinfo)
 def update_game_schedule(sender, instance: Gameinfo, created, **kwargs):
     if instance.status == Gameinfo.STATUS_COMPLETED:
+        # runs before bump_gameday_data_version_for_gameinfo, the wrappers have to see this save
+        GamedayRegistry.invalidate(instance.gameday_id)
         try:
             # Check for Designer-based gameday (template slots)
             if TemplateApplication.objects.filter(gameday=instance.gameday).exists():
@@ -38,3 +54,52 @@ def update_game_schedule(sender, instance: Gameinfo, created, **kwargs):
                 f"Schedule resolution failed for gameinfo {instance.pk} "
                 f"(gameday {instance.gameday_id}): {e}"
             )
+
+
+@receiver(post_save, sender=Gameinfo)
+@receiver(post_delete, sender=Gameinfo)
+def bump_gameday_data_version_for_gameinfo(sender, instance: Gameinfo, **kwargs):
+    GamedayDataVersion.bump_on_commit(instance.gameday_id)
+
+
+@receiver(post_save, sender=Gameresult)
+@receiver(post_delete, sender=Gameresult)
+@receiver(post_save, sender=TeamLog)
+@receiver(post_delete, sender=TeamLog)
+def bump_gameday_data_version_for_game(sender, instance, **kwargs):
+    GamedayDataVersion.bump_on_commit(GameinfoHelper.get_gameday_id_for(instance))
+
+
+@receiver(post_save, sender=Gameinfo)
+def invalidate_live_state_for_gameinfo(
+    sender, instance: Gameinfo, created, update_fields=None, **kwargs
+):
+    # partial updates are only done by the GameService, which refreshes the state itself
+    if not created and update_fields is None:
+        GameLiveStateService.invalidate(instance.pk)
+
+
+@receiver(post_save, sender=Gameresult)
+@receiver(post_delete, sender=Gameresult)
+def invalidate_live_state_for_gameresult(sender, instance: Gameresult, **kwargs):
+    GameLiveStateService.invalidate(instance.gameinfo_id)
+
+
+@receiver(post_save, sender=TeamLog)
+@receiver(post_delete, sender=TeamLog)
+def invalidate_game_state_snapshots(sender, instance: TeamLog, **kwargs):
+    # entries with sequence 0 (game events like halftime) are not part of the replay
+    if instance.sequence:
+        GameReplay.invalidate_snapshots(instance.gameinfo_id, instance.sequence)
+
+
+@receiver(post_save, sender=TeamLog)
+@receiver(post_delete, sender=TeamLog)
+def invalidate_game_events_table(sender, instance: TeamLog, **kwargs):
+    GamedayGameService.invalidate_events_table(instance.gameinfo_id)
+
+
+@receiver(post_save, sender=Gameday)
+def store_gameday_snapshot(sender, instance: Gameday, **kwargs):
+    if instance.status == Gameday.STATUS_COMPLETED:
+        transaction.on_commit(lambda: GamedaySnapshotService(instance).build())
@@ -0,0 +1,91 @@
+from functools import cache
+
+import pandas as pd
+from django.template.loader import get_template
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+TABLE_CLASSES = [
+    "table",
+    "table-hover",
+    "table-condensed",
+    "table-responsive",
+    "text-center",
+]
+
+
+@cache
+def _get_table_template():
+    # compiled once per process, independent of the template loaders in use
+    return get_template("gamedays/tables/table.html")
+
+
+class TableRenderer:
+    """
+    Renders tables as HTML through a precompiled template instead of DataFrame.to_html.
+
+    A table is either a DataFrame or a list of records with the keys given by
+    `columns` (a list of keys or a dict of key -> header). All headers and cells are
+    escaped, except the cells of `html_columns`, which have to be built with escaped
+    values (see format_html). Missing values are rendered as empty cells. Objects
+    without rows (the Empty* tables) are rendered by their own to_html.
+    """
+
+    @classmethod
+    def render(
+        cls,
+        table,
+        columns: list | dict | None = None,
+        html_columns=(),
+        table_id: str | None = None,
+        justify: str = "left",
+        classes: list | None = None,
+    ) -> str:
+        if isinstance(table, pd.DataFrame):
+            keys, headers = cls._get_columns(list(table.columns), columns)
+            rows = (
+                table[keys].itertuples(index=False, name=None)
+                if keys != list(table.columns)
+                else table.itertuples(index=False, name=None)
+            )
+        elif isinstance(table, list):
+            keys, headers = cls._get_columns(list(table[0]) if table else [], columns)
+            rows = ([record.get(key) for key in keys] for record in table)
+        else:
+            return table.to_html()
+        html_indexes = {index for index, key in enumerate(keys) if key in html_columns}
+        return _get_table_template().render(
+            {
+                "classes": " ".join(["dataframe"] + (classes or TABLE_CLASSES)),
+                "table_id": table_id,
+                "justify": justify,
+                "columns": headers,
+                "body": mark_safe(
+                    "\n".join(cls._render_row(row, html_indexes) for row in rows)
+                ),
+            }
+        )
+
+    @staticmethod
+    def _get_columns(table_columns: list, columns: list | dict | None):
+        if columns is None:
+            return table_columns, table_columns
+        if isinstance(columns, dict):
+            return list(columns), list(columns.values())
+        return list(columns), list(columns)
+
+    @classmethod
+    def _render_row(cls, row, html_indexes: set) -> str:
+        # the cells are escaped here, the row loop is too hot for template tags
+        cells = "".join(
+            f"<td>{cls._render_cell(cell, index in html_indexes)}</td>"
+            for index, cell in enumerate(row)
+        )
+        return f"    <tr>{cells}</tr>"
+
+    @staticmethod
+    def _render_cell(cell, is_html: bool) -> str:
+        # None, NA, NaN and NaT are rendered as empty cells
+        if cell is None or cell is pd.NA or cell != cell:
+            return ""
+        return str(cell) if is_html else escape(cell)
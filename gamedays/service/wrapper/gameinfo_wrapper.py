@@ -4,6 +4,7 @@ from typing import Optional
 from django.utils import timezone
 
 from gamedays.models import Gameinfo
+from gamedays.service.optimistic_lock import save_with_version
 from league_table.models import LeagueGroup
 
 STATUS_HALFTIME = "2. Halbzeit"
@@ -24,32 +25,38 @@ class GameinfoWrapper(object):
     def from_instance(cls, gameinfo: Gameinfo) -> "GameinfoWrapper":
         return cls(gameinfo)
 
-    def _save(self, update_fields: Optional[list] = None) -> None:
-        self.gameinfo.save(update_fields=update_fields)
+    def _save(
+        self,
+        update_fields: Optional[list] = None,
+        expected_version: Optional[int] = None,
+    ) -> None:
+        save_with_version(self.gameinfo, expected_version, update_fields)
 
-    def set_halftime_to_now(self) -> None:
+    def set_halftime_to_now(self, expected_version: Optional[int] = None) -> None:
         now = timezone.now()
         self.gameinfo.status = STATUS_HALFTIME
         self.gameinfo.gameHalftime = now
-        self._save(update_fields=["status", "gameHalftime"])
+        self._save(["status", "gameHalftime"], expected_version)
 
-    def set_gamestarted_to_now(self) -> None:
+    def set_gamestarted_to_now(self, expected_version: Optional[int] = None) -> None:
         now = timezone.now()
         self.gameinfo.status = STATUS_FIRST_HALF
         self.gameinfo.gameStarted = now
-        self._save(update_fields=["status", "gameStarted"])
+        self._save(["status", "gameStarted"], expected_version)
 
-    def set_game_finished_to_now(self) -> None:
+    def set_game_finished_to_now(self, expected_version: Optional[int] = None) -> None:
         now = timezone.now()
         self.gameinfo.status = STATUS_FINISHED
         self.gameinfo.gameFinished = now
-        self._save(update_fields=["status", "gameFinished"])
+        self._save(["status", "gameFinished"], expected_version)
 
-    def update_team_in_possession(self, team_name: str) -> None:
+    def update_team_in_possession(
+        self, team_name: str, expected_version: Optional[int] = None
+    ) -> None:
         if self.gameinfo.in_possession == team_name:
             return
         self.gameinfo.in_possession = team_name
-        self._save(update_fields=["in_possession"])
+        self._save(["in_possession"], expected_version)
 
     def update_gameday(self, gameday) -> Gameinfo:
         self.gameinfo.gameday = gameday
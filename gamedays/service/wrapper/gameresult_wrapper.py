@@ -1,3 +1,6 @@
+from django.db.models import Case, F, IntegerField, When
+from django.db.models.functions import Coalesce
+
 from gamedays.models import Gameresult, Team, Gameinfo
 
 
@@ -26,8 +29,42 @@ class GameresultWrapper(object):
         else:
             gameresult.sh = second_half
             gameresult.pa = gameresult.pa + points_against
+        # the scores are recomputed from the whole gamelog, the last recomputation
+        # wins. Clients which write with the version they read still see the change.
+        gameresult.version = F("version") + 1
         gameresult.save()
 
+    def add_points(self, is_home: bool, half: int, points: int) -> int:
+        """
+        Adds the points to the half of the scoring team and to `pa` of the opponent
+        with one UPDATE of both gameresults. Unset scores are initialised with 0, like
+        the full recomputation does.
+
+        The update is only done if the scores are known to match the gamelog
+        (GameLiveState.score_synced), returns the number of updated gameresults.
+        """
+        score_column = "fh" if half == 1 else "sh"
+        columns = {
+            column: Coalesce(F(column), 0, output_field=IntegerField())
+            for column in ("fh", "sh", "pa")
+        }
+        return Gameresult.objects.filter(
+            gameinfo=self.gameinfo, gameinfo__live_state__score_synced=True
+        ).update(
+            **{
+                **columns,
+                score_column: Case(
+                    When(isHome=is_home, then=columns[score_column] + points),
+                    default=columns[score_column],
+                ),
+                "pa": Case(
+                    When(isHome=not is_home, then=columns["pa"] + points),
+                    default=columns["pa"],
+                ),
+                "version": F("version") + 1,
+            }
+        )
+
     def _get_team_name(self, is_home):
         return self._get_gameresult(is_home).team.name
 
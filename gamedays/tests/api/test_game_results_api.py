@@ -50,3 +50,20 @@ class GameResultsAPITest(APITestCase):
         res_a = Gameresult.objects.get(gameinfo=self.game, team=self.team_a)
         assert res_a.fh == 2
         assert res_a.sh == 1
+
+    def test_update_game_result_with_outdated_version_conflicts(self):
+        url = f"/api/gamedays/{self.gameday.id}/games/{self.game.id}/results/"
+        Gameresult.objects.filter(gameinfo=self.game, isHome=True).update(version=1)
+        data = {
+            "results": [
+                {"fh": 2, "sh": 1, "isHome": True, "version": 0},
+                {"fh": 1, "sh": 0, "isHome": False, "version": 0},
+            ]
+        }
+        response = self.client.post(url, data, format="json")
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.data["current"]["final_score"] == {"home": 0, "away": 0}
+
+        self.game.refresh_from_db()
+        assert self.game.status != Gameinfo.STATUS_COMPLETED
+        assert Gameresult.objects.get(gameinfo=self.game, isHome=False).fh is None
@@ -2,12 +2,16 @@ import json
 import pathlib
 import re
 from http import HTTPStatus
+from unittest.mock import patch
 
+from django.db.models import F
 from django_webtest import WebTest
 from rest_framework.reverse import reverse
 
 from gamedays.constants import (
     API_GAMELOG,
+    API_GAMELOG_REPLAY,
+    API_GAMELOG_SYNC,
     API_CONFIG_SCORECARD_PENALTIES,
     API_GAME_POSSESSION,
     API_GAME_FINALIZE,
@@ -15,10 +19,24 @@ from gamedays.constants import (
     API_GAME_OFFICIALS,
     API_GAME_SETUP,
 )
-from gamedays.models import Gameinfo, Gameresult, GameOfficial, GameSetup, TeamLog
+from gamedays.models import (
+    Gameinfo,
+    Gameresult,
+    GameOfficial,
+    GameSetup,
+    GameStateSnapshot,
+    TeamLog,
+)
+from gamedays.service.game_replay import GameReplay
 from gamedays.tests.setup_factories.db_setup import DBSetup
 
 
+def _read_version_before_another_request_saves(game_id) -> int:
+    version = Gameinfo.objects.get(pk=game_id).version
+    Gameinfo.objects.filter(pk=game_id).update(version=F("version") + 1)
+    return version
+
+
 class TestRetrieveUpdateOfficials(WebTest):
 
     def test_create_officials(self):
@@ -111,6 +129,26 @@ class TestGameSetup(WebTest):
         assert first_game.status == "2. Halbzeit"
         assert str(first_game.gameStarted) == "11:00:00"
 
+    def test_game_setup_create_conflicts_with_concurrent_write(self):
+        DBSetup().g62_status_empty()
+        first_game = Gameinfo.objects.last()
+        version = _read_version_before_another_request_saves(first_game.pk)
+        response = self.app.put_json(
+            reverse(API_GAME_SETUP, kwargs={"pk": first_game.pk}),
+            {
+                "ctResult": "won",
+                "direction": "arrow_forward",
+                "fhPossession": "HOME",
+                "version": version,
+            },
+            headers=DBSetup().get_token_header(),
+            expect_errors=True,
+        )
+        assert response.status_code == HTTPStatus.CONFLICT
+        assert response.json["gamelog"]["gameId"] == first_game.pk
+        assert not GameSetup.objects.exists()
+        assert Gameinfo.objects.last().status != "1. Halbzeit"
+
     def test_game_setup_get(self):
         DBSetup().g62_status_empty()
         last_game = Gameinfo.objects.last()
@@ -351,6 +389,256 @@ class TestGameLog(WebTest):
         assert json_response["home"]["firsthalf"]["entries"][1]["isDeleted"]
 
 
+class TestGameLogSync(WebTest):
+    TOUCHDOWN = {
+        "key": "td-1",
+        "action": "create",
+        "team": "A1",
+        "half": 1,
+        "event": [
+            {"name": "Touchdown", "player": "19"},
+            {"name": "1-Extra-Punkt", "player": "7"},
+        ],
+    }
+
+    def _sync(self, game, events, expect_errors=False):
+        return self.app.post_json(
+            reverse(API_GAMELOG_SYNC, kwargs={"id": game.pk}),
+            {"events": events},
+            headers=DBSetup().get_token_header(),
+            expect_errors=expect_errors,
+        )
+
+    def test_sync_applies_events_in_order(self):
+        DBSetup().g62_status_empty()
+        first_game = Gameinfo.objects.first()
+        response = self._sync(
+            first_game,
+            [
+                {"key": "possession-1", "action": "possession", "team": "A2"},
+                self.TOUCHDOWN,
+                {"key": "halftime", "action": "halftime"},
+                {
+                    "key": "safety-1",
+                    "action": "create",
+                    "team": "A2",
+                    "half": 2,
+                    "event": [{"name": "Safety (+2)", "player": "3"}],
+                },
+                {"key": "delete-1", "action": "delete", "sequence": 1},
+            ],
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.json["applied"] == [
+            "possession-1",
+            "td-1",
+            "halftime",
+            "safety-1",
+            "delete-1",
+        ]
+        assert response.json["skipped"] == []
+        gamelog = response.json["gamelog"]
+        assert gamelog["isFirstHalf"] is False
+        assert gamelog["home"]["score"] == 0
+        assert gamelog["away"]["score"] == 2
+        first_game.refresh_from_db()
+        assert first_game.in_possession == "A2"
+        assert first_game.status == "2. Halbzeit"
+        home = Gameresult.objects.get(gameinfo=first_game, isHome=True)
+        away = Gameresult.objects.get(gameinfo=first_game, isHome=False)
+        assert (home.fh, home.sh, home.pa) == (0, 0, 2)
+        assert (away.fh, away.sh, away.pa) == (0, 2, 0)
+
+    def test_finished_game_resolves_follow_up_games_with_synced_score(self):
+        DBSetup().g4_final4_1_status_empty()
+        # the follow-up games are resolved when both games of the Vorrunde are finished
+        second_game = Gameinfo.objects.get(standing="Spiel 2")
+        Gameresult.objects.filter(gameinfo=second_game, isHome=True).update(
+            fh=7, sh=0, pa=0
+        )
+        Gameresult.objects.filter(gameinfo=second_game, isHome=False).update(
+            fh=0, sh=0, pa=7
+        )
+        Gameinfo.objects.filter(pk=second_game.pk).update(
+            status=Gameinfo.STATUS_COMPLETED
+        )
+        first_game = Gameinfo.objects.get(standing="Spiel 1")
+        response = self._sync(
+            first_game,
+            [
+                dict(self.TOUCHDOWN, team="A2"),
+                {"key": "finish", "action": "finish"},
+            ],
+        )
+        assert response.status_code == HTTPStatus.OK
+        final = Gameinfo.objects.get(standing="Spiel 4")
+        assert Gameresult.objects.get(gameinfo=final, isHome=True).team.name == "A2"
+        third_place = Gameinfo.objects.get(standing="Spiel 3")
+        assert (
+            Gameresult.objects.get(gameinfo=third_place, isHome=True).team.name == "A1"
+        )
+
+    def test_replayed_events_are_skipped(self):
+        DBSetup().g62_status_empty()
+        first_game = Gameinfo.objects.first()
+        self._sync(first_game, [self.TOUCHDOWN])
+        response = self._sync(
+            first_game,
+            [
+                self.TOUCHDOWN,
+                dict(self.TOUCHDOWN, key="td-2"),
+                dict(self.TOUCHDOWN, key="td-2"),
+            ],
+        )
+        assert response.json["applied"] == ["td-2"]
+        assert response.json["skipped"] == ["td-1", "td-2"]
+        assert response.json["gamelog"]["home"]["score"] == 14
+        assert TeamLog.objects.filter(gameinfo=first_game).count() == 4
+        home = Gameresult.objects.get(gameinfo=first_game, isHome=True)
+        assert home.fh == 14
+
+    def test_sync_is_rolled_back_on_unknown_team(self):
+        DBSetup().g62_status_empty()
+        first_game = Gameinfo.objects.first()
+        response = self._sync(
+            first_game,
+            [self.TOUCHDOWN, dict(self.TOUCHDOWN, key="td-2", team="unknown")],
+            expect_errors=True,
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert TeamLog.objects.filter(gameinfo=first_game).count() == 0
+        response = self._sync(first_game, [self.TOUCHDOWN])
+        assert response.json["applied"] == ["td-1"]
+
+    def test_delete_event_refers_to_create_event_of_same_batch(self):
+        DBSetup().g62_status_empty()
+        first_game = Gameinfo.objects.first()
+        response = self._sync(
+            first_game,
+            [
+                {"key": "possession-1", "action": "possession", "team": "A2"},
+                self.TOUCHDOWN,
+                {"key": "delete-1", "action": "delete", "create_key": "td-1"},
+            ],
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.json["gamelog"]["home"]["score"] == 0
+        assert not TeamLog.objects.filter(gameinfo=first_game, isDeleted=False).exists()
+
+    def test_delete_event_refers_to_create_event_of_earlier_batch(self):
+        DBSetup().g62_status_empty()
+        first_game = Gameinfo.objects.first()
+        self._sync(first_game, [dict(self.TOUCHDOWN, key="td-0"), self.TOUCHDOWN])
+        response = self._sync(
+            first_game,
+            [
+                self.TOUCHDOWN,
+                {"key": "delete-1", "action": "delete", "create_key": "td-1"},
+            ],
+        )
+        assert response.json["applied"] == ["delete-1"]
+        assert response.json["skipped"] == ["td-1"]
+        assert response.json["gamelog"]["home"]["score"] == 7
+        assert list(
+            TeamLog.objects.filter(gameinfo=first_game, isDeleted=True)
+            .values_list("sequence", flat=True)
+            .distinct()
+        ) == [2]
+        home = Gameresult.objects.get(gameinfo=first_game, isHome=True)
+        assert home.fh == 7
+
+    def test_delete_event_of_unknown_create_event_rolls_back_sync(self):
+        DBSetup().g62_status_empty()
+        first_game = Gameinfo.objects.first()
+        response = self._sync(
+            first_game,
+            [
+                self.TOUCHDOWN,
+                {"key": "delete-1", "action": "delete", "create_key": "unknown"},
+            ],
+            expect_errors=True,
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert TeamLog.objects.filter(gameinfo=first_game).count() == 0
+
+    def test_sync_validates_events(self):
+        DBSetup().g62_status_empty()
+        first_game = Gameinfo.objects.first()
+        response = self._sync(
+            first_game,
+            [{"key": "delete-1", "action": "delete"}],
+            expect_errors=True,
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        response = self._sync(
+            first_game,
+            [
+                {
+                    "key": "delete-1",
+                    "action": "delete",
+                    "sequence": 1,
+                    "create_key": "td",
+                }
+            ],
+            expect_errors=True,
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        response = self._sync(first_game, [], expect_errors=True)
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_sync_game_not_found(self):
+        DBSetup().g62_status_empty()
+        response = self.app.post_json(
+            reverse(API_GAMELOG_SYNC, kwargs={"id": 666}),
+            {"events": [self.TOUCHDOWN]},
+            headers=DBSetup().get_token_header(),
+            expect_errors=True,
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+class TestGameLogReplay(WebTest):
+    def test_replay_at_sequence(self):
+        gameinfo = DBSetup().create_teamlog_home_and_away()
+        response = self.app.get(
+            reverse(API_GAMELOG_REPLAY, kwargs={"id": gameinfo.pk}),
+            {"sequence": 1},
+            headers=DBSetup().get_token_header(),
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert response.json["sequence"] == 1
+        assert response.json["home_score"] == 6
+        assert response.json["away_score"] == 0
+
+    def test_anonymous_replay_stores_no_snapshots(self):
+        gameinfo = DBSetup().create_teamlog_home_and_away()
+        with patch.object(GameReplay, "SNAPSHOT_INTERVAL", 2):
+            response = self.app.get(
+                reverse(API_GAMELOG_REPLAY, kwargs={"id": gameinfo.pk})
+            )
+        assert response.status_code == HTTPStatus.OK
+        assert not GameStateSnapshot.objects.exists()
+
+    def test_replay_rejects_invalid_sequence(self):
+        gameinfo = DBSetup().create_teamlog_home_and_away()
+        response = self.app.get(
+            reverse(API_GAMELOG_REPLAY, kwargs={"id": gameinfo.pk}),
+            {"sequence": "abc"},
+            headers=DBSetup().get_token_header(),
+            expect_errors=True,
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_replay_unknown_game(self):
+        DBSetup().g62_status_empty()
+        response = self.app.get(
+            reverse(API_GAMELOG_REPLAY, kwargs={"id": 9999}),
+            headers=DBSetup().get_token_header(),
+            expect_errors=True,
+        )
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+
 class TestGameHalftime(WebTest):
     def test_halftime_submitted(self):
         DBSetup().g62_status_empty()
@@ -364,6 +652,44 @@ class TestGameHalftime(WebTest):
         assert first_game.status == "2. Halbzeit"
         assert re.match(r"^(0\d|1\d|2[0-3]):[0-5]\d", str(first_game.gameHalftime))
 
+    def test_halftime_conflicts_with_concurrent_write(self):
+        DBSetup().g62_status_empty()
+        first_game: Gameinfo = Gameinfo.objects.first()
+        version = _read_version_before_another_request_saves(first_game.pk)
+        response = self.app.put_json(
+            reverse(API_GAME_HALFTIME, kwargs={"pk": first_game.pk}),
+            {"version": version},
+            headers=DBSetup().get_token_header(),
+            expect_errors=True,
+        )
+        assert response.status_code == HTTPStatus.CONFLICT
+        assert response.json["gamelog"]["gameId"] == first_game.pk
+        assert Gameinfo.objects.first().status != "2. Halbzeit"
+        assert not TeamLog.objects.filter(gameinfo=first_game).exists()
+
+    def test_halftime_with_current_version(self):
+        DBSetup().g62_status_empty()
+        first_game: Gameinfo = Gameinfo.objects.first()
+        response = self.app.put_json(
+            reverse(API_GAME_HALFTIME, kwargs={"pk": first_game.pk}),
+            {"version": first_game.version},
+            headers=DBSetup().get_token_header(),
+        )
+        assert response.status_code == HTTPStatus.OK
+        assert Gameinfo.objects.first().version == first_game.version + 1
+
+    def test_halftime_rejects_invalid_version(self):
+        DBSetup().g62_status_empty()
+        first_game: Gameinfo = Gameinfo.objects.first()
+        response = self.app.put_json(
+            reverse(API_GAME_HALFTIME, kwargs={"pk": first_game.pk}),
+            {"version": "abc"},
+            headers=DBSetup().get_token_header(),
+            expect_errors=True,
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert Gameinfo.objects.first().status != "2. Halbzeit"
+
 
 class TestGameFinalize(WebTest):
     def test_game_is_finalized(self):
@@ -390,6 +716,28 @@ class TestGameFinalize(WebTest):
         assert first_game.status == "beendet"
         assert re.match(r"^(0\d|1\d|2[0-3]):[0-5]\d", str(first_game.gameFinished))
 
+    def test_finalize_conflicts_with_concurrent_write(self):
+        DBSetup().g62_status_empty()
+        first_game: Gameinfo = Gameinfo.objects.last()
+        DBSetup().create_gamesetup(first_game)
+        version = _read_version_before_another_request_saves(first_game.pk)
+        response = self.app.put_json(
+            reverse(API_GAME_FINALIZE, kwargs={"pk": first_game.pk}),
+            {
+                "homeCaptain": "Home Captain",
+                "awayCaptain": "Away Captain",
+                "note": "some final note",
+                "hasFinalScoreChanged": True,
+                "version": version,
+            },
+            headers=DBSetup().get_token_header(),
+            expect_errors=True,
+        )
+        assert response.status_code == HTTPStatus.CONFLICT
+        assert response.json["gamelog"]["gameId"] == first_game.pk
+        assert GameSetup.objects.get(gameinfo=first_game).homeCaptain != "Home Captain"
+        assert Gameinfo.objects.last().status != "beendet"
+
 
 class TestConfigPenaltiesAPIView(WebTest):
     def test_get_penalty_list(self):
@@ -410,3 +758,17 @@ class TestGamePossessionAPIView(WebTest):
         )
         assert response.status_code == HTTPStatus.OK
         assert Gameinfo.objects.last().in_possession == "name of team"
+
+    def test_put_game_possession_conflicts_with_concurrent_write(self):
+        DBSetup().g62_status_empty()
+        last_game: Gameinfo = Gameinfo.objects.last()
+        version = _read_version_before_another_request_saves(last_game.pk)
+        response = self.app.put_json(
+            reverse(API_GAME_POSSESSION, kwargs={"pk": last_game.pk}),
+            {"team": "name of team", "version": version},
+            headers=DBSetup().get_token_header(),
+            expect_errors=True,
+        )
+        assert response.status_code == HTTPStatus.CONFLICT
+        assert response.json["gamelog"]["gameId"] == last_game.pk
+        assert Gameinfo.objects.last().in_possession == "A1"
@@ -10,8 +10,9 @@ from django_webtest import WebTest
 from rest_framework.reverse import reverse
 
 from gamedays.api.serializers import GamedaySerializer, GameinfoSerializer
-from gamedays.constants import API_GAMEDAY_WHISTLEGAMES, API_GAMEDAY_LIST
+from gamedays.constants import API_GAMEDAY_WHISTLEGAMES, API_GAMEDAY_LIST, API_GAMEDAY_JSON
 from gamedays.models import Team, Gameday, Gameinfo
+from gamedays.service.gameday_data_version import GamedayDataVersion
 from gamedays.service.gameday_service import EmptySchedule, EmptyQualifyTable
 from gamedays.tests.setup_factories.db_setup import DBSetup
 from league_table.tests.setup_factories.db_setup_leaguetable import LEAGUE_TABLE_TEST_RULESET
@@ -140,6 +141,71 @@ class TestGamedaySchedule(WebTest):
         assert response.json == []
 
 
+class TestGamedayJsonView(WebTest):
+    def _get(self, gameday, document, **kwargs):
+        return self.app.get(
+            reverse(API_GAMEDAY_JSON, kwargs={"pk": gameday.pk, "document": document}),
+            **kwargs,
+        )
+
+    def test_schedule(self):
+        gameday = DBSetup().g62_status_empty()
+        response = self._get(gameday, "schedule")
+        assert response.status_code == HTTPStatus.OK
+        assert response.content_type == "application/json"
+        assert len(response.json) == Gameinfo.objects.filter(gameday=gameday).count()
+        assert response.json[0] == {
+            "id": response.json[0]["id"],
+            "scheduled": "10:00",
+            "field": 1,
+            "home": "AAAAAAA1",
+            "points_home": 3,
+            "points_away": 2,
+            "away": "AAAAAAA2",
+            "officials": "officials",
+            "standing": "Gruppe 1",
+            "stage": "Vorrunde",
+            "status": "Geplant",
+        }
+
+    def test_empty_gameday(self):
+        gameday = DBSetup().create_empty_gameday()
+        for document in ["schedule", "qualify", "final"]:
+            assert self._get(gameday, document).json == []
+
+    @patch("league_table.service.datatypes.LeagueConfigRuleset.from_ruleset")
+    def test_qualify_table(self, mock_get_league_config_ruleset):
+        mock_get_league_config_ruleset.return_value = LEAGUE_TABLE_TEST_RULESET
+        gameday = DBSetup().g62_qualify_finished()
+        LeagueSeasonConfigFactory(league=gameday.league, season=gameday.season)
+        with open(
+            pathlib.Path(__file__).parent / "testdata/qualify_g62_qualify_finished.json"
+        ) as f:
+            expected_qualify = json.load(f)
+        response = self._get(gameday, "qualify")
+        assert [list(row.values()) for row in response.json] == expected_qualify["data"]
+        assert list(response.json[0]) == ["standing", "team", "win_points", "pf", "pa", "diff"]
+
+    def test_players(self):
+        gameday = DBSetup().g62_status_empty()
+        response = self._get(gameday, "players")
+        assert response.json == {"offense": [], "interceptions": [], "safeties": []}
+
+    def test_unknown_document(self):
+        gameday = DBSetup().g62_status_empty()
+        assert self._get(gameday, "unknown", expect_errors=True).status_code == HTTPStatus.NOT_FOUND
+
+    def test_conditional_get(self):
+        gameday = DBSetup().g62_status_empty()
+        etag = self._get(gameday, "schedule").headers["ETag"]
+        response = self._get(gameday, "schedule", headers={"If-None-Match": etag})
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        GamedayDataVersion.bump(gameday.pk)
+        response = self._get(gameday, "schedule", headers={"If-None-Match": etag})
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["ETag"] != etag
+
+
 class TestGamesToWhistleAPIView(WebTest):
     def test_get_games_to_whistle_for_specific_team(self):
         gameday = DBSetup().g62_status_empty()
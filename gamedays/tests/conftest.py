@@ -0,0 +1,8 @@
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Cached gameday tables must not leak into tests which reuse the same primary keys."""
+    cache.clear()
@@ -0,0 +1,110 @@
+from django.test import TestCase
+
+from gamedays.models import (
+    GameLiveState,
+    GamedayDesignerState,
+    Gameinfo,
+    Gameresult,
+    Team,
+)
+from gamedays.service.canvas_progression_service import (
+    CanvasBracketProgressionService,
+)
+from gamedays.service.game_live_state_service import GameLiveStateService
+from gamedays.service.game_service import GameService
+from gamedays.tests.setup_factories.db_setup import DBSetup
+
+
+class TestGameLiveStateService(TestCase):
+    def test_live_state_is_built_on_first_read(self):
+        gameinfo = DBSetup().create_teamlog_home_and_away()
+        assert not GameLiveState.objects.filter(gameinfo=gameinfo).exists()
+        live_state = GameLiveStateService.get(gameinfo.pk)
+        assert live_state.home_name == "Home"
+        assert live_state.away_name == "Away"
+        assert (live_state.home_fh, live_state.home_sh) == (2, 1)
+        assert (live_state.away_fh, live_state.away_sh) == (1, 1)
+        assert live_state.last_sequence > 0
+
+    def test_live_state_is_read_with_one_query(self):
+        gameinfo = DBSetup().create_teamlog_home_and_away()
+        GameLiveStateService.get(gameinfo.pk)
+        with self.assertNumQueries(1):
+            GameLiveStateService.get_gamelog_values(gameinfo.pk)
+
+    def test_live_state_raises_for_unknown_game(self):
+        with self.assertRaises(Gameinfo.DoesNotExist):
+            GameLiveStateService.get(0)
+
+    def test_game_service_updates_live_state(self):
+        gameinfo = DBSetup().create_teamlog_home_and_away()
+        game_service = GameService(gameinfo.pk)
+        game_service.update_score(game_service.get_gamelog())
+        game_service.update_team_in_possesion("Away")
+        game_service.update_halftime(gameinfo.gameday.author)
+        live_state = GameLiveState.objects.get(gameinfo=gameinfo)
+        home = Gameresult.objects.get(gameinfo=gameinfo, isHome=True)
+        away = Gameresult.objects.get(gameinfo=gameinfo, isHome=False)
+        assert (live_state.home_fh, live_state.home_sh) == (home.fh, home.sh)
+        assert (live_state.away_fh, live_state.away_sh) == (away.fh, away.sh)
+        assert live_state.home_fh == 21
+        assert live_state.in_possession == "Away"
+        assert live_state.status == "2. Halbzeit"
+
+    def test_write_outside_of_game_service_invalidates_live_state(self):
+        gameinfo = DBSetup().create_teamlog_home_and_away()
+        GameLiveStateService.get(gameinfo.pk)
+        gameresult = Gameresult.objects.get(gameinfo=gameinfo, isHome=True)
+        gameresult.team = Team.objects.create(
+            name="New Home", description="New Home Team", location="Somewhere"
+        )
+        gameresult.save()
+        assert not GameLiveState.objects.filter(gameinfo=gameinfo).exists()
+        assert GameLiveStateService.get(gameinfo.pk).home_name == "New Home"
+
+    def test_canvas_progression_invalidates_live_state(self):
+        gameday = DBSetup().g62_finalround(sf="beendet", p1="Geplant")
+        semifinal = Gameinfo.objects.filter(gameday=gameday, standing="HF").first()
+        final = Gameinfo.objects.get(gameday=gameday, standing="P1")
+        GamedayDesignerState.objects.create(
+            gameday=gameday,
+            state_data={
+                "nodes": [
+                    {
+                        "type": "game",
+                        "data": {
+                            "standing": "P1",
+                            "homeTeamDynamic": {"type": "winner", "matchName": "HF"},
+                        },
+                    }
+                ]
+            },
+        )
+        GameLiveStateService.get(final.pk)
+
+        CanvasBracketProgressionService(semifinal).apply()
+
+        assert not GameLiveState.objects.filter(gameinfo=final).exists()
+        winner = Gameresult.objects.get(gameinfo=semifinal, isHome=False).team
+        assert GameLiveStateService.get(final.pk).home_name == winner.name
+
+    def test_gamelog_values(self):
+        gameinfo = DBSetup().create_teamlog_home_and_away()
+        values = GameLiveStateService.get_gamelog_values(gameinfo.pk)
+        assert values["id"] == gameinfo.pk
+        assert values["home"] == "Home"
+        assert values["score_home_overall"] == 3
+        assert values["score_away_fh"] == 1
+
+    def test_gamelog_is_read_with_two_queries(self):
+        gameinfo = DBSetup().create_teamlog_home_and_away()
+        GameLiveStateService.get(gameinfo.pk)
+        with self.assertNumQueries(2):
+            gamelog = GameLiveStateService.get_gamelog(gameinfo.pk)
+        home_entries = gamelog["teamlog_home"]
+        away_entries = gamelog["teamlog_away"]
+        assert home_entries and away_entries
+        assert {entry["team_id"] for entry in home_entries} == {gamelog["home_id"]}
+        assert {entry["team_id"] for entry in away_entries} == {gamelog["away_id"]}
+        sequences = [entry["sequence"] for entry in home_entries]
+        assert sequences == sorted(sequences, reverse=True)
@@ -0,0 +1,115 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from gamedays.models import Gameinfo, Gameresult, GameStateSnapshot, Team, TeamLog
+from gamedays.service.game_replay import GameReplay
+from gamedays.service.game_service import GameService
+from gamedays.service.gamelog import GameLog, GameLogCreator
+from gamedays.tests.setup_factories.db_setup import DBSetup
+
+
+class SmallSnapshotGameReplay(GameReplay):
+    SNAPSHOT_INTERVAL = 2
+
+
+class TestGameReplay(TestCase):
+    def setUp(self):
+        self.gameinfo = DBSetup().create_teamlog_home_and_away()
+
+    def test_replay_matches_gamelog(self):
+        state = GameReplay(self.gameinfo).replay()
+        gamelog = GameLog(self.gameinfo)
+        assert (state.home_fh, state.home_sh) == (
+            gamelog.get_home_firsthalf_score(),
+            gamelog.get_home_secondhalf_score(),
+        )
+        assert (state.away_fh, state.away_sh) == (
+            gamelog.get_away_firsthalf_score(),
+            gamelog.get_away_secondhalf_score(),
+        )
+        assert state.sequence == TeamLog.objects.order_by("-sequence").first().sequence
+
+    def test_replay_at_sequence(self):
+        state = GameReplay(self.gameinfo).replay(sequence=1)
+        assert state.sequence == 1
+        assert (state.home_score, state.away_score) == (6, 0)
+
+    def test_replay_stores_no_snapshots(self):
+        SmallSnapshotGameReplay(self.gameinfo).replay()
+        assert not GameStateSnapshot.objects.filter(gameinfo=self.gameinfo).exists()
+
+    def test_snapshots_are_created_and_used(self):
+        full_state = SmallSnapshotGameReplay(self.gameinfo).store_snapshots()
+        snapshots = GameStateSnapshot.objects.filter(gameinfo=self.gameinfo)
+        assert snapshots.exists()
+        latest_snapshot = snapshots.order_by("-sequence").first()
+        with self.assertNumQueries(3):
+            replay = SmallSnapshotGameReplay(self.gameinfo)
+            assert replay.replay() == full_state
+        assert replay._get_latest_snapshot(None).sequence == latest_snapshot.sequence
+
+    def test_snapshots_are_invalidated_by_deleted_play(self):
+        SmallSnapshotGameReplay(self.gameinfo).store_snapshots()
+        GameLog(self.gameinfo).mark_entries_as_deleted(2)
+        assert not GameStateSnapshot.objects.filter(
+            gameinfo=self.gameinfo, sequence__gte=2
+        ).exists()
+        state = SmallSnapshotGameReplay(self.gameinfo).replay()
+        assert 2 in state.deleted_sequences
+        assert state.home_score == GameLog(self.gameinfo).get_home_score()
+
+    def test_snapshots_are_ignored_after_team_change(self):
+        SmallSnapshotGameReplay(self.gameinfo).store_snapshots()
+        Gameresult.objects.filter(gameinfo=self.gameinfo, isHome=True).update(
+            team=Team.objects.create(name="new", description="new", location="x")
+        )
+        state = SmallSnapshotGameReplay(self.gameinfo).replay()
+        assert state.home_score == 0
+
+    def test_play_stores_snapshot_every_interval(self):
+        home = Gameresult.objects.get(gameinfo=self.gameinfo, isHome=True).team
+        game_service = GameService(self.gameinfo.pk)
+        gamelog = game_service.create_gamelog(
+            home.name, [{"name": "Turnover"}], self.gameinfo.gameday.author, 1
+        )
+        while gamelog.created_sequence % GameReplay.SNAPSHOT_INTERVAL:
+            assert not GameStateSnapshot.objects.filter(gameinfo=self.gameinfo).exists()
+            gamelog = game_service.create_gamelog(
+                home.name, [{"name": "Turnover"}], self.gameinfo.gameday.author, 1
+            )
+        snapshots = GameStateSnapshot.objects.filter(gameinfo=self.gameinfo)
+        assert snapshots.order_by("-sequence")[0].sequence == gamelog.created_sequence
+
+    def test_interception_changes_possession(self):
+        away = Gameresult.objects.get(gameinfo=self.gameinfo, isHome=False).team
+        GameLogCreator(
+            self.gameinfo,
+            away,
+            [{"name": "Interception"}],
+            self.gameinfo.gameday.author,
+        ).create()
+        state = GameReplay(self.gameinfo).replay()
+        assert state.possession_team_id == away.pk
+        assert state.possession_sequence == state.sequence
+
+
+class TestGameServiceScoreRepair(TestCase):
+    def test_verify_and_repair_score(self):
+        gameinfo = DBSetup().create_teamlog_home_and_away()
+        game_service = GameService(gameinfo.pk)
+        assert not game_service.verify_score()
+        assert game_service.repair_score()
+        assert game_service.verify_score()
+        assert not game_service.repair_score()
+
+    def test_repair_game_scores_command(self):
+        gameinfo = DBSetup().create_teamlog_home_and_away()
+        out = StringIO()
+        call_command("repair_game_scores", gameinfo.gameday_id, "--dry-run", stdout=out)
+        assert "Found 1 of 1 games" in out.getvalue()
+        call_command("repair_game_scores", gameinfo.gameday_id, stdout=out)
+        assert "Repaired 1 of 1 games" in out.getvalue()
+        assert GameService(gameinfo.pk).verify_score()
+        assert Gameinfo.objects.get(pk=gameinfo.pk).gameresult_set.count() == 2
@@ -1,8 +1,10 @@
 import re
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
-from gamedays.models import Team, Gameinfo, Gameresult, TeamLog
+from gamedays.models import Team, Gameinfo, Gameresult, TeamLog, GameLiveState
 from gamedays.service.game_service import GameService
 from gamedays.service.gamelog import GameLog
 from gamedays.tests.setup_factories.db_setup import DBSetup
@@ -83,3 +85,76 @@ class TestGameService(TestCase):
         gamelog = game_service.delete_gamelog(2)
         assert gamelog.get_home_score() == 34
         assert gamelog.get_home_firsthalf_score() == 13
+
+
+class TestGameServiceIncrementalScore(TestCase):
+    def setUp(self):
+        DBSetup().g62_status_empty()
+        self.team_A1 = Team.objects.get(name="A1")
+        self.team_A2 = Team.objects.get(name="A2")
+        self.game = DBSetup().create_teamlog_home_and_away(
+            home=self.team_A1, away=self.team_A2
+        )
+        self.author = self.game.gameday.author
+        self.game_service = GameService(self.game.pk)
+
+    def _scores(self):
+        return list(
+            Gameresult.objects.filter(gameinfo=self.game)
+            .order_by("-isHome")
+            .values_list("fh", "sh", "pa")
+        )
+
+    def _recomputed_scores(self):
+        scores = self._scores()
+        GameService(self.game.pk).recompute_score(GameLog(self.game))
+        recomputed_scores = self._scores()
+        return scores, recomputed_scores
+
+    def test_score_is_recomputed_if_not_synced(self):
+        gamelog = self.game_service.create_gamelog(
+            "A1", [{"name": "Touchdown", "player": "7"}], self.author, 1
+        )
+        self.game_service.update_score(gamelog)
+        assert self._scores()[0] == (27, 21, 3)
+        assert GameLiveState.objects.get(gameinfo=self.game).score_synced
+
+    def test_score_is_updated_incrementally(self):
+        self.game_service.recompute_score(GameLog(self.game))
+        gamelog = self.game_service.create_gamelog(
+            "A2",
+            [
+                {"name": "Touchdown", "player": "7"},
+                {"name": "1-Extra-Punkt", "player": "8"},
+            ],
+            self.author,
+            2,
+        )
+        with CaptureQueriesContext(connection) as queries:
+            self.game_service.update_score(gamelog)
+        assert not any(
+            "teamlog" in query["sql"].lower() and "isdeleted" in query["sql"].lower()
+            for query in queries
+        ), "gamelog entries must not be reloaded"
+        scores, recomputed_scores = self._recomputed_scores()
+        assert scores == recomputed_scores
+        assert scores[1] == (0, 10, 42)
+
+    def test_deleted_entries_are_reversed_incrementally(self):
+        self.game_service.recompute_score(GameLog(self.game))
+        gamelog = self.game_service.delete_gamelog(2)
+        self.game_service.update_score(gamelog)
+        scores, recomputed_scores = self._recomputed_scores()
+        assert scores == recomputed_scores
+        assert scores[0][0] == 13
+
+    def test_score_is_repaired_after_manual_change(self):
+        self.game_service.recompute_score(GameLog(self.game))
+        Gameresult.objects.filter(gameinfo=self.game, isHome=True).update(fh=99)
+        home = Gameresult.objects.get(gameinfo=self.game, isHome=True)
+        home.save()
+        gamelog = self.game_service.create_gamelog(
+            "A1", [{"name": "Safety (+2)", "player": "7"}], self.author, 1
+        )
+        self.game_service.update_score(gamelog)
+        assert self._scores()[0] == (23, 21, 3)
@@ -0,0 +1,49 @@
+import time
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from gamedays.models import Gameinfo, Gameresult
+from gamedays.service.gameday_data_version import GamedayDataVersion
+from gamedays.tests.setup_factories.db_setup import DBSetup
+
+
+class TestGamedayDataVersion(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_version_is_bumped_on_commit_of_game_writes(self):
+        gameday = DBSetup().g62_status_empty()
+        game = Gameinfo.objects.filter(gameday=gameday).first()
+        version = GamedayDataVersion.get(gameday.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            result = Gameresult.objects.get(gameinfo=game, isHome=True)
+            result.fh = 6
+            result.save()
+        assert GamedayDataVersion.get(gameday.pk) == version + 1
+
+    def test_version_is_not_bumped_before_commit(self):
+        gameday = DBSetup().g62_status_empty()
+        game = Gameinfo.objects.filter(gameday=gameday).first()
+        version = GamedayDataVersion.get(gameday.pk)
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            game.status = "1. Halbzeit"
+            game.save()
+        assert GamedayDataVersion.get(gameday.pk) == version
+        for callback in callbacks:
+            callback()
+        assert GamedayDataVersion.get(gameday.pk) == version + 1
+
+    def test_version_survives_cache_clear_with_new_value(self):
+        gameday = DBSetup().g62_status_empty()
+        version = GamedayDataVersion.get(gameday.pk)
+        cache.clear()
+        assert GamedayDataVersion.get(gameday.pk) != version
+
+    def test_version_expires_for_writes_of_other_processes(self):
+        gameday = DBSetup().g62_status_empty()
+        version = GamedayDataVersion.get(gameday.pk)
+        expired = time.time() + GamedayDataVersion.TIMEOUT + 1
+        with patch("time.time", return_value=expired):
+            assert GamedayDataVersion.get(gameday.pk) != version
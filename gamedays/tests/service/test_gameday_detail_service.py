@@ -0,0 +1,44 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from gamedays.service.gameday_data_version import GamedayDataVersion
+from gamedays.service.gameday_detail_service import GamedayDetailService
+from gamedays.service.gameday_service import GamedayService
+from gamedays.tests.setup_factories.db_setup import DBSetup
+
+
+class TestGamedayDetailService(TestCase):
+    def test_tables_are_cached_per_data_version(self):
+        gameday = DBSetup().g62_status_empty()
+        detail_service = GamedayDetailService(gameday.pk)
+        tables = detail_service.get_tables()
+        with patch.object(GamedayService, "create") as create:
+            with self.assertNumQueries(0):
+                cached_tables = detail_service.get_tables()
+            create.assert_not_called()
+        assert cached_tables.keys() == tables.keys()
+        assert (
+            cached_tables[GamedayDetailService.SCHEDULE]
+            == tables[GamedayDetailService.SCHEDULE]
+        )
+
+    def test_tables_are_recomputed_after_write(self):
+        gameday = DBSetup().g62_status_empty()
+        detail_service = GamedayDetailService(gameday.pk)
+        detail_service.get_tables()
+        GamedayDataVersion.bump(gameday.pk)
+        with patch.object(
+            GamedayService, "create", wraps=GamedayService.create
+        ) as create:
+            detail_service.get_tables()
+            create.assert_called_once_with(gameday.pk)
+
+    def test_cached_schedule_has_no_staff_columns(self):
+        gameday = DBSetup().g62_status_empty()
+        detail_service = GamedayDetailService(gameday.pk)
+        public_schedule = detail_service.get_tables()[GamedayDetailService.SCHEDULE]
+        staff_tables = detail_service.get_staff_tables()
+        assert "<th>id</th>" not in public_schedule
+        assert "<th>id</th>" in staff_tables[GamedayDetailService.SCHEDULE]
+        assert GamedayDetailService.PASSCHECK_INFO_TABLE in staff_tables
@@ -1,5 +1,7 @@
 import re
+import time
 from os.path import split
+from unittest.mock import patch
 
 from django.test import TestCase
 
@@ -11,6 +13,7 @@ from gamedays.service.gameday_service import (
     EmptySplitScoreTable,
     EmptyEventsTable,
 )
+from gamedays.service.gameday_settings import FINISHED
 from gamedays.service.gamelog import GameLog
 from gamedays.tests.setup_factories.db_setup import DBSetup
 
@@ -66,3 +69,59 @@ class TestGameService(TestCase):
         assert repair
         assert len(split_score_table) == 2
         assert len(split_score_table.columns) == 4
+
+    def test_gameday_game_detail_events_running_score(self):
+        gameinfo = DBSetup().create_teamlog_home_and_away()
+        ggs = GamedayGameService.create(gameinfo.pk)
+
+        rows = ggs.get_events_table().values.tolist()
+
+        assert rows[0] == ["", "<b>Spiel gestartet</b>", ""]
+        assert rows[1] == ["Touchdown #19 ", "6:0", ""]
+        assert rows[10] == ["1-Extra-Punkt  ", "42:0", ""]
+        assert rows[12] == ["", "42:2", "Safety #7 "]
+        # the score is only shown when it changed
+        assert rows[13] == ["", "", "Turnover  "]
+        assert rows[-1] == ["", "<b>Spiel beendet</b>", ""]
+
+    def test_gameday_game_detail_events_are_cached_for_finished_games(self):
+        gameinfo = DBSetup().create_teamlog_home_and_away()
+        gameinfo.status = FINISHED
+        gameinfo.save()
+        events_table = GamedayGameService.create(gameinfo.pk).get_events_table()
+
+        # queryset updates send no signals, the cached table is still served
+        TeamLog.objects.filter(gameinfo=gameinfo, event="Touchdown").update(value=0)
+        cached_table = GamedayGameService.create(gameinfo.pk).get_events_table()
+        assert cached_table.values.tolist() == events_table.values.tolist()
+
+        teamlog = TeamLog.objects.filter(gameinfo=gameinfo, event="Safety").first()
+        teamlog.save()
+        rows = GamedayGameService.create(gameinfo.pk).get_events_table().values.tolist()
+        assert rows[1] == ["Touchdown #19 ", "0:0", ""]
+
+    def test_gameday_game_detail_events_cache_expires(self):
+        gameinfo = DBSetup().create_teamlog_home_and_away()
+        gameinfo.status = FINISHED
+        gameinfo.save()
+        GamedayGameService.create(gameinfo.pk).get_events_table()
+
+        # like a write of another process, which can't delete the cached table
+        TeamLog.objects.filter(gameinfo=gameinfo, event="Touchdown").update(value=0)
+        expired = time.time() + GamedayGameService.EVENTS_TABLE_CACHE_TIMEOUT + 1
+        with patch("time.time", return_value=expired):
+            rows = (
+                GamedayGameService.create(gameinfo.pk)
+                .get_events_table()
+                .values.tolist()
+            )
+        assert rows[1] == ["Touchdown #19 ", "0:0", ""]
+
+    def test_gameday_game_detail_events_are_not_cached_for_running_games(self):
+        gameinfo = DBSetup().create_teamlog_home_and_away()
+        GamedayGameService.create(gameinfo.pk).get_events_table()
+
+        TeamLog.objects.filter(gameinfo=gameinfo, event="Touchdown").update(value=0)
+
+        rows = GamedayGameService.create(gameinfo.pk).get_events_table().values.tolist()
+        assert rows[1] == ["Touchdown #19 ", "0:0", ""]
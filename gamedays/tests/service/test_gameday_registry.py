@@ -0,0 +1,75 @@
+from django.test import TestCase
+
+from gamedays.models import Gameresult
+from gamedays.service.gameday_registry import GamedayRegistry
+from gamedays.service.gameday_service import GamedayService
+from gamedays.service.model_records import GamedayRecords
+from gamedays.service.model_wrapper import GamedayModelWrapper
+from gamedays.service.placeholder_service import GamedayPlaceholderService
+from gamedays.service.schedule_resolution_service import (
+    GamedayScheduleResolutionService,
+)
+from gamedays.tests.setup_factories.db_setup import DBSetup
+
+
+class TestGamedayRegistry(TestCase):
+    def test_without_scope_every_lookup_creates_a_new_instance(self):
+        gameday = DBSetup().g62_status_empty()
+        assert GamedayRegistry.get(
+            GamedayModelWrapper, gameday.pk
+        ) is not GamedayRegistry.get(GamedayModelWrapper, gameday.pk)
+
+    def test_instances_are_shared_within_scope(self):
+        gameday = DBSetup().g62_status_empty()
+        with GamedayRegistry.scope():
+            gmw = GamedayService.create(gameday.pk).gmw
+            with self.assertNumQueries(0):
+                assert GamedayService.create(gameday.pk).gmw is gmw
+            records = GamedayScheduleResolutionService(gameday.pk).gmw
+            assert records is GamedayRegistry.get(GamedayRecords, gameday.pk)
+            with self.assertNumQueries(0):
+                # the pandas backend behind the records is the shared one
+                assert records.get_schedule().equals(gmw.get_schedule())
+            assert GamedayRegistry.get(
+                GamedayPlaceholderService, gameday.pk
+            ) is GamedayRegistry.get(GamedayPlaceholderService, gameday.pk)
+
+    def test_write_inside_scope_invalidates_instances(self):
+        gameday = DBSetup().g62_status_empty()
+        with GamedayRegistry.scope():
+            gmw = GamedayRegistry.get(GamedayModelWrapper, gameday.pk)
+            placeholder_service = GamedayRegistry.get(
+                GamedayPlaceholderService, gameday.pk
+            )
+            gameresult = Gameresult.objects.filter(gameinfo__gameday=gameday).first()
+            gameresult.fh = 3
+            gameresult.save()
+            assert GamedayRegistry.get(GamedayModelWrapper, gameday.pk) is not gmw
+            assert (
+                GamedayRegistry.get(GamedayPlaceholderService, gameday.pk)
+                is not placeholder_service
+            )
+
+    def test_invalidate_only_drops_the_given_gameday(self):
+        first_gameday = DBSetup().g62_status_empty()
+        second_gameday = DBSetup().g62_status_empty()
+        with GamedayRegistry.scope():
+            first_gmw = GamedayRegistry.get(GamedayModelWrapper, first_gameday.pk)
+            second_gmw = GamedayRegistry.get(GamedayModelWrapper, second_gameday.pk)
+            GamedayRegistry.invalidate(first_gameday.pk)
+            assert (
+                GamedayRegistry.get(GamedayModelWrapper, second_gameday.pk)
+                is second_gmw
+            )
+            assert (
+                GamedayRegistry.get(GamedayModelWrapper, first_gameday.pk)
+                is not first_gmw
+            )
+
+    def test_nested_scope_shares_entries(self):
+        gameday = DBSetup().g62_status_empty()
+        with GamedayRegistry.scope():
+            gmw = GamedayRegistry.get(GamedayModelWrapper, gameday.pk)
+            with GamedayRegistry.scope():
+                assert GamedayRegistry.get(GamedayModelWrapper, gameday.pk) is gmw
+            assert GamedayRegistry.get(GamedayModelWrapper, gameday.pk) is gmw
@@ -0,0 +1,97 @@
+from django.test import TestCase
+
+from gamedays.models import Gameday, GamedaySnapshot, Gameinfo, Gameresult
+from gamedays.service.gameday_detail_service import GamedayDetailService
+from gamedays.service.gameday_service import GamedayGameService
+from gamedays.service.gameday_snapshot_service import GamedaySnapshotService
+from gamedays.tests.setup_factories.db_setup import DBSetup
+
+
+class TestGamedaySnapshotService(TestCase):
+    def setUp(self):
+        self.gameday = DBSetup().g62_finished()
+        # without signals, the snapshot is stored by the first visit
+        Gameday.objects.filter(pk=self.gameday.pk).update(
+            status=Gameday.STATUS_COMPLETED
+        )
+        self.gameday.refresh_from_db()
+
+    def test_tables_are_stored_on_first_visit(self):
+        tables = GamedaySnapshotService(self.gameday).get_tables()
+
+        assert tables == GamedayDetailService(self.gameday.pk).compute_tables()
+        snapshot = GamedaySnapshot.objects.get(gameday=self.gameday)
+        assert snapshot.document[GamedaySnapshotService.TABLES] == tables
+
+    def test_tables_are_served_from_snapshot(self):
+        GamedaySnapshotService(self.gameday).build()
+        GamedaySnapshot.objects.filter(gameday=self.gameday).update(
+            document={GamedaySnapshotService.TABLES: {"schedule": "frozen"}}
+        )
+
+        assert GamedaySnapshotService(self.gameday).get_tables() == {
+            "schedule": "frozen"
+        }
+
+    def test_game_recap_is_served_from_snapshot(self):
+        gameinfo = Gameinfo.objects.filter(gameday=self.gameday).first()
+        GamedaySnapshotService(self.gameday).build()
+
+        with self.assertNumQueries(1):
+            recap = GamedaySnapshotService(self.gameday).get_game_recap(gameinfo.pk)
+
+        assert recap == GamedayGameService(gameinfo.pk).get_recap()
+
+    def test_write_to_a_game_deletes_snapshot(self):
+        GamedaySnapshotService(self.gameday).build()
+
+        gameresult = Gameresult.objects.filter(gameinfo__gameday=self.gameday).first()
+        gameresult.fh = 42
+
+        with self.captureOnCommitCallbacks(execute=True):
+            gameresult.save()
+            # a visit before the commit still reads the snapshot
+            assert GamedaySnapshot.objects.filter(gameday=self.gameday).exists()
+
+        assert not GamedaySnapshot.objects.filter(gameday=self.gameday).exists()
+
+    def test_deleting_a_game_deletes_snapshot(self):
+        GamedaySnapshotService(self.gameday).build()
+        gameinfo = Gameinfo.objects.filter(gameday=self.gameday).first()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            # deletes the results and logs of the game as well
+            gameinfo.delete()
+
+        assert not GamedaySnapshot.objects.filter(gameday=self.gameday).exists()
+
+    def test_write_to_gameday_in_progress_keeps_snapshot_of_completed_state(self):
+        GamedaySnapshotService(self.gameday).build()
+        Gameday.objects.filter(pk=self.gameday.pk).update(
+            status=Gameday.STATUS_IN_PROGRESS
+        )
+        gameresult = Gameresult.objects.filter(gameinfo__gameday=self.gameday).first()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            gameresult.save()
+
+        assert GamedaySnapshot.objects.filter(gameday=self.gameday).exists()
+
+    def test_no_snapshot_for_gameday_in_progress(self):
+        self.gameday.status = Gameday.STATUS_IN_PROGRESS
+        self.gameday.save()
+
+        tables = GamedaySnapshotService(self.gameday).get_tables()
+
+        assert tables == GamedayDetailService(self.gameday.pk).get_tables()
+        assert not GamedaySnapshot.objects.exists()
+
+    def test_snapshot_is_stored_when_gameday_completes(self):
+        self.gameday.status = Gameday.STATUS_IN_PROGRESS
+        self.gameday.save()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.gameday.status = Gameday.STATUS_COMPLETED
+            self.gameday.save()
+
+        assert GamedaySnapshot.objects.filter(gameday=self.gameday).exists()
@@ -1,9 +1,12 @@
 import json
 
 from django.contrib.auth.models import User
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from gamedays.models import Team, Gameinfo, Gameresult, TeamLog
+from gamedays.service.gameday_data_version import GamedayDataVersion
 from gamedays.service.gamelog import GameLog, GameLogObject, GameLogCreator
 from gamedays.service.utils import AsJsonEncoder
 from gamedays.tests.setup_factories.db_setup import DBSetup
@@ -122,6 +125,21 @@ class TestGamelog(TestCase):
         assert gamelog.get_home_firsthalf_score() == 13
         assert gamelog.get_home_score() == 34
 
+    def test_gamelog_is_built_with_two_queries(self):
+        gameinfo = DBSetup().create_teamlog_home_and_away()
+        with self.assertNumQueries(2):
+            gamelog = GameLog(gameinfo)
+            gamelog.as_json()
+            gamelog.get_home_score()
+            gamelog.get_away_secondhalf_score()
+
+    def test_gamelog_scores_ignore_deleted_entries(self):
+        gameinfo = DBSetup().create_teamlog_home_and_away()
+        gamelog = GameLog(gameinfo)
+        score_before = gamelog.get_home_firsthalf_score()
+        gamelog.mark_entries_as_deleted(2)
+        assert gamelog.get_home_firsthalf_score() < score_before
+
 
 class TestGamelogCreator(TestCase):
     def test_gamelog_with_timeout(self):
@@ -192,3 +210,37 @@ class TestGamelogCreator(TestCase):
         assert teamlog.sequence == 1
         assert teamlog.value == 6
         assert teamlog.half == 1
+
+    def test_gamelog_entries_of_play_are_inserted_at_once(self):
+        DBSetup().g62_status_empty()
+        firstGame = Gameinfo.objects.first()
+        team = Team.objects.first()
+        user = User.objects.first()
+        play = [
+            {"name": "Touchdown", "player": "7"},
+            {"name": "2-Extra-Punkte", "player": "19"},
+            {"name": "Safety (+1)", "player": "22"},
+        ]
+        with CaptureQueriesContext(connection) as single_entry:
+            GameLogCreator(firstGame, team, play[:1], user).create()
+        with CaptureQueriesContext(connection) as multiple_entries:
+            GameLogCreator(firstGame, team, play, user).create()
+        assert len(multiple_entries) == len(single_entry)
+        assert list(
+            TeamLog.objects.filter(gameinfo=firstGame)
+            .order_by("pk")
+            .values_list("sequence", flat=True)
+        ) == [1, 2, 2, 2]
+
+    def test_gamelog_creation_bumps_gameday_data_version(self):
+        DBSetup().g62_status_empty()
+        firstGame = Gameinfo.objects.first()
+        version = GamedayDataVersion.get(firstGame.gameday_id)
+        with self.captureOnCommitCallbacks(execute=True):
+            GameLogCreator(
+                firstGame,
+                Team.objects.first(),
+                [{"name": "Touchdown", "player": "7"}],
+                User.objects.first(),
+            ).create()
+        assert GamedayDataVersion.get(firstGame.gameday_id) != version
@@ -0,0 +1,49 @@
+from django.test import TestCase
+
+from gamedays.models import Gameinfo, Gameresult
+from gamedays.service.game_service import GameService
+from gamedays.service.optimistic_lock import VersionConflict, save_with_version
+from gamedays.tests.setup_factories.db_setup import DBSetup
+
+
+class TestSaveWithVersion(TestCase):
+    def test_save_increments_version(self):
+        DBSetup().g62_status_empty()
+        gameinfo = Gameinfo.objects.first()
+        gameinfo.status = "1. Halbzeit"
+        save_with_version(gameinfo)
+        assert gameinfo.version == 1
+        stored = Gameinfo.objects.get(pk=gameinfo.pk)
+        assert (stored.status, stored.version) == ("1. Halbzeit", 1)
+
+    def test_stale_instance_raises_conflict(self):
+        DBSetup().g62_status_empty()
+        gameinfo = Gameinfo.objects.first()
+        concurrent = Gameinfo.objects.get(pk=gameinfo.pk)
+        concurrent.status = "2. Halbzeit"
+        save_with_version(concurrent)
+        gameinfo.status = "beendet"
+        with self.assertRaises(VersionConflict):
+            save_with_version(gameinfo)
+        assert Gameinfo.objects.get(pk=gameinfo.pk).status == "2. Halbzeit"
+
+    def test_expected_version_is_compared(self):
+        DBSetup().g62_status_empty()
+        gameresult = Gameresult.objects.first()
+        gameresult.fh = 7
+        with self.assertRaises(VersionConflict):
+            save_with_version(gameresult, expected_version=3)
+        save_with_version(gameresult, expected_version=0)
+        assert Gameresult.objects.get(pk=gameresult.pk).version == 1
+
+    def test_game_service_writes_increment_versions(self):
+        gameinfo = DBSetup().create_teamlog_home_and_away()
+        game_service = GameService(gameinfo.pk)
+        game_service.update_halftime(gameinfo.gameday.author)
+        game_service.update_score(game_service.get_gamelog())
+        assert Gameinfo.objects.get(pk=gameinfo.pk).version == 1
+        assert set(
+            Gameresult.objects.filter(gameinfo=gameinfo).values_list(
+                "version", flat=True
+            )
+        ) == {2}
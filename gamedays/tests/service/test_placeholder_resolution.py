@@ -3,6 +3,7 @@ from django.test import TestCase
 from gameday_designer.models import ScheduleTemplate, TemplateSlot, TemplateApplication
 from gamedays.models import Gameday, Gameinfo, Gameresult
 from gamedays.service.model_wrapper import GamedayModelWrapper
+from gamedays.service.placeholder_service import GamedayPlaceholderService
 from gamedays.tests.setup_factories.db_setup import DBSetup
 
 
@@ -103,3 +104,44 @@ class TestPlaceholderResolution(TestCase):
         )
         # For the 5th game, home_team was i-1 = 4
         assert home_placeholder == "G1_T5"
+
+    def test_slot_orders_count_games_on_the_field_up_to_their_time(self):
+        gameinfos = Gameinfo.objects.filter(gameday=self.gameday)
+        slot_orders = GamedayPlaceholderService(self.gameday.pk)._get_slot_orders()
+        for gi in gameinfos:
+            assert slot_orders[(gi.field, gi.scheduled)] == sum(
+                1
+                for other in gameinfos
+                if other.field == gi.field and other.scheduled <= gi.scheduled
+            )
+
+    def test_resolve_all_returns_placeholders_of_unresolved_results(self):
+        Gameinfo.objects.filter(gameday=self.gameday).delete()
+        gi = Gameinfo.objects.create(
+            gameday=self.gameday,
+            field=1,
+            scheduled="10:00",
+            stage="Finals",
+            standing="P1",
+            officials=self.team_a,
+        )
+        Gameresult.objects.create(gameinfo=gi, team=None, isHome=True)
+
+        placeholders = GamedayPlaceholderService(self.gameday.pk).resolve_all()
+
+        assert placeholders == {
+            (gi.pk, True): "Winner Game 1",
+            (gi.pk, False): "Winner Game 2",
+        }
+
+    def test_serializer_context_resolves_without_queries(self):
+        gi = Gameinfo.objects.filter(gameday=self.gameday).first()
+        Gameresult.objects.filter(gameinfo=gi).update(team=None)
+        context = GamedayPlaceholderService.serializer_context([self.gameday.pk])
+
+        with self.assertNumQueries(0):
+            GamedayPlaceholderService.resolve_from_context(context, gi.pk, True)
+
+        assert GamedayPlaceholderService.resolve_from_context(
+            context, gi.pk, True
+        ) == GamedayPlaceholderService.resolve_placeholder(gi.pk, True)
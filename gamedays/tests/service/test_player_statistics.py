@@ -0,0 +1,104 @@
+from django.test import TestCase
+
+from gamedays.models import Gameinfo, Team
+from gamedays.service.model_wrapper import GamedayModelWrapper
+from gamedays.service.player_statistics import GamedayPlayerStatistics
+from gamedays.tests.setup_factories.db_setup import DBSetup
+from gamedays.tests.setup_factories.factories import TeamLogFactory
+
+
+class TestGamedayPlayerStatistics(TestCase):
+    def setUp(self):
+        self.gameday = DBSetup().g62_finished()
+        games = list(Gameinfo.objects.filter(gameday=self.gameday))
+        team_a = Team.objects.get(name="A1")
+        team_b = Team.objects.get(name="B1")
+        events = [
+            (games[0], team_a, 7, "Touchdown", 6),
+            (games[0], team_a, 7, "1-Extra-Punkt", 1),
+            (games[0], team_a, 11, "Touchdown", 6),
+            (games[0], team_a, 11, "2-Extra-Punkte", 2),
+            (games[1], team_b, 3, "Touchdown", 6),
+            (games[1], team_b, 3, "Touchdown", 6),
+            (games[1], team_b, 3, "Interception", 0),
+            (games[1], team_b, 5, "Interception", 0),
+            (games[2], team_a, 7, "Interception", 0),
+            (games[2], team_a, 7, "Interception", 0),
+            (games[2], team_b, 5, "Safety (+2)", 2),
+            (games[2], team_b, 9, "Safety (+1)", 1),
+            (games[2], team_b, None, "Touchdown", 6),
+            (games[2], None, 1, "Touchdown", 6),
+        ]
+        for sequence, (gameinfo, team, player, event, value) in enumerate(events):
+            TeamLogFactory(
+                gameinfo=gameinfo,
+                team=team,
+                player=player,
+                event=event,
+                value=value,
+                sequence=sequence,
+                half=1,
+            )
+        TeamLogFactory(
+            gameinfo=games[0],
+            team=team_b,
+            player=3,
+            event="Touchdown",
+            value=6,
+            sequence=len(events),
+            half=1,
+            isDeleted=True,
+        )
+
+    def test_offense_table(self):
+        table = GamedayModelWrapper(
+            self.gameday.pk
+        ).get_offense_player_statistics_table()
+        assert list(table.columns) == [
+            "Platz",
+            "Spieler",
+            "Touchdown",
+            "1-Extra-Punkt",
+            "2-Extra-Punkte",
+            "Punkte",
+        ]
+        assert table.values.tolist() == [
+            [1, "BBBBBBB1 #3", 2, 0, 0, 12],
+            [2, "AAAAAAA1 #11", 1, 0, 1, 8],
+            [3, "AAAAAAA1 #7", 1, 1, 0, 7],
+        ]
+
+    def test_defense_table(self):
+        table = GamedayModelWrapper(self.gameday.pk).get_defense_statistic_table()
+        assert list(table.columns) == [
+            "Platz",
+            "Spieler",
+            "Interceptions",
+            "Platz",
+            "Spieler",
+            "Safety (+2)",
+        ]
+        assert table.values.tolist() == [
+            ["1", "AAAAAAA1 #7", "2", "1", "BBBBBBB1 #5", "1"],
+            ["2", "BBBBBBB1 #3", "1", "", "", ""],
+            ["2", "BBBBBBB1 #5", "1", "", "", ""],
+        ]
+
+    def test_tables_are_built_with_one_query(self):
+        gmw = GamedayModelWrapper(self.gameday.pk)
+        with self.assertNumQueries(1):
+            gmw.get_offense_player_statistics_table()
+            gmw.get_defense_statistic_table()
+
+    def test_tables_without_events(self):
+        gameday = DBSetup().g62_status_empty()
+        statistics = GamedayPlayerStatistics(gameday.pk)
+        assert statistics.get_offense_table().empty
+        assert list(statistics.get_defense_table().columns) == [
+            "Platz",
+            "Spieler",
+            "Interceptions",
+            "Platz",
+            "Spieler",
+            "Safety (+2)",
+        ]
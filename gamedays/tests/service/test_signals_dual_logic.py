@@ -33,7 +33,7 @@ class TestSignalsDualLogic(TestCase):
     @patch(
         "gamedays.service.schedule_resolution_service.GamedayScheduleResolutionService.update_participants"
     )
-    @patch("gamedays.service.model_wrapper.GamedayModelWrapper.is_finished")
+    @patch("gamedays.service.model_records.GamedayRecords.is_finished")
     def test_signal_uses_designer_logic_when_template_application_exists(
         self, is_finished_mock, res_service_mock, update_mock
     ):
@@ -0,0 +1,47 @@
+import pandas as pd
+from django.test import SimpleTestCase
+from django.utils.html import format_html
+
+from gamedays.service.gameday_service import EmptySchedule
+from gamedays.service.table_renderer import TABLE_CLASSES, TableRenderer
+
+
+class TestTableRenderer(SimpleTestCase):
+    def test_dataframe_is_rendered_escaped(self):
+        table = pd.DataFrame({"Team": ["<b>A</b>", "B & C"], "Punkte": [3, 1]})
+        html = TableRenderer.render(table, table_id="schedule")
+        assert 'id="schedule"' in html
+        assert f'class="dataframe {" ".join(TABLE_CLASSES)}"' in html
+        assert "<th>Team</th><th>Punkte</th>" in html
+        assert "<td>&lt;b&gt;A&lt;/b&gt;</td><td>3</td>" in html
+        assert "<td>B &amp; C</td><td>1</td>" in html
+
+    def test_html_columns_are_not_escaped(self):
+        table = pd.DataFrame(
+            {"Name": [format_html("<i>{}</i>", "<x>")], "Text": ["<i>y</i>"]}
+        )
+        html = TableRenderer.render(table, html_columns=["Name"])
+        assert "<td><i>&lt;x&gt;</i></td><td>&lt;i&gt;y&lt;/i&gt;</td>" in html
+
+    def test_missing_values_are_empty_cells(self):
+        table = pd.DataFrame(
+            {"a": pd.array([1, None], dtype="Int64"), "b": [1.5, float("nan")]}
+        )
+        html = TableRenderer.render(table)
+        assert "<td>1</td><td>1.5</td>" in html
+        assert "<td></td><td></td>" in html
+
+    def test_records_with_headers(self):
+        records = [{"home": "A", "away": "B", "id": 1}]
+        html = TableRenderer.render(records, columns={"home": "Heim", "away": "Gast"})
+        assert "<th>Heim</th><th>Gast</th>" in html
+        assert "<td>A</td><td>B</td>" in html
+        assert "<td>1</td>" not in html
+
+    def test_empty_records(self):
+        html = TableRenderer.render([], justify="center")
+        assert "<thead>" in html
+        assert "<td>" not in html
+
+    def test_empty_tables_render_themselves(self):
+        assert TableRenderer.render(EmptySchedule()) == "None"
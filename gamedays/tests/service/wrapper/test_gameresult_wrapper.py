@@ -23,6 +23,17 @@ class TestGameresultWrapper(TestCase):
         assert first_away.sh == 16
         assert first_away.pa == 20
 
+    def test_saved_score_increments_version(self):
+        DBSetup().g62_status_empty()
+        first_game = Gameinfo.objects.first()
+        version = Gameresult.objects.get(gameinfo=first_game, isHome=True).version
+        gameresult_wrapper = GameresultWrapper(first_game)
+        gameresult_wrapper.save_home_first_half(12, 9)
+        gameresult_wrapper.save_home_second_half(8, 16)
+        first_home = Gameresult.objects.get(gameinfo=first_game, isHome=True)
+        assert first_home.version == version + 2
+        assert first_home.pa == 25
+
     def test_get_team_names(self):
         DBSetup().g62_status_empty()
         last_game = Gameinfo.objects.last()
@@ -1,6 +1,5 @@
 from datetime import datetime
 
-import pandas as pd
 from django.apps import apps
 from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
@@ -45,11 +44,12 @@ from .forms import (
     SCHEDULE_CUSTOM_CHOICE_C,
 )
 from .models import Gameday, Gameinfo
-from .service.builders import TableContextBuilder
+from .service.gameday_detail_service import GamedayDetailService
 from .service.gameday_form_service import GamedayFormService
-from .service.gameday_service import GamedayService, GamedayGameService, EmptySchedule
-from .service.gameday_settings import ID
+from .service.gameday_service import GamedayGameService
+from .service.gameday_snapshot_service import GamedaySnapshotService
 from .service.league_statistics_service import LeagueStatisticsService
+from .service.table_renderer import TableRenderer
 from .wizard import (
     FIELD_GROUP_STEP,
     GAMEDAY_FORMAT_STEP,
@@ -103,20 +103,6 @@ class GamedayLeagueStatisticView(TemplateView):
         context["season_year_league_pattern"] = LEAGUE_GAMEDAY_LIST_AND_YEAR_AND_LEAGUE
         context = {**context, **kwargs}
 
-        render_configs = {
-            "index": False,
-            "classes": [
-                "table",
-                "table-hover",
-                "table-condensed",
-                "table-responsive",
-                "text-center",
-            ],
-            "border": 0,
-            "justify": "center",
-            "escape": False,
-        }
-
         lss = LeagueStatisticsService.create(**kwargs, top_n_players=10)
 
         td_table = lss.get_touchdowns_table()
@@ -128,13 +114,27 @@ class GamedayLeagueStatisticView(TemplateView):
         team_statistics_table = lss.get_team_event_summary_table()
 
         context["info"] = {
-            "player_touchdown_table": td_table.to_html(**render_configs),
-            "player_interception_table": int_table.to_html(**render_configs),
-            "player_one_extra_point_table": one_xp_table.to_html(**render_configs),
-            "player_two_extra_point_table": two_xp_table.to_html(**render_configs),
-            "player_safety_table": safety_table.to_html(**render_configs),
-            "player_scoring_table": scoring_players_table.to_html(**render_configs),
-            "team_statistics_table": team_statistics_table.to_html(**render_configs),
+            "player_touchdown_table": TableRenderer.render(
+                td_table, justify="center"
+            ),
+            "player_interception_table": TableRenderer.render(
+                int_table, justify="center"
+            ),
+            "player_one_extra_point_table": TableRenderer.render(
+                one_xp_table, justify="center"
+            ),
+            "player_two_extra_point_table": TableRenderer.render(
+                two_xp_table, justify="center"
+            ),
+            "player_safety_table": TableRenderer.render(
+                safety_table, justify="center"
+            ),
+            "player_scoring_table": TableRenderer.render(
+                scoring_players_table, justify="center"
+            ),
+            "team_statistics_table": TableRenderer.render(
+                team_statistics_table, justify="center"
+            ),
         }
 
         return context
@@ -147,28 +147,16 @@ class GamedayDetailView(DetailView):
     def get_context_data(self, **kwargs):
         context = super(GamedayDetailView, self).get_context_data()
         gameday = context["gameday"]
-        gs = GamedayService.create(gameday.pk)
-        render_configs = {
-            "index": False,
-            "classes": [
-                "table",
-                "table-hover",
-                "table-condensed",
-                "table-responsive",
-                "text-center",
-            ],
-            "border": 0,
-            "justify": "left",
-            "escape": False,
-            "table_id": "schedule",
-        }
-        qualify_table = gs.get_qualify_table()
+        tables = GamedaySnapshotService(gameday).get_tables()
         if "officials" in settings.INSTALLED_APPS:
             show_official_names = False
             if self.request.user.is_staff:
                 show_official_names = True
             elif self.request.user.username:
-                show_official_names = self.request.user.username in qualify_table
+                show_official_names = (
+                    self.request.user.username
+                    in tables[GamedayDetailService.QUALIFY_TABLE_COLUMNS]
+                )
             from officials.service.signup_service import OfficialSignupService
 
             officials = OfficialSignupService.get_signed_up_officials(
@@ -185,10 +173,7 @@ class GamedayDetailView(DetailView):
             url_pattern_official = ''
             url_pattern_official_signup = ''
 
-        final_table = gs.get_final_table()
         if apps.is_installed("league_table"):
-            qualify_table = TableContextBuilder.build(qualify_table)
-            final_table = TableContextBuilder.build(final_table)
             season_slug = gameday.season.slug
             league_slug = gameday.league.slug
             if season_slug and league_slug:
@@ -215,32 +200,22 @@ class GamedayDetailView(DetailView):
                     url_pattern_official = ""
                     url_pattern_official_signup = ""
 
-        else:
-            qualify_table = qualify_table.to_html(**render_configs)
-            final_table = final_table.to_html(**render_configs)
-
+        schedule = tables[GamedayDetailService.SCHEDULE]
         passcheck_info_table = ""
-
-        schedule = gs.get_schedule()
         if self.request.user.is_staff:
-            passcheck_info_table = gs.get_staff_passcheck_details().to_html(
-                **render_configs
-            )
-        else:
-            if not isinstance(schedule, EmptySchedule):
-                del schedule[ID]
+            staff_tables = GamedayDetailService(gameday.pk).get_staff_tables()
+            schedule = staff_tables[GamedayDetailService.SCHEDULE]
+            passcheck_info_table = staff_tables[
+                GamedayDetailService.PASSCHECK_INFO_TABLE
+            ]
 
         context["info"] = {
-            "schedule": schedule.to_html(**render_configs),
-            "qualify_table": qualify_table,
-            "final_table": final_table,
+            "schedule": schedule,
+            "qualify_table": tables[GamedayDetailService.QUALIFY_TABLE],
+            "final_table": tables[GamedayDetailService.FINAL_TABLE],
             "officials": officials,
-            "offense_table": gs.get_offense_player_statistics_table().to_html(
-                **render_configs
-            ),
-            "defense_table": gs.get_defense_player_statistic_table().to_html(
-                **render_configs
-            ),
+            "offense_table": tables[GamedayDetailService.OFFENSE_TABLE],
+            "defense_table": tables[GamedayDetailService.DEFENSE_TABLE],
             "passcheck_info_table": passcheck_info_table,
             "url_pattern_official": url_pattern_official,
             "url_pattern_official_signup": url_pattern_official_signup,
@@ -333,52 +308,15 @@ class GamedayGameDetailView(DetailView):
     def get_context_data(self, **kwargs):
         context = super(GamedayGameDetailView, self).get_context_data()
         gameinfo = context["gameinfo"]
-        ggs = GamedayGameService(gameinfo.pk)
-        render_configs = {
-            "index": False,
-            "border": 0,
-            "justify": "center",
-            "escape": False,
-            "table_id": "team_log_events",
-        }
-        classes = [
-            "table",
-            "table-hover",
-            "table-condensed",
-            "table-responsive",
-            "text-center",
-        ]
-
-        split_score_table, split_score_repaired = ggs.get_split_score_table()
-
-        split_score_table_html = split_score_table.to_html(
-            **{**render_configs, "classes": classes + ["game-split-score-table"]}
-        )
-
         game_setup_details = {}
 
         if self.request.user.is_staff:
-            game_setup_details = ggs.get_staff_game_end_notes()
+            game_setup_details = GamedayGameService(
+                gameinfo.pk
+            ).get_staff_game_end_notes()
 
-        if split_score_repaired:
-            split_score_table_html = f"""{split_score_table_html}</ br>
-<small>Die Aufteilung der Punkte je Halbzeit kann eventuell inkorrekt sein.</small>"""
-
-        events_table = ggs.get_events_table()
         context["info"] = {
-            "away_team": ggs.away_team_name,
-            "home_team": ggs.home_team_name,
-            "events_table": (
-                events_table.to_html(
-                    **{
-                        **render_configs,
-                        "classes": classes + ["game-log-table"],
-                    }
-                )
-                if isinstance(events_table, pd.DataFrame)
-                else events_table.to_html()  # EventsTableError.to_html() returns plain text
-            ),
-            "split_score_table": split_score_table_html,
+            **GamedaySnapshotService(gameinfo.gameday).get_game_recap(gameinfo.pk),
             "game_setup_details": game_setup_details,
         }
         return context
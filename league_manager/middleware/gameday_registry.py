@@ -0,0 +1,12 @@
+from gamedays.service.gameday_registry import GamedayRegistry
+
+
+class GamedayRegistryMiddleware:
+    """Opens a GamedayRegistry scope, so every gameday is loaded once per request."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with GamedayRegistry.scope():
+            return self.get_response(request)
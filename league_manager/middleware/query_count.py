@@ -0,0 +1,32 @@
+from contextlib import ExitStack
+
+from django.db import connections
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+
+
+class QueryCountMiddleware:
+    """
+    Reports the number of database queries of a request in the X-DB-Query-Count header.
+
+    Used by the load tests in locust_testing to track the query count per endpoint.
+    Enabled with the environment variable QUERY_COUNT_HEADER=true.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        query_count = 0
+
+        def count_query(execute, sql, params, many, context):
+            nonlocal query_count
+            query_count += 1
+            return execute(sql, params, many, context)
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(count_query))
+            response = self.get_response(request)
+        response[QUERY_COUNT_HEADER] = query_count
+        return response
@@ -54,8 +54,17 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "league_manager.middleware.gameday_registry.GamedayRegistryMiddleware",
 ]
 
+if os.environ.get("QUERY_COUNT_HEADER", "false").lower() == "true":
+    MIDDLEWARE = [
+        "league_manager.middleware.query_count.QueryCountMiddleware",
+    ] + MIDDLEWARE
+
+# LocMemCache is per process: writes of other processes (management commands, further
+# gunicorn workers) reach the cached gameday data only after GamedayDataVersion.TIMEOUT.
+# Serve with more than one process only with a shared backend.
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
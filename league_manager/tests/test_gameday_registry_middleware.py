@@ -0,0 +1,22 @@
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from gamedays.service.gameday_registry import GamedayRegistry
+from league_manager.middleware.gameday_registry import GamedayRegistryMiddleware
+
+
+def test_registry_scope_is_open_during_request():
+    created = []
+
+    def factory(gameday_id):
+        created.append(gameday_id)
+        return object()
+
+    def view(request):
+        assert GamedayRegistry.get(factory, 1) is GamedayRegistry.get(factory, 1)
+        return HttpResponse()
+
+    GamedayRegistryMiddleware(view)(RequestFactory().get("/"))
+    assert created == [1]
+    GamedayRegistry.get(factory, 1)
+    assert created == [1, 1]
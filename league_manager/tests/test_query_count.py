@@ -0,0 +1,27 @@
+import pytest
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from league_manager.middleware.query_count import (
+    QueryCountMiddleware,
+    QUERY_COUNT_HEADER,
+)
+
+
+@pytest.mark.django_db
+def test_query_count_header_reports_queries_of_request():
+    def view(request):
+        User.objects.count()
+        User.objects.exists()
+        return HttpResponse()
+
+    response = QueryCountMiddleware(view)(RequestFactory().get("/"))
+    assert response[QUERY_COUNT_HEADER] == "2"
+
+
+def test_query_count_header_without_queries():
+    response = QueryCountMiddleware(lambda request: HttpResponse())(
+        RequestFactory().get("/")
+    )
+    assert response[QUERY_COUNT_HEADER] == "0"
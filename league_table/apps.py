@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class LeagueTableConfig(AppConfig):
     name = "league_table"
+
+    def ready(self):
+        # noinspection PyUnresolvedReferences
+        import league_table.service.signals
@@ -0,0 +1,111 @@
+import random
+from statistics import mean
+from time import perf_counter
+
+import pandas as pd
+from django.core.management.base import BaseCommand
+
+from league_table.service.datatypes import LeagueConfig
+from league_table.service.ranking.engine import LeagueRankingEngine, TieBreakerEngine
+from league_table.tests.setup_factories.db_setup_leaguetable import (
+    LEAGUE_TABLE_TEST_RULESET,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures the league ranking of generated multi-division standings, "
+        "where most teams of a division share their win quotient"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--teams",
+            nargs="+",
+            type=int,
+            default=[100, 250, 500],
+            help="Teams per division",
+        )
+        parser.add_argument("--divisions", type=int, default=4)
+        parser.add_argument("--games", type=int, default=2, help="Games per team")
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, **options):
+        league_config = LeagueConfig(
+            ruleset=LEAGUE_TABLE_TEST_RULESET,
+            team_point_adjustments_map=[],
+            excluded_gameday_ids=[],
+            leagues_for_league_points_ids=[],
+            group_by_leagues=True,
+        )
+        self.stdout.write(
+            f"{'teams':>6} {'largest tie':>12} {'ranking':>12} {'rank assignment':>16}"
+        )
+        for number_teams in options["teams"]:
+            games = self._create_games(
+                options["divisions"], number_teams, options["games"]
+            )
+            engine = LeagueRankingEngine(league_config)
+            table = engine.compute_league_table(games)
+            largest_tie = table.groupby(["standing", "win_quotient"]).size().max()
+            ranking = self._measure(lambda: engine.rank(games), options["repeat"])
+
+            tb_engine = TieBreakerEngine(league_config.ruleset)
+            ranked = tb_engine.rank(table, games)
+            assignment = self._measure(
+                lambda: [
+                    tb_engine._assign_ranks_in_group(group.copy())
+                    for _, group in ranked.groupby("standing")
+                ],
+                options["repeat"],
+            )
+            self.stdout.write(
+                f"{number_teams * options['divisions']:>6} {largest_tie:>12} "
+                f"{ranking:>9.1f} ms {assignment:>13.1f} ms"
+            )
+
+    @staticmethod
+    def _measure(func, repeat: int) -> float:
+        durations = []
+        for _ in range(repeat):
+            start = perf_counter()
+            func()
+            durations.append(perf_counter() - start)
+        return mean(durations) * 1000
+
+    @staticmethod
+    def _create_games(divisions: int, number_teams: int, games_per_team: int):
+        rng = random.Random(number_teams)
+        rows = []
+        gameinfo = 0
+        for league_id in range(1, divisions + 1):
+            team_ids = [league_id * 10000 + i for i in range(number_teams)]
+            for round_number in range(games_per_team):
+                rng.shuffle(team_ids)
+                for home, away in zip(team_ids[::2], team_ids[1::2]):
+                    gameinfo += 1
+                    # few different scores, so most teams share their win quotient
+                    home_points, away_points = rng.choice([(14, 7), (7, 14), (7, 7)])
+                    for team_id, pf, pa, is_home in (
+                        (home, home_points, away_points, True),
+                        (away, away_points, home_points, False),
+                    ):
+                        rows.append(
+                            {
+                                "gameinfo": gameinfo,
+                                "team_id": team_id,
+                                "team__description": f"team {team_id}",
+                                "fh": pf,
+                                "sh": 0,
+                                "pa": pa,
+                                "pf": pf,
+                                "isHome": is_home,
+                                "gameinfo__standing": f"Runde {round_number}",
+                                "gameinfo__status": "beendet",
+                                "league_id": league_id,
+                                "league__name": f"Division {league_id}",
+                                "opponent_team_id": away if is_home else home,
+                                "opponent_league_id": league_id,
+                            }
+                        )
+        return pd.DataFrame(rows)
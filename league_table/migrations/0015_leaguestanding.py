@@ -0,0 +1,40 @@
+# Generated by Django 6.0.4 on 2026-10-17 05:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gamedays', '0039_gamedaysnapshot'),
+        ('league_table', '0014_leagueseasonconfig_allow_officials_to_register_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeagueStanding',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('standing', models.CharField(max_length=100)),
+                ('pf', models.IntegerField(default=0)),
+                ('pa', models.IntegerField(default=0)),
+                ('wins', models.IntegerField(default=0)),
+                ('draws', models.IntegerField(default=0)),
+                ('losses', models.IntegerField(default=0)),
+                ('games_played', models.IntegerField(default=0)),
+                ('win_points', models.FloatField(default=0)),
+                ('max_win_points', models.FloatField(default=0)),
+                ('win_quotient', models.FloatField(default=0)),
+                ('rank', models.PositiveIntegerField(null=True)),
+                ('position', models.PositiveIntegerField(default=0)),
+                ('tie_breaks', models.JSONField(default=dict)),
+                ('league_season_config', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='standings', to='league_table.leagueseasonconfig')),
+                ('team', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='gamedays.team')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['league_season_config', 'standing', 'position'], name='league_tabl_league__527725_idx')],
+                'constraints': [models.UniqueConstraint(fields=('league_season_config', 'team'), name='unique_league_standing_team')],
+            },
+        ),
+    ]
@@ -74,9 +74,9 @@ class LeagueRuleset(models.Model):
                 "key": league_ruleset_tiebreak.step.key,
                 "is_ascending": league_ruleset_tiebreak.sort_order == "ascending",
             }
-            for league_ruleset_tiebreak in self.leaguerulesettiebreak_set.all().order_by(
-                "order"
-            )
+            for league_ruleset_tiebreak in self.leaguerulesettiebreak_set.select_related(
+                "step"
+            ).order_by("order")
         ]
 
     def __str__(self):
@@ -222,3 +222,41 @@ class TeamPointAdjustments(models.Model):
 
     def __str__(self):
         return f"{self.team.description}: {self.sum_points} -> {self.tie_step_for_sum_points} ### {self.league_season_config}"
+
+
+class LeagueStanding(models.Model):
+    """Aggregated results and rank of a team in a league season, see LeagueTableService."""
+
+    league_season_config = models.ForeignKey(
+        LeagueSeasonConfig, on_delete=models.CASCADE, related_name="standings"
+    )
+    team = models.ForeignKey(Team, on_delete=models.CASCADE)
+    standing = models.CharField(max_length=100)
+    pf = models.IntegerField(default=0)
+    pa = models.IntegerField(default=0)
+    wins = models.IntegerField(default=0)
+    draws = models.IntegerField(default=0)
+    losses = models.IntegerField(default=0)
+    games_played = models.IntegerField(default=0)
+    win_points = models.FloatField(default=0)
+    max_win_points = models.FloatField(default=0)
+    win_quotient = models.FloatField(default=0)
+    rank = models.PositiveIntegerField(null=True)
+    # order of the team inside its standing group, teams may share a rank
+    position = models.PositiveIntegerField(default=0)
+    # values of the tie-break steps which are not aggregates, from the last ranking
+    tie_breaks = models.JSONField(default=dict)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["league_season_config", "team"],
+                name="unique_league_standing_team",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["league_season_config", "standing", "position"]),
+        ]
+
+    def __str__(self):
+        return f"{self.league_season_config_id}__{self.standing}#{self.rank} {self.team_id}"
@@ -1,10 +1,27 @@
 from typing import Any
 
 import pandas as pd
+from django.db import transaction
 from django.db.models import QuerySet, F
 
-from gamedays.models import Gameresult, SeasonLeagueTeam
-from league_table.models import LeagueSeasonConfig
+from gamedays.models import Gameinfo, Gameresult, SeasonLeagueTeam
+from gamedays.service.gameday_settings import (
+    DIFF,
+    DRAWS,
+    GAMES_PLAYED,
+    LOSSES,
+    MAX_WIN_POINTS,
+    PA,
+    PF,
+    RANK,
+    STANDING,
+    TEAM_DESCRIPTION,
+    TEAM_ID,
+    WIN_POINTS,
+    WIN_QUOTIENT,
+    WINS,
+)
+from league_table.models import LeagueSeasonConfig, LeagueStanding
 from league_table.service.datatypes import LeagueConfig
 from league_table.service.leaguetable_repository import LeagueTableRepository
 from league_table.service.ranking.engine import LeagueRankingEngine, TieBreakerEngine
@@ -23,8 +40,47 @@ LEAGUE_TABLE_GAME_COLUMNS = [
 
 LEAGUE_TABLE_TEAM_AND_LEAGUE_COLUMNS = ["teams__id", "league_id", "teams__description", "league__name"]
 
+LEAGUE_STANDING_COLUMNS = [
+    TEAM_ID,
+    TEAM_DESCRIPTION,
+    PF,
+    PA,
+    WINS,
+    DRAWS,
+    LOSSES,
+    GAMES_PLAYED,
+    STANDING,
+    DIFF,
+    WIN_QUOTIENT,
+    WIN_POINTS,
+    MAX_WIN_POINTS,
+]
+LEAGUE_STANDING_AGGREGATES = [
+    PF,
+    PA,
+    WINS,
+    DRAWS,
+    LOSSES,
+    GAMES_PLAYED,
+    STANDING,
+    WIN_QUOTIENT,
+    WIN_POINTS,
+    MAX_WIN_POINTS,
+]
+POSITION = "position"
+TIE_BREAKS = "tie_breaks"
+
 
 class LeagueTableService:
+    """
+    League table of a league season.
+
+    The standing is stored as one LeagueStanding row per team, a page view only reads
+    these rows. The first view computes and stores the whole standing. When a game is
+    finished or its score is corrected, only the teams of the game are aggregated again
+    and only their standing groups are ranked again (see update_standings_for_game).
+    Changes of the configuration or of the teams delete the stored standing.
+    """
 
     def __init__(self, league_season_config: LeagueSeasonConfig | None):
         self.league_season_config = league_season_config
@@ -40,32 +96,22 @@ class LeagueTableService:
             return cls(None)
 
     def get_standing(self):
+        if self.league_season_config is None:
+            return self.compute_standing()
+        standings = LeagueTableRepository.get_standings(self.league_season_config)
+        if not standings:
+            final_league_table = self.compute_standing()
+            self._store_standing(final_league_table)
+            return final_league_table
+        return self._standings_to_dataframe(standings)
+
+    def compute_standing(self):
         try:
             if self.league_season_config is None:
                 raise LeagueSeasonConfig.DoesNotExist
             league_config = LeagueConfig.from_league_season_config(self.league_season_config)
-            current_season = self.league_season_config.season
-            results = (
-                Gameresult.objects.filter(
-                    gameinfo__gameday__season=current_season,
-                    gameinfo__gameday__league=self.league_season_config.league,
-                    gameinfo__status="beendet",
-                )
-                # .exclude(gameinfo__gameday__gte=627)
-                .exclude(gameinfo__gameday__in=league_config.excluded_gameday_ids)
-                .select_related("gameinfo", "team")
-                .values(*LEAGUE_TABLE_GAME_COLUMNS)
-            )
-            team_and_league_ids = (
-                SeasonLeagueTeam.objects.filter(
-                    season=current_season,
-                    league__in=league_config.leagues_for_league_points_ids,
-                )
-                .values(*LEAGUE_TABLE_TEAM_AND_LEAGUE_COLUMNS)
-                .annotate(
-                    team_id=F("teams__id"), team__description=F("teams__description")
-                )
-            )
+            results = self._get_results(league_config)
+            team_and_league_ids = self._get_team_and_league_ids(league_config)
             if not team_and_league_ids.exists():
                 raise SeasonLeagueTeam.DoesNotExist
             games_with_results = self._get_games_with_results_as_dataframe(
@@ -82,6 +128,222 @@ class LeagueTableService:
             final_league_table["standing"] = None
         return final_league_table
 
+    @classmethod
+    def update_standings_for_game_on_commit(cls, gameinfo_id: int) -> None:
+        transaction.on_commit(lambda: cls.update_standings_for_game(gameinfo_id))
+
+    @classmethod
+    def update_standings_for_game(cls, gameinfo_id: int) -> None:
+        """Updates the stored standings, which contain the given game."""
+        gameday = (
+            Gameinfo.objects.filter(pk=gameinfo_id)
+            .values("gameday_id", "gameday__season_id", "gameday__league_id")
+            .first()
+        )
+        if gameday is None:
+            return
+        team_ids = list(
+            Gameresult.objects.filter(gameinfo_id=gameinfo_id).values_list(
+                "team_id", flat=True
+            )
+        )
+        for league_season_config in LeagueTableRepository.get_league_season_configs_with_standings(
+            gameday["gameday__season_id"],
+            gameday["gameday__league_id"],
+            gameday["gameday_id"],
+        ):
+            cls(league_season_config).update_standing(team_ids)
+
+    @transaction.atomic
+    def update_standing(self, team_ids: list[int]) -> None:
+        """Aggregates the given teams again and ranks their standing groups again."""
+        league_config = LeagueConfig.from_league_season_config(self.league_season_config)
+        team_and_league_ids = self._get_team_and_league_ids(league_config)
+        # all games of the teams, the other teams are not aggregated
+        games_with_results = self._get_games_with_results_as_dataframe(
+            self._get_results(league_config, team_ids), team_and_league_ids
+        )
+        league_table = LeagueRankingEngine(league_config).compute_league_table(
+            games_with_results
+        )
+        if league_table.empty:
+            return
+        league_table = league_table[league_table[TEAM_ID].isin(team_ids)]
+        standings = {
+            standing.team_id: standing
+            for standing in LeagueStanding.objects.select_for_update().filter(
+                league_season_config=self.league_season_config,
+                team_id__in=league_table[TEAM_ID].tolist(),
+            )
+        }
+        if len(standings) != len(league_table):
+            # the teams of the league changed, the next view stores all teams again
+            self.delete_standing()
+            return
+        groups = {standing.standing for standing in standings.values()}
+        for row in league_table.to_dict(orient="records"):
+            standing = standings[row[TEAM_ID]]
+            for column in LEAGUE_STANDING_AGGREGATES:
+                setattr(standing, column, self._to_json_value(row[column]))
+            groups.add(standing.standing)
+        LeagueStanding.objects.bulk_update(
+            standings.values(), LEAGUE_STANDING_AGGREGATES
+        )
+        for group in sorted(groups):
+            self._rank_standing_group(league_config, team_and_league_ids, group)
+
+    def delete_standing(self) -> None:
+        LeagueTableRepository.delete_standings(
+            league_season_config=self.league_season_config
+        )
+
+    def _rank_standing_group(
+        self,
+        league_config: LeagueConfig,
+        team_and_league_ids: QuerySet,
+        group: str,
+    ) -> None:
+        standings = LeagueTableRepository.get_standings_of_group(
+            self.league_season_config, group
+        )
+        if not standings:
+            return
+        group_table = pd.DataFrame(standings)
+        group_table[DIFF] = group_table[PF] - group_table[PA]
+        team_ids = group_table[TEAM_ID].tolist()
+        # the direct comparisons only need the games of the group's teams
+        games_with_results = self._get_games_with_results_as_dataframe(
+            self._get_results(league_config, team_ids), team_and_league_ids
+        )
+        ranked = TieBreakerEngine(league_config.ruleset).rank(
+            group_table[LEAGUE_STANDING_COLUMNS], games_with_results
+        )
+        tie_break_keys = self._get_tie_break_keys(
+            league_config.ruleset.tie_break_order
+        )
+        pks = dict(zip(group_table[TEAM_ID], group_table["pk"]))
+        LeagueStanding.objects.bulk_update(
+            [
+                LeagueStanding(
+                    pk=pks[row[TEAM_ID]],
+                    rank=row[RANK],
+                    position=position,
+                    tie_breaks={
+                        key: self._to_json_value(row[key]) for key in tie_break_keys
+                    },
+                )
+                for position, row in enumerate(
+                    ranked.to_dict(orient="records"), start=1
+                )
+            ],
+            [RANK, POSITION, TIE_BREAKS],
+        )
+
+    @transaction.atomic
+    def _store_standing(self, final_league_table: pd.DataFrame) -> None:
+        if final_league_table.empty:
+            return
+        tie_break_keys = [
+            column
+            for column in final_league_table.columns
+            if column not in LEAGUE_STANDING_COLUMNS and column != RANK
+        ]
+        positions = final_league_table.groupby(STANDING).cumcount() + 1
+        self.delete_standing()
+        LeagueStanding.objects.bulk_create(
+            [
+                LeagueStanding(
+                    league_season_config=self.league_season_config,
+                    team_id=row[TEAM_ID],
+                    rank=row[RANK],
+                    position=position,
+                    tie_breaks={
+                        key: self._to_json_value(row[key]) for key in tie_break_keys
+                    },
+                    **{
+                        column: self._to_json_value(row[column])
+                        for column in LEAGUE_STANDING_AGGREGATES
+                    },
+                )
+                for row, position in zip(
+                    final_league_table.to_dict(orient="records"), positions
+                )
+            ]
+        )
+
+    def _standings_to_dataframe(self, standings: list[dict]) -> pd.DataFrame:
+        table = pd.DataFrame(standings)
+        table[DIFF] = table[PF] - table[PA]
+        tie_break_keys = self._get_tie_break_keys(
+            self.league_season_config.ruleset.tie_break_order()
+        )
+        for key in tie_break_keys:
+            table[key] = pd.Series(
+                [
+                    pd.NA if tie_breaks.get(key) is None else tie_breaks[key]
+                    for tie_breaks in table[TIE_BREAKS]
+                ],
+                index=table.index,
+                dtype=object,
+            )
+        # same order as the computed standing, the teams are already sorted
+        table = table.sort_values(by=[STANDING, POSITION], kind="stable")
+        return table[LEAGUE_STANDING_COLUMNS + tie_break_keys + [RANK]].reset_index(
+            drop=True
+        )
+
+    @staticmethod
+    def _get_tie_break_keys(tie_break_order: list[dict]) -> list[str]:
+        return [
+            step["key"]
+            for step in tie_break_order
+            if step["key"] not in LEAGUE_STANDING_COLUMNS
+        ]
+
+    @staticmethod
+    def _to_json_value(value):
+        if pd.isna(value):
+            return None
+        # numpy scalars are not serializable
+        return value.item() if hasattr(value, "item") else value
+
+    def _get_results(
+        self, league_config: LeagueConfig, team_ids: list[int] | None = None
+    ) -> QuerySet[Gameresult, dict[str, Any]]:
+        results = (
+            Gameresult.objects.filter(
+                gameinfo__gameday__season=self.league_season_config.season,
+                gameinfo__gameday__league=self.league_season_config.league,
+                gameinfo__status="beendet",
+            )
+            # .exclude(gameinfo__gameday__gte=627)
+            .exclude(gameinfo__gameday__in=league_config.excluded_gameday_ids)
+        )
+        if team_ids is not None:
+            results = results.filter(
+                gameinfo__in=Gameresult.objects.filter(team_id__in=team_ids).values(
+                    "gameinfo"
+                )
+            )
+        # the first game of a team defines its standing
+        return (
+            results.select_related("gameinfo", "team")
+            .order_by("pk")
+            .values(*LEAGUE_TABLE_GAME_COLUMNS)
+        )
+
+    def _get_team_and_league_ids(self, league_config: LeagueConfig) -> QuerySet:
+        return (
+            SeasonLeagueTeam.objects.filter(
+                season=self.league_season_config.season,
+                league__in=league_config.leagues_for_league_points_ids,
+            )
+            .values(*LEAGUE_TABLE_TEAM_AND_LEAGUE_COLUMNS)
+            .annotate(
+                team_id=F("teams__id"), team__description=F("teams__description")
+            )
+        )
+
     def _get_games_with_results_as_dataframe(
         self,
         results: QuerySet[Gameresult, dict[str, Any]],
@@ -2,7 +2,25 @@ from typing import Any
 
 from django.db.models import QuerySet, Min, F
 
-from league_table.models import LeagueSeasonConfig
+from league_table.models import LeagueSeasonConfig, LeagueStanding
+
+LEAGUE_STANDING_FIELDS = [
+    "team_id",
+    "team__description",
+    "pf",
+    "pa",
+    "wins",
+    "draws",
+    "losses",
+    "games_played",
+    "standing",
+    "win_quotient",
+    "win_points",
+    "max_win_points",
+    "rank",
+    "position",
+    "tie_breaks",
+]
 
 
 class LeagueTableRepository:
@@ -34,3 +52,40 @@ class LeagueTableRepository:
             .order_by("-season__name")
             .values_list("season__name", flat=True)
         )
+
+    @staticmethod
+    def get_standings(league_season_config: LeagueSeasonConfig) -> list[dict]:
+        return list(
+            LeagueStanding.objects.filter(league_season_config=league_season_config)
+            .order_by("standing", "position")
+            .values(*LEAGUE_STANDING_FIELDS)
+        )
+
+    @staticmethod
+    def get_standings_of_group(
+        league_season_config: LeagueSeasonConfig, standing: str
+    ) -> list[dict]:
+        return list(
+            LeagueStanding.objects.filter(
+                league_season_config=league_season_config, standing=standing
+            )
+            .order_by("team_id")
+            .values("pk", *LEAGUE_STANDING_FIELDS)
+        )
+
+    @staticmethod
+    def get_league_season_configs_with_standings(
+        season_id: int, league_id: int, gameday_id: int
+    ) -> QuerySet[LeagueSeasonConfig]:
+        return (
+            LeagueSeasonConfig.objects.filter(
+                season_id=season_id, league_id=league_id, standings__isnull=False
+            )
+            .exclude(exclude_gamedays=gameday_id)
+            .select_related("ruleset")
+            .distinct()
+        )
+
+    @staticmethod
+    def delete_standings(**filters) -> None:
+        LeagueStanding.objects.filter(**filters).delete()
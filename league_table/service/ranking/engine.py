@@ -1,5 +1,6 @@
 # gamedays/services/ranking/engine.py
 
+import numpy as np
 import pandas as pd
 
 from gamedays.service.gameday_settings import (
@@ -30,7 +31,11 @@ from gamedays.service.gameday_settings import (
     FINALRUNDE,
 )
 from league_table.service.datatypes import LeagueConfig, LeagueConfigRuleset
-from league_table.service.ranking.tiebreakers import TieBreaker, TIEBREAK_REGISTRY
+from league_table.service.ranking.tiebreakers import (
+    HeadToHead,
+    TieBreaker,
+    TIEBREAK_REGISTRY,
+)
 
 
 class TeamStatsEngine:
@@ -279,11 +284,13 @@ class TieBreakerEngine:
 
     def rank(self, standings_df: pd.DataFrame, games_df: pd.DataFrame) -> pd.DataFrame:
         games_df = games_df.fillna({FH: 0, SH: 0, PA: 0})
+        # the direct comparisons of all tied groups are read from the same matrices
+        head_to_head = HeadToHead(games_df)
 
         # Compute tiebreakers inside each standing group
         ranked_groups = []
         for standing, group_df in standings_df.groupby(STANDING):
-            ranked_groups.append(self._rank_group(group_df.copy(), games_df))
+            ranked_groups.append(self._rank_group(group_df.copy(), head_to_head))
 
         result = pd.concat(ranked_groups, ignore_index=True)
 
@@ -299,99 +306,69 @@ class TieBreakerEngine:
     # -------------------------------------------------------------------------
     # INTERNALS
     # -------------------------------------------------------------------------
-    def _rank_group(self, df: pd.DataFrame, games_df: pd.DataFrame) -> pd.DataFrame:
-        updated = []
-
-        for points, tied_df in df.groupby(WIN_QUOTIENT, dropna=False):
-            tied_df = tied_df.copy()
-            for tb in self.tie_breakers:
-                if tb.key not in tied_df.columns:
-                    tied_df[tb.key] = pd.NA
-
-            # If only one team → no tie → no tiebreak needed
-            if len(tied_df) == 1:
-                tied_df[RANK] = None  # temp, set later
-                updated.append(tied_df)
-                continue
-
-            # Apply tiebreakers to tied teams
-            tied_df = self._apply_tiebreakers(tied_df, games_df)
-
-            updated.append(tied_df)
-
-        # Merge all subsets back into one group again
-        merged = pd.concat(updated, ignore_index=True)
+    def _rank_group(self, df: pd.DataFrame, head_to_head: HeadToHead) -> pd.DataFrame:
+        added_keys = [tb.key for tb in self.tie_breakers if tb.key not in df.columns]
+        for key in added_keys:
+            df[key] = pd.NA
+
+        # Teams with the same win quotient are tied, a single team needs no tiebreak
+        df = df.sort_values(by=WIN_QUOTIENT, kind="stable", ignore_index=True)
+        is_tied = df[WIN_QUOTIENT].duplicated(keep=False)
+        for points, tied_df in df[is_tied].groupby(
+            WIN_QUOTIENT, dropna=False, sort=False
+        ):
+            self._apply_tiebreakers(df, tied_df, head_to_head)
+        # without untied teams, the columns keep the dtypes of the computed values
+        for key in added_keys:
+            if df[key].notna().all():
+                df[key] = df[key].infer_objects()
 
         # Sort inside the tied group
         sort_keys = [tb.key for tb in self.tie_breakers]
         asc_list = [tb.ascending for tb in self.tie_breakers]
 
-        merged = merged.sort_values(by=sort_keys, ascending=asc_list, ignore_index=True)
+        df = df.sort_values(
+            by=sort_keys, ascending=asc_list, kind="stable", ignore_index=True
+        )
 
         # Assign final ranks inside this standing group
-        merged[RANK] = self._assign_ranks_in_group(merged)
+        df[RANK] = self._assign_ranks_in_group(df)
 
-        return merged
+        return df
 
     def _apply_tiebreakers(
-        self, df: pd.DataFrame, games_df: pd.DataFrame
-    ) -> pd.DataFrame:
-        tied_ids = df[TEAM_ID].tolist()
+        self, df: pd.DataFrame, tied_df: pd.DataFrame, head_to_head: HeadToHead
+    ) -> None:
+        tied_ids = tied_df[TEAM_ID].tolist()
 
         for tb in self.tie_breakers:
             # Compute only the tiebreakers that are actually in use
-            df[tb.key] = tb.apply(df, games_df, tied_ids)
-
-        return df
+            df.loc[tied_df.index, tb.key] = tb.apply(tied_df, head_to_head, tied_ids)
 
     def _assign_ranks_in_group(self, df: pd.DataFrame) -> pd.Series:
         """
-        Assign ranks within a group:
+        Assign ranks within a group sorted by the tiebreakers:
         - Teams fully tied except for 'name_ascending' share a rank.
         - name_ascending orders them but does NOT break the tie.
-        - Next rank skips exactly by number of teams above.
+        - Next rank skips exactly by number of teams above (1,1,1,4 style).
         """
 
         tiebreak_cols = [tb.key for tb in self.tie_breakers]
 
         # If last tiebreaker is name_ascending, it does NOT define unique ranking
         if tiebreak_cols and tiebreak_cols[-1] == NAME_ASCENDING:
-            # Collapse: remove name_ascending from tuple
             collapse_cols = tiebreak_cols[:-1]
         else:
             collapse_cols = tiebreak_cols
 
-        # Create a tuple defining "tie groups"
-        df["_tb_tuple"] = df[collapse_cols].apply(lambda r: tuple(r.values), axis=1)
-
-        # Assign collapsed-rank group numbers (1,2,3,...)
-        # preserve ordering in df
-        unique_tuples = list(dict.fromkeys(df["_tb_tuple"]))  # preserves order
-        group_rank_map = {tpl: idx + 1 for idx, tpl in enumerate(unique_tuples)}
-
-        df["_group_rank"] = df["_tb_tuple"].map(group_rank_map)
-
-        # Now compute final rank = size-aware ranking (1,1,1,4 style)
-        ranks = []
-        current_rank = 1
-        prev_group_rank = None
-
-        for _, row in df.iterrows():
-            group_rank = row["_group_rank"]
-
-            if prev_group_rank is None:
-                # first row always rank 1
-                ranks.append(current_rank)
-            elif group_rank != prev_group_rank:
-                # new group → increase rank by number of teams in previous group
-                current_rank = len([r for r in ranks if r == ranks[-1]]) + ranks[-1]
-                ranks.append(current_rank)
-            else:
-                # same collapsed tiebreak group → same rank
-                ranks.append(current_rank)
-
-            prev_group_rank = group_rank
+        # Missing values are equal, like the pd.NA of untied teams
+        values = df[collapse_cols].to_numpy(dtype=object)
+        values[pd.isna(values)] = None
 
-        df.drop(columns=["_tb_tuple", "_group_rank"], inplace=True)
+        # A team starts a new tie group, if a tiebreak value differs from the team above
+        starts_group = np.ones(len(df), dtype=bool)
+        starts_group[1:] = (values[1:] != values[:-1]).any(axis=1)
 
-        return pd.Series(ranks, index=df.index)
+        # Each team gets the position of the first team of its tie group
+        positions = np.where(starts_group, np.arange(1, len(df) + 1), 0)
+        return pd.Series(np.maximum.accumulate(positions), index=df.index)
@@ -1,5 +1,6 @@
 from typing import Callable
 
+import numpy as np
 import pandas as pd
 
 from gamedays.service.gameday_settings import (
@@ -25,13 +26,90 @@ def register_tiebreak(key):
     return wrapper
 
 
+class HeadToHead:
+    """
+    Results of the direct games between teams as team x team matrices.
+
+    Only games with exactly two participants are direct games. The matrices are built
+    once per ranking, a direct tiebreaker only sums the rows and columns of the tied
+    teams instead of filtering the games again for every tied group.
+    """
+
+    WINS = "wins"
+    POINT_DIFF = "point_diff"
+    POINTS_SCORED = "points_scored"
+
+    def __init__(self, games_df: pd.DataFrame):
+        games = games_df[
+            games_df.groupby(GAMEINFO)[TEAM_ID].transform("size") == 2
+        ].sort_values(by=GAMEINFO, kind="stable")
+        team_ids = games[TEAM_ID].to_numpy()
+        # the rows of a game are next to each other, each row's opponent is the other
+        opponent_ids = team_ids.reshape(-1, 2)[:, ::-1].ravel()
+        self.teams = pd.Index(pd.unique(team_ids))
+        rows = self.teams.get_indexer(team_ids)
+        columns = self.teams.get_indexer(opponent_ids)
+
+        points_scored = (games[FH] + games[SH]).to_numpy()
+        points_against = games[PA].to_numpy()
+        self.played = self._to_matrix(rows, columns, np.ones(len(games), dtype=int))
+        self.metrics = {
+            self.WINS: self._to_matrix(
+                rows, columns, (points_scored > points_against).astype(int)
+            ),
+            self.POINT_DIFF: self._to_matrix(
+                rows, columns, points_scored - points_against
+            ),
+            self.POINTS_SCORED: self._to_matrix(rows, columns, points_scored),
+        }
+
+    @classmethod
+    def of(cls, games: "pd.DataFrame | HeadToHead") -> "HeadToHead":
+        return games if isinstance(games, HeadToHead) else cls(games)
+
+    def _to_matrix(
+        self, rows: np.ndarray, columns: np.ndarray, values: np.ndarray
+    ) -> np.ndarray:
+        matrix = np.zeros((len(self.teams), len(self.teams)), dtype=values.dtype)
+        np.add.at(matrix, (rows, columns), values)
+        return matrix
+
+    def all_played_each_other(self, tied_teams: list[int]) -> bool:
+        """
+        Checks if every team in the tied group has played against every
+        other team in the tied group at least once.
+        """
+        if len(tied_teams) <= 1:
+            return True
+        positions = self.teams.get_indexer(tied_teams)
+        if (positions < 0).any():
+            return False
+        played = self.played[np.ix_(positions, positions)] > 0
+        np.fill_diagonal(played, True)
+        return bool(played.all())
+
+    def get_metric(
+        self, df: pd.DataFrame, tied_teams: list[int], metric: str
+    ) -> pd.Series:
+        """Sums the metric of each team over its direct games against tied teams."""
+        tied_positions = self.teams.get_indexer(tied_teams)
+        tied_positions = tied_positions[tied_positions >= 0]
+        matrix = self.metrics[metric]
+        totals = matrix[:, tied_positions].sum(axis=1, dtype=matrix.dtype)
+
+        positions = self.teams.get_indexer(df[TEAM_ID])
+        values = np.zeros(len(df), dtype=totals.dtype)
+        values[positions >= 0] = totals[positions[positions >= 0]]
+        return pd.Series(values, index=df.index, name=TEAM_ID)
+
+
 class TieBreaker:
     """Represents one tiebreak rule that can be applied to a DataFrame."""
 
     def __init__(
         self,
         key: str,
-        func: Callable[[pd.DataFrame, pd.DataFrame, list[int]], pd.Series],
+        func: Callable[[pd.DataFrame, HeadToHead | pd.DataFrame, list[int]], pd.Series],
         ascending: bool = False,
     ):
         self.key = key
@@ -39,7 +117,7 @@ class TieBreaker:
         self.ascending = ascending
 
     def apply(
-        self, df: pd.DataFrame, games: pd.DataFrame, tied_teams: list[int]
+        self, df: pd.DataFrame, games: HeadToHead | pd.DataFrame, tied_teams: list[int]
     ) -> pd.Series:
         return self.func(df, games, tied_teams)
 
@@ -47,94 +125,42 @@ class TieBreaker:
         return f"TieBreaker(key='{self.key}', func={self.func}, ascending={self.ascending})"
 
 
-def _subset_direct_games(games_df: pd.DataFrame, tied_teams: list[int]) -> pd.DataFrame:
-    """Return only the rows for games where BOTH participants are in the tied group."""
-    tied_set = set(tied_teams)
-
-    # We group by gameinfo and keep only the groups (games) where
-    # both team_ids belong to our tied_set.
-    return games_df.groupby(GAMEINFO).filter(
-        lambda x: len(x) == 2 and set(x[TEAM_ID]).issubset(tied_set)
-    )
-
-
-def _all_played_each_other(games_df: pd.DataFrame, tied_teams: list[int]) -> bool:
-    """
-    Checks if every team in the tied group has played against every
-    other team in the tied group at least once.
-    """
-    if len(tied_teams) <= 1:
-        return True
-
-    subset = _subset_direct_games(games_df, tied_teams)
-    tied_set = set(tied_teams)
-
-    for team in tied_teams:
-        # Find all game IDs this specific team participated in WITHIN the tied subset
-        team_game_ids = subset[subset[TEAM_ID] == team][GAMEINFO].unique()
-
-        # Find all unique team_ids that appeared in those games
-        participants = set(
-            subset[subset[GAMEINFO].isin(team_game_ids)][TEAM_ID].unique()
-        )
-
-        # If the participants for this team don't cover the whole tied group, return False
-        if not tied_set.issubset(participants):
-            return False
-
-    return True
-
-
-def _map_direct_metric(df: pd.DataFrame, subset: pd.DataFrame, compute_fn) -> pd.Series:
-    """
-    Reusable mapper:
-    compute_fn(game_row) returns numerical contribution for that team.
-    """
-    result = {team_id: 0 for team_id in df[TEAM_ID]}
-
-    for _, game in subset.iterrows():
-        result[game[TEAM_ID]] += compute_fn(game)
-
-    return df[TEAM_ID].map(result).fillna(0)
+def _map_direct_metric(
+    df: pd.DataFrame,
+    games: HeadToHead | pd.DataFrame,
+    tied_teams: list[int],
+    metric: str,
+) -> pd.Series:
+    """Sums the metric over the direct games, if all tied teams played each other."""
+    head_to_head = HeadToHead.of(games)
+    if not head_to_head.all_played_each_other(tied_teams):
+        # Fall-through: give everyone 0 so this tiebreaker has no effect
+        return pd.Series(0, index=df.index)
+    return head_to_head.get_metric(df, tied_teams, metric)
 
 
 @register_tiebreak("direct_wins")
 def compute_direct_wins(
-    df: pd.DataFrame, games_df: pd.DataFrame, tied_teams: list[int]
+    df: pd.DataFrame, games: HeadToHead | pd.DataFrame, tied_teams: list[int]
 ) -> pd.Series:
     """Count wins against tied teams, ONLY if all tied teams played each other."""
-    if not _all_played_each_other(games_df, tied_teams):
-        # Fall-through: give everyone 0 so this tiebreaker has no effect
-        return pd.Series(0, index=df.index)
-
-    subset = _subset_direct_games(games_df, tied_teams)
-    return _map_direct_metric(
-        df, subset, lambda g: 1 if (g[FH] + g[SH]) > g[PA] else 0
-    )
+    return _map_direct_metric(df, games, tied_teams, HeadToHead.WINS)
 
 
 @register_tiebreak("direct_point_diff")
 def compute_direct_point_diff(
-    df: pd.DataFrame, games_df: pd.DataFrame, tied_teams: list[int]
+    df: pd.DataFrame, games: HeadToHead | pd.DataFrame, tied_teams: list[int]
 ) -> pd.Series:
     """Sum point diff vs tied teams, ONLY if all tied teams played each other."""
-    if not _all_played_each_other(games_df, tied_teams):
-        return pd.Series(0, index=df.index)
-
-    subset = _subset_direct_games(games_df, tied_teams)
-    return _map_direct_metric(df, subset, lambda g: (g[FH] + g[SH]) - g[PA])
+    return _map_direct_metric(df, games, tied_teams, HeadToHead.POINT_DIFF)
 
 
 @register_tiebreak("direct_points_scored")
 def compute_direct_points_scored(
-    df: pd.DataFrame, games_df: pd.DataFrame, tied_teams: list[int]
+    df: pd.DataFrame, games: HeadToHead | pd.DataFrame, tied_teams: list[int]
 ) -> pd.Series:
     """Sum points scored vs tied teams, ONLY if all tied teams played each other."""
-    if not _all_played_each_other(games_df, tied_teams):
-        return pd.Series(0, index=df.index)
-
-    subset = _subset_direct_games(games_df, tied_teams)
-    return _map_direct_metric(df, subset, lambda g: g[FH] + g[SH])
+    return _map_direct_metric(df, games, tied_teams, HeadToHead.POINTS_SCORED)
 
 
 @register_tiebreak("overall_point_diff")
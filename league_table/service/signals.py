@@ -0,0 +1,178 @@
+from django.db import transaction
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from gamedays.models import Gameday, Gameinfo, Gameresult, SeasonLeagueTeam, Team
+from league_table.models import (
+    LeagueRuleset,
+    LeagueRulesetTieBreak,
+    LeagueSeasonConfig,
+    TeamPointAdjustments,
+    TieBreakStep,
+)
+from league_table.service.league_table_service import LeagueTableService
+from league_table.service.leaguetable_repository import LeagueTableRepository
+
+
+def _delete_standings_of_gameday(gameday_id: int) -> None:
+    gameday = (
+        Gameday.objects.filter(pk=gameday_id).values("season_id", "league_id").first()
+    )
+    if gameday is not None:
+        LeagueTableRepository.delete_standings(
+            league_season_config__season_id=gameday["season_id"],
+            league_season_config__league_id=gameday["league_id"],
+        )
+
+
+@receiver(pre_save, sender=Gameinfo)
+def remember_finished_game(sender, instance: Gameinfo, **kwargs):
+    instance._was_finished = (
+        instance.pk is not None
+        and instance.status != Gameinfo.STATUS_COMPLETED
+        and Gameinfo.objects.filter(
+            pk=instance.pk, status=Gameinfo.STATUS_COMPLETED
+        ).exists()
+    )
+
+
+@receiver(post_save, sender=Gameinfo)
+def update_standings_for_gameinfo(sender, instance: Gameinfo, **kwargs):
+    # a reopened game has to be removed from the standings as well
+    if instance.status == Gameinfo.STATUS_COMPLETED or getattr(
+        instance, "_was_finished", False
+    ):
+        LeagueTableService.update_standings_for_game_on_commit(instance.pk)
+
+
+@receiver(post_save, sender=Gameresult)
+def update_standings_for_gameresult(sender, instance: Gameresult, **kwargs):
+    if Gameinfo.objects.filter(
+        pk=instance.gameinfo_id, status=Gameinfo.STATUS_COMPLETED
+    ).exists():
+        LeagueTableService.update_standings_for_game_on_commit(instance.gameinfo_id)
+
+
+# the games still exist before they are deleted
+@receiver(pre_delete, sender=Gameinfo)
+def delete_standings_for_gameinfo(sender, instance: Gameinfo, **kwargs):
+    _delete_standings_of_gameday(instance.gameday_id)
+
+
+@receiver(pre_delete, sender=Gameresult)
+def delete_standings_for_gameresult(sender, instance: Gameresult, **kwargs):
+    gameday_id = (
+        Gameinfo.objects.filter(pk=instance.gameinfo_id)
+        .values_list("gameday_id", flat=True)
+        .first()
+    )
+    _delete_standings_of_gameday(gameday_id)
+
+
+@receiver(pre_save, sender=Gameday)
+def delete_standings_for_moved_gameday(sender, instance: Gameday, **kwargs):
+    if instance.pk is None:
+        return
+    if not Gameday.objects.filter(
+        pk=instance.pk, season_id=instance.season_id, league_id=instance.league_id
+    ).exists():
+        _delete_standings_of_gameday(instance.pk)
+        transaction.on_commit(lambda: _delete_standings_of_gameday(instance.pk))
+
+
+@receiver(post_save, sender=LeagueSeasonConfig)
+def delete_standings_for_league_season_config(
+    sender, instance: LeagueSeasonConfig, **kwargs
+):
+    LeagueTableRepository.delete_standings(league_season_config=instance)
+
+
+@receiver(m2m_changed, sender=LeagueSeasonConfig.exclude_gamedays.through)
+@receiver(m2m_changed, sender=LeagueSeasonConfig.leagues_for_league_points.through)
+def delete_standings_for_league_season_config_relations(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        LeagueTableRepository.delete_standings(league_season_config=instance)
+    elif pk_set is None:
+        # the configs of a cleared gameday or league are unknown
+        LeagueTableRepository.delete_standings()
+    else:
+        LeagueTableRepository.delete_standings(league_season_config_id__in=pk_set)
+
+
+@receiver(post_save, sender=TeamPointAdjustments)
+@receiver(post_delete, sender=TeamPointAdjustments)
+def delete_standings_for_team_point_adjustments(
+    sender, instance: TeamPointAdjustments, **kwargs
+):
+    LeagueTableRepository.delete_standings(
+        league_season_config_id=instance.league_season_config_id
+    )
+
+
+@receiver(post_save, sender=LeagueRuleset)
+def delete_standings_for_ruleset(sender, instance: LeagueRuleset, **kwargs):
+    LeagueTableRepository.delete_standings(league_season_config__ruleset=instance)
+
+
+@receiver(post_save, sender=LeagueRulesetTieBreak)
+@receiver(post_delete, sender=LeagueRulesetTieBreak)
+def delete_standings_for_tie_break(sender, instance: LeagueRulesetTieBreak, **kwargs):
+    LeagueTableRepository.delete_standings(
+        league_season_config__ruleset_id=instance.ruleset_id
+    )
+
+
+@receiver(post_save, sender=TieBreakStep)
+def delete_standings_for_tie_break_step(sender, instance: TieBreakStep, **kwargs):
+    LeagueTableRepository.delete_standings(
+        league_season_config__ruleset__tie_break_steps=instance
+    )
+
+
+@receiver(post_save, sender=SeasonLeagueTeam)
+@receiver(post_delete, sender=SeasonLeagueTeam)
+def delete_standings_for_season_league_team(
+    sender, instance: SeasonLeagueTeam, **kwargs
+):
+    LeagueTableRepository.delete_standings(
+        league_season_config__season_id=instance.season_id
+    )
+
+
+@receiver(m2m_changed, sender=SeasonLeagueTeam.teams.through)
+def delete_standings_for_season_league_teams(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        LeagueTableRepository.delete_standings(
+            league_season_config__season_id=instance.season_id
+        )
+    elif pk_set is None:
+        LeagueTableRepository.delete_standings()
+    else:
+        LeagueTableRepository.delete_standings(
+            league_season_config__season__in=SeasonLeagueTeam.objects.filter(
+                pk__in=pk_set
+            ).values("season")
+        )
+
+
+@receiver(post_save, sender=Team)
+def delete_standings_for_team(sender, instance: Team, created, **kwargs):
+    # the name of a team may decide its rank
+    if not created:
+        LeagueTableRepository.delete_standings(
+            league_season_config__standings__team=instance
+        )
@@ -107,6 +107,26 @@ class TestTieBreakEngine:
 
         assert result.to_csv() == expected_result.to_csv()
 
+    def test_teams_tied_except_for_name_share_rank(self):
+        engine = TieBreakerEngine(LEAGUE_TABLE_TEST_RULESET)
+        sorted_group = pd.DataFrame(
+            {
+                "win_quotient": [1.0, 0.5, 0.5, 0.5, 0.5, 0.0],
+                "direct_wins": [pd.NA, 1, 1, 1, 0, pd.NA],
+                "direct_point_diff": [pd.NA, 7, 7, 7, -21, pd.NA],
+                "direct_points_scored": [pd.NA, 14, 14, 14, 0, pd.NA],
+                "overall_point_diff": [pd.NA, 7, 7, 7, -21, pd.NA],
+                "overall_points_scored": [pd.NA, 14, 14, 14, 0, pd.NA],
+                "name_ascending": ["a", "b", "c", "d", "e", "f"],
+            },
+            index=[3, 1, 4, 0, 5, 2],
+        )
+
+        ranks = engine._assign_ranks_in_group(sorted_group)
+
+        assert ranks.tolist() == [1, 2, 2, 2, 5, 6]
+        assert ranks.index.tolist() == [3, 1, 4, 0, 5, 2]
+
 
 class TestLeagueRankingEngine:
     def test_league_ranking_engine_with_league_points(self):
@@ -0,0 +1,122 @@
+import itertools
+import pathlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gamedays.service.gameday_settings import FH, GAMEINFO, PA, SH, TEAM_ID
+from league_table.service.ranking.tiebreakers import (
+    HeadToHead,
+    compute_direct_point_diff,
+    compute_direct_points_scored,
+    compute_direct_wins,
+)
+
+BASE = pathlib.Path(__file__).parent / "testdata/tiebreak"
+
+
+# the row based implementation, which the head-to-head matrices replace
+def _reference_subset_direct_games(games_df, tied_teams):
+    tied_set = set(tied_teams)
+    return games_df.groupby(GAMEINFO).filter(
+        lambda x: len(x) == 2 and set(x[TEAM_ID]).issubset(tied_set)
+    )
+
+
+def _reference_all_played_each_other(games_df, tied_teams):
+    if len(tied_teams) <= 1:
+        return True
+    subset = _reference_subset_direct_games(games_df, tied_teams)
+    tied_set = set(tied_teams)
+    for team in tied_teams:
+        team_game_ids = subset[subset[TEAM_ID] == team][GAMEINFO].unique()
+        participants = set(
+            subset[subset[GAMEINFO].isin(team_game_ids)][TEAM_ID].unique()
+        )
+        if not tied_set.issubset(participants):
+            return False
+    return True
+
+
+def _reference_direct_metric(compute_fn):
+    def compute(df, games_df, tied_teams):
+        if not _reference_all_played_each_other(games_df, tied_teams):
+            return pd.Series(0, index=df.index)
+        result = {team_id: 0 for team_id in df[TEAM_ID]}
+        for _, game in _reference_subset_direct_games(games_df, tied_teams).iterrows():
+            result[game[TEAM_ID]] += compute_fn(game)
+        return df[TEAM_ID].map(result).fillna(0)
+
+    return compute
+
+
+DIRECT_TIEBREAKERS = [
+    (
+        compute_direct_wins,
+        _reference_direct_metric(lambda g: 1 if (g[FH] + g[SH]) > g[PA] else 0),
+    ),
+    (
+        compute_direct_point_diff,
+        _reference_direct_metric(lambda g: (g[FH] + g[SH]) - g[PA]),
+    ),
+    (
+        compute_direct_points_scored,
+        _reference_direct_metric(lambda g: g[FH] + g[SH]),
+    ),
+]
+
+
+def _random_games(seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    rows = []
+    for gameinfo, (home, away) in enumerate(
+        itertools.combinations(range(1, 7), 2), start=1
+    ):
+        # some pairs never met, some met twice
+        for repetition in range(rng.integers(0, 3)):
+            home_points, away_points = rng.integers(0, 5, size=2) * 7
+            game_id = gameinfo * 10 + repetition
+            rows.append([game_id, home, home_points, 0, away_points])
+            rows.append([game_id, away, away_points, 0, home_points])
+    # a game with only one known participant is no direct game
+    rows.append([999, 1, 14, 0, 0])
+    games = pd.DataFrame(rows, columns=[GAMEINFO, TEAM_ID, FH, SH, PA])
+    return games.sample(frac=1, random_state=seed, ignore_index=True)
+
+
+def _assert_equivalent(games: pd.DataFrame):
+    team_ids = sorted(games[TEAM_ID].unique())
+    head_to_head = HeadToHead(games)
+    for size in range(1, len(team_ids) + 1):
+        for tied_teams in itertools.combinations(team_ids, size):
+            tied_teams = list(tied_teams)
+            df = pd.DataFrame({TEAM_ID: tied_teams}, index=range(10, 10 + size))
+            for compute, reference in DIRECT_TIEBREAKERS:
+                expected = reference(df, games, tied_teams)
+                pd.testing.assert_series_equal(
+                    compute(df, head_to_head, tied_teams), expected
+                )
+                pd.testing.assert_series_equal(compute(df, games, tied_teams), expected)
+
+
+@pytest.mark.parametrize(
+    "games_file",
+    # the empty games have no teams to compare
+    [path.name for path in sorted(BASE.glob("*_games.csv")) if path.name[0] != "0"],
+)
+def test_direct_tiebreakers_are_equivalent_for_test_games(games_file):
+    _assert_equivalent(pd.read_csv(BASE / games_file).fillna({FH: 0, SH: 0, PA: 0}))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_direct_tiebreakers_are_equivalent_for_random_games(seed):
+    _assert_equivalent(_random_games(seed))
+
+
+def test_teams_without_direct_games_did_not_play_each_other():
+    games = _random_games(0)
+    head_to_head = HeadToHead(games)
+
+    assert head_to_head.all_played_each_other([1])
+    assert not head_to_head.all_played_each_other([1, 42])
@@ -0,0 +1,107 @@
+import pandas as pd
+from django.test import TestCase
+
+from gamedays.models import Gameinfo, Gameresult, SeasonLeagueTeam, Team
+from gamedays.tests.setup_factories.db_setup import DBSetup
+from league_table.models import (
+    LeagueRulesetTieBreak,
+    LeagueSeasonConfig,
+    LeagueStanding,
+)
+from league_table.service.league_table_service import LeagueTableService
+from league_table.tests.setup_factories.db_setup_leaguetable import (
+    LEAGUE_TABLE_TEST_RULESET,
+)
+from league_table.tests.setup_factories.factories_leaguetable import (
+    LeagueRulesetFactory,
+    TieBreakStepFactory,
+)
+
+
+class TestLeagueTableService(TestCase):
+    def setUp(self):
+        self.gameday = DBSetup().g62_finished()
+        ruleset = LeagueRulesetFactory()
+        for order, step in enumerate(LEAGUE_TABLE_TEST_RULESET.tie_break_order):
+            LeagueRulesetTieBreak.objects.create(
+                ruleset=ruleset,
+                step=TieBreakStepFactory(key=step["key"]),
+                order=order,
+                sort_order="ascending" if step["is_ascending"] else "descending",
+            )
+        self.config = LeagueSeasonConfig.objects.create(
+            league=self.gameday.league, season=self.gameday.season, ruleset=ruleset
+        )
+        self.config.leagues_for_league_points.add(self.gameday.league)
+        season_league_team = SeasonLeagueTeam.objects.create(
+            season=self.gameday.season, league=self.gameday.league
+        )
+        season_league_team.teams.set(Team.objects.all())
+
+    def _get_service(self) -> LeagueTableService:
+        return LeagueTableService(LeagueSeasonConfig.objects.get(pk=self.config.pk))
+
+    def _assert_stored_standing_is_computed_standing(self):
+        stored = self._get_service().get_standing()
+        computed = self._get_service().compute_standing()
+        pd.testing.assert_frame_equal(
+            stored.astype(object), computed.astype(object), check_dtype=False
+        )
+
+    def test_standing_is_stored_by_first_view(self):
+        computed = self._get_service().get_standing()
+
+        assert LeagueStanding.objects.filter(
+            league_season_config=self.config
+        ).count() == len(computed)
+        self._assert_stored_standing_is_computed_standing()
+
+    def test_stored_standing_is_read_with_few_queries(self):
+        self._get_service().get_standing()
+        service = self._get_service()
+
+        with self.assertNumQueries(3):
+            service.get_standing()
+
+    def test_corrected_score_updates_standing(self):
+        self._get_service().get_standing()
+        gameresult = Gameresult.objects.filter(
+            gameinfo__gameday=self.gameday, isHome=True
+        ).first()
+        gameresult.sh = 42
+
+        with self.captureOnCommitCallbacks(execute=True):
+            gameresult.save()
+
+        standing = LeagueStanding.objects.get(
+            league_season_config=self.config, team=gameresult.team
+        )
+        assert (
+            standing.pf
+            == self._get_service()
+            .compute_standing()
+            .set_index("team_id")
+            .loc[gameresult.team_id, "pf"]
+        )
+        self._assert_stored_standing_is_computed_standing()
+
+    def test_reopened_game_is_removed_from_standing(self):
+        self._get_service().get_standing()
+        gameinfo = Gameinfo.objects.filter(gameday=self.gameday).first()
+        gameinfo.status = Gameinfo.STATUS_IN_PROGRESS
+
+        with self.captureOnCommitCallbacks(execute=True):
+            gameinfo.save()
+
+        assert LeagueStanding.objects.filter(league_season_config=self.config).exists()
+        self._assert_stored_standing_is_computed_standing()
+
+    def test_changed_configuration_deletes_standing(self):
+        self._get_service().get_standing()
+
+        self.config.exclude_gamedays.add(self.gameday)
+
+        assert not LeagueStanding.objects.filter(
+            league_season_config=self.config
+        ).exists()
+        self._assert_stored_standing_is_computed_standing()
@@ -2,6 +2,7 @@ from django.shortcuts import render
 from django.views import View
 
 from gamedays.service.builders import TableContextBuilder
+from gamedays.service.table_renderer import TableRenderer
 from league_table.constants import LEAGUE_TABLE_OVERALL_TABLE_BY_SLUG_AND_LEAGUE
 from league_table.service.league_table_service import LeagueTableService
 
@@ -32,21 +33,11 @@ class LeagueScheduleView(View):
 
     def get(self, request, *args, **kwargs):
         gss = LeagueTableService(None)
-        render_configs = {
-            "index": False,
-            "classes": [
-                "table",
-                "table-hover",
-                "table-condensed",
-                "table-responsive",
-                "text-center",
-            ],
-            "border": 0,
-            "justify": "left",
-            "escape": False,
-            "table_id": "schedule",
-        }
         context = {
-            "info": {"schedule": gss.get_all_schedules().to_html(**render_configs)}
+            "info": {
+                "schedule": TableRenderer.render(
+                    gss.get_all_schedules(), table_id="schedule"
+                )
+            }
         }
         return render(request, self.template_name, context)
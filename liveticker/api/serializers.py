@@ -8,8 +8,11 @@ class TeamlogSerializer(Serializer):
     INPUT = "input"
     CREATED_TIME = "created_time"
     TEAM_NAME = "team__name"
-    ALL_VALUE_FIELDS = [EVENT, PLAYER, INPUT, CREATED_TIME, TEAM_NAME]
+    ID = "id"
+    ALL_VALUE_FIELDS = [EVENT, PLAYER, INPUT, CREATED_TIME, TEAM_NAME, ID]
 
+    # clients remove the ticks which are listed as deleted by their id
+    id = IntegerField(read_only=True)
     text = SerializerMethodField()
     team = SerializerMethodField()
     time = SerializerMethodField()
@@ -54,6 +57,7 @@ class LivetickerSerializer(Serializer):
     SCORE_AWAY = "score_away"
     IN_POSSESSION = "in_possession"
     TEAMLOG = "teamlog"
+    TICKS = "ticks"
     ALL_VALUE_FIELDS = [
         "status",
         "standing",
@@ -1,5 +1,5 @@
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
@@ -7,19 +7,49 @@ from liveticker.service.liveticker_service import LivetickerService
 
 
 class LivetickerAPIView(APIView):
-    @method_decorator(cache_page(60))
+    CURSOR_HEADER = "X-Liveticker-Cursor"
+
     def get(self, request):
-        league = request.query_params.get("league")
-        league = [] if league is None or league == "" else league.split(",")
+        league = self._parse_league(request.query_params.get("league"))
         games_with_all_ticks = self._parse_input(
             request.query_params.get("getAllTicksFor")
         )
         gameday_ids = self._parse_input(request.query_params.get("gameday"))
+        since, since_headers = self._parse_cursor(request.query_params.get("since"))
         liveticker_service = LivetickerService(
-            league, games_with_all_ticks, gameday_ids
+            league, games_with_all_ticks, gameday_ids, since, since_headers
+        )
+
+        etag = quote_etag(liveticker_service.get_etag())
+        last_modified = liveticker_service.get_last_modified()
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
         )
+        if not_modified is not None:
+            return not_modified
 
-        return Response(liveticker_service.get_liveticker_as_json())
+        liveticker = liveticker_service.get_liveticker_as_json()
+        if since is None:
+            response = Response(liveticker)
+        else:
+            response = Response(
+                {
+                    "cursor": liveticker_service.next_cursor,
+                    "games": liveticker,
+                    "gameIds": liveticker_service.game_ids,
+                    "deletedTicks": liveticker_service.deleted_ticks,
+                }
+            )
+        response[self.CURSOR_HEADER] = liveticker_service.next_cursor
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        response["Cache-Control"] = "no-cache"
+        return response
+
+    # noinspection PyMethodMayBeStatic
+    def _parse_league(self, league):
+        return [] if league is None or league == "" else league.split(",")
 
     # noinspection PyMethodMayBeStatic
     def _parse_input(self, input_value):
@@ -33,3 +63,12 @@ class LivetickerAPIView(APIView):
             except ValueError:
                 continue
         return all_numbers_as_int
+
+    # noinspection PyMethodMayBeStatic
+    def _parse_cursor(self, cursor):
+        """Splits `<tick id>.<headers digest>`, the digest is optional."""
+        tick_id, _, headers = (cursor or "").partition(".")
+        try:
+            return int(tick_id), headers or None
+        except ValueError:
+            return None, None
@@ -1,121 +1,385 @@
+import hashlib
+import json
 from datetime import datetime
+from functools import reduce
+from operator import or_
 from typing import List
 
 from django.conf import settings
-from django.db.models import Subquery, OuterRef, F, Q
+from django.core.cache import cache
+from django.db.models import (
+    F,
+    Q,
+    Max,
+    Min,
+    Case,
+    When,
+    Value,
+    Window,
+    FilteredRelation,
+    PositiveSmallIntegerField,
+)
+from django.db.models.functions import RowNumber
 
-from gamedays.models import League, Gameday, Gameinfo, Gameresult, TeamLog
+from gamedays.models import Gameday, Gameinfo, TeamLog
+from gamedays.service.gameday_data_version import GamedayDataVersion
 from gamedays.service.gameday_settings import SCHEDULED
 from liveticker.api.serializers import LivetickerSerializer, TeamlogSerializer
 
+LIVE_STATUS = ["1. Halbzeit", "2. Halbzeit"]
+
 
 class LivetickerService:
-    def __init__(self, league: List, games_with_all_ticks: List, gameday_ids: List):
+    """
+    Assembles the liveticker with a fixed number of queries, independent of how many
+    gamedays, fields and games are live:
+    one query for the current time slots of all gamedays, one query for all games
+    joined with both gameresults, one windowed query for the latest ticks per game and
+    one query for the deleted ticks.
+
+    The result is cached as one snapshot per gameday, keyed by the GamedayDataVersion,
+    so snapshots are recomputed as soon as a write to the gameday was committed.
+
+    If a cursor (`since`, the highest TeamLog id a client already received) is given,
+    only the ticks created after it are returned, together with the ids of the deleted
+    ticks up to the cursor (`deleted_ticks`), which the client may have received before.
+    Games without new ticks are left out if their header (score, status, possession,
+    ...) is unchanged as well. Headers can change without a tick, so the cursor also
+    names the headers the client received (`since_headers`, a digest of the header
+    digests of all games cached under HEADERS_CACHE_KEY). Without the digest all games
+    are returned. The cursor for the next request is available as `next_cursor` after
+    the liveticker was computed, the ids of all games as `game_ids`.
+    """
+
+    ALL_TICKS = 32767
+    SNAPSHOT_CACHE_KEY = "liveticker_snapshot_{}_{}_{}"
+    HEADERS_CACHE_KEY = "liveticker_headers_{}"
+    # snapshots of an expired version are never read again
+    SNAPSHOT_TIMEOUT = GamedayDataVersion.TIMEOUT
+    SNAPSHOT_GAMES = "games"
+    SNAPSHOT_CURSOR = "cursor"
+    SNAPSHOT_DELETED_TICKS = "deleted_ticks"
+    SNAPSHOT_HEADERS = "headers"
+    SNAPSHOT_HOME_TEAMS = "home_teams"
+
+    def __init__(
+        self,
+        league: List,
+        games_with_all_ticks: List,
+        gameday_ids: List,
+        since: int | None = None,
+        since_headers: str | None = None,
+    ):
         self.number_of_ticks = 5
         self._init_gamedays(gameday_ids, league)
         self.games_with_all_ticks = games_with_all_ticks
+        self.since = since
+        self.since_headers = since_headers
+        self.cursor = since or 0
+        self.headers = {}
+        self.game_ids = []
+        self.deleted_ticks = []
 
     def _init_gamedays(self, gameday_ids, league):
-        if not league:
-            league = League.objects.all()
-        else:
-            league = League.objects.filter(slug__in=league)
-        if not gameday_ids:
-            today_gamedays = Gameday.objects.filter(
-                date=datetime.today(), league__in=league
-            )
-            if settings.DEBUG:
-                today_gamedays = Gameday.objects.filter(
-                    date=settings.DEBUG_DATE, league__in=league
-                )
-            self.gameday_ids = [gameday.pk for gameday in today_gamedays]
-        else:
-            self.gameday_ids = gameday_ids
+        if gameday_ids:
+            self.gameday_ids = list(dict.fromkeys(gameday_ids))
+            return
+        date = settings.DEBUG_DATE if settings.DEBUG else datetime.today()
+        today_gamedays = Gameday.objects.filter(date=date)
+        if league:
+            today_gamedays = today_gamedays.filter(league__slug__in=league)
+        self.gameday_ids = list(today_gamedays.values_list("pk", flat=True))
+
+    def get_etag(self) -> str:
+        """ETag of the liveticker, which only changes when a subscribed gameday changes."""
+        versions = GamedayDataVersion.get_many(self.gameday_ids)
+        fingerprint = "|".join(
+            [
+                ",".join(
+                    f"{gameday_id}:{versions[gameday_id]}"
+                    for gameday_id in self.gameday_ids
+                ),
+                ",".join(map(str, sorted(self.games_with_all_ticks))),
+                str(self.since),
+                str(self.since_headers),
+            ]
+        )
+        return hashlib.md5(fingerprint.encode(), usedforsecurity=False).hexdigest()
+
+    def get_last_modified(self) -> int | None:
+        return GamedayDataVersion.get_last_modified(self.gameday_ids)
+
+    @property
+    def next_cursor(self) -> str:
+        """Highest tick id and digest of the headers sent, passed back as `since`."""
+        return f"{self.cursor}.{self._get_headers_digest(self.headers)}"
 
     def get_liveticker_as_json(self):
-        next_games_list = []
+        if not self.gameday_ids:
+            return []
+        versions = GamedayDataVersion.get_many(self.gameday_ids)
+        snapshot_keys = {
+            gameday_id: self._get_snapshot_key(gameday_id, versions[gameday_id])
+            for gameday_id in self.gameday_ids
+        }
+        snapshots = cache.get_many(snapshot_keys.values())
+        missing_gameday_ids = [
+            gameday_id
+            for gameday_id, snapshot_key in snapshot_keys.items()
+            if snapshot_key not in snapshots
+        ]
+        if missing_gameday_ids:
+            computed_snapshots = {
+                snapshot_keys[gameday_id]: snapshot
+                for gameday_id, snapshot in self._compute_snapshots(
+                    missing_gameday_ids
+                ).items()
+            }
+            cache.set_many(computed_snapshots, timeout=self.SNAPSHOT_TIMEOUT)
+            snapshots.update(computed_snapshots)
+
+        liveticker = []
         for gameday_id in self.gameday_ids:
-            filter_conditions = Q(
-                gameday=gameday_id, status__in=["1. Halbzeit", "2. Halbzeit"]
-            )
-            filter_conditions |= self._get_upcoming_slot_filter(gameday_id)
-            filter_conditions |= self._get_latest_slot_filter(gameday_id)
-            next_games_list += self._get_all_live_games(filter_conditions)
-        self._update_next_games_with_teamlog(next_games_list)
-        return LivetickerSerializer(instance=next_games_list, many=True).data
+            snapshot = snapshots[snapshot_keys[gameday_id]]
+            liveticker += snapshot[self.SNAPSHOT_GAMES]
+            self.headers.update(snapshot[self.SNAPSHOT_HEADERS])
+            self.cursor = max(self.cursor, snapshot[self.SNAPSHOT_CURSOR])
+            if self.since is not None:
+                self.deleted_ticks += [
+                    tick_id
+                    for tick_id in snapshot[self.SNAPSHOT_DELETED_TICKS]
+                    if tick_id <= self.since
+                ]
+        self.game_ids = [game["gameId"] for game in liveticker]
+        cache.set(
+            self.HEADERS_CACHE_KEY.format(self._get_headers_digest(self.headers)),
+            self.headers,
+            timeout=self.SNAPSHOT_TIMEOUT,
+        )
+        if self.since is None:
+            return liveticker
+        return self._get_changes_since_cursor(liveticker, snapshots.values())
 
-    def _update_next_games_with_teamlog(self, next_games_list):
-        game: dict
-        for game in next_games_list:
-            number_of_ticks = self.number_of_ticks
-            if game["id"] in self.games_with_all_ticks:
-                number_of_ticks = None
-            teamlog = (
-                TeamLog.objects.filter(gameinfo=game["id"])
-                .exclude(isDeleted=True)
-                .order_by("-created_time")[slice(None, number_of_ticks)]
-                .values(*TeamlogSerializer.ALL_VALUE_FIELDS)
+    def _get_changes_since_cursor(self, liveticker: list, snapshots) -> list:
+        received_headers = None
+        if self.since_headers is not None:
+            received_headers = cache.get(
+                self.HEADERS_CACHE_KEY.format(self.since_headers)
             )
-            game.update({LivetickerSerializer.TEAMLOG: list(teamlog)})
+        home_teams = {}
+        for snapshot in snapshots:
+            home_teams.update(snapshot[self.SNAPSHOT_HOME_TEAMS])
+        ticks_after_limit = self._get_ticks_after_limit(liveticker, home_teams)
+        changes = []
+        for game in liveticker:
+            game_id = game["gameId"]
+            ticks = ticks_after_limit.get(game_id)
+            if ticks is None:
+                ticks = [
+                    tick
+                    for tick in game[LivetickerSerializer.TICKS]
+                    if tick[TeamlogSerializer.ID] > self.since
+                ]
+            if (
+                not ticks
+                and received_headers is not None
+                and received_headers.get(game_id) == self.headers[game_id]
+            ):
+                continue
+            changes.append({**game, LivetickerSerializer.TICKS: ticks})
+        return changes
 
-    def _get_all_live_games(self, filter_conditions):
-        next_games = (
-            Gameinfo.objects.filter(filter_conditions)
-            .distinct()
-            .annotate(
-                name_home=self._get_gameresult_team_subquery(
-                    is_home=True, team_column="team__name"
-                ),
-                full_name_home=self._get_gameresult_team_subquery(
-                    is_home=True, team_column="team__description"
-                ),
-                name_away=self._get_gameresult_team_subquery(
-                    is_home=False, team_column="team__name"
-                ),
-                full_name_away=self._get_gameresult_team_subquery(
-                    is_home=False, team_column="team__description"
-                ),
-                score_home=self._get_gameresult_score_subquery(is_home=True),
-                score_away=self._get_gameresult_score_subquery(is_home=False),
+    def _get_ticks_after_limit(self, liveticker: list, home_teams: dict) -> dict:
+        """
+        Ticks after the cursor of the games whose snapshot may not contain all of them,
+        because the ticks of the snapshot are limited and all of them are new.
+        """
+        game_ids = [
+            game["gameId"]
+            for game in liveticker
+            if game["gameId"] not in self.games_with_all_ticks
+            and len(game[LivetickerSerializer.TICKS]) >= self.number_of_ticks
+            and all(
+                tick[TeamlogSerializer.ID] > self.since
+                for tick in game[LivetickerSerializer.TICKS]
             )
-            .order_by(f"-{SCHEDULED}")
-            .values(*LivetickerSerializer.ALL_VALUE_FIELDS)
-        )
-        return list(next_games)
+        ]
+        if not game_ids:
+            return {}
+        teamlogs_by_game = {game_id: [] for game_id in game_ids}
+        for teamlog in (
+            TeamLog.objects.filter(gameinfo__in=game_ids, pk__gt=self.since)
+            .exclude(isDeleted=True)
+            .order_by("gameinfo", "-created_time", "-id")
+            .values(*TeamlogSerializer.ALL_VALUE_FIELDS, "gameinfo")
+        ):
+            teamlogs_by_game[teamlog["gameinfo"]].append(teamlog)
+        return {
+            game_id: TeamlogSerializer(
+                instance=teamlogs, home_team=home_teams[game_id], many=True
+            ).data
+            for game_id, teamlogs in teamlogs_by_game.items()
+        }
 
-    # noinspection PyMethodMayBeStatic
-    def _get_gameresult_score_subquery(self, is_home):
-        return Subquery(
-            Gameresult.objects.filter(gameinfo=OuterRef("id"), isHome=is_home)
-            .annotate(score=(F("fh") + F("sh")))
-            .values("score")[:1]
+    @staticmethod
+    def _get_headers_digest(headers: dict) -> str:
+        fingerprint = ",".join(
+            f"{game_id}:{header}" for game_id, header in sorted(headers.items())
         )
+        return hashlib.md5(fingerprint.encode(), usedforsecurity=False).hexdigest()
+
+    @staticmethod
+    def _get_header_digest(game: dict) -> str:
+        header = {
+            key: value
+            for key, value in game.items()
+            if key != LivetickerSerializer.TICKS
+        }
+        return hashlib.md5(
+            json.dumps(header, sort_keys=True).encode(), usedforsecurity=False
+        ).hexdigest()
 
-    def _get_upcoming_slot_filter(self, gameday_id) -> Q:
-        return self._get_slot_filter(gameday_id, True, SCHEDULED)
+    def _get_snapshot_key(self, gameday_id, version) -> str:
+        """
+        Snapshots are cached per gameday and data version. Only parameters which change
+        the content of a gameday are part of the key, so every filter combination
+        (e.g. ?league=a,b and ?league=b,a) and every cursor shares the same fragments.
+        """
+        games_with_all_ticks = ",".join(
+            map(str, sorted(set(self.games_with_all_ticks)))
+        )
+        return self.SNAPSHOT_CACHE_KEY.format(gameday_id, version, games_with_all_ticks)
 
-    def _get_latest_slot_filter(self, gameday_id) -> Q:
-        return self._get_slot_filter(gameday_id, False, f"-{SCHEDULED}")
+    def _compute_snapshots(self, gameday_ids: list) -> dict:
+        snapshots = {
+            gameday_id: {
+                self.SNAPSHOT_GAMES: [],
+                self.SNAPSHOT_CURSOR: 0,
+                self.SNAPSHOT_DELETED_TICKS: [],
+                self.SNAPSHOT_HEADERS: {},
+                self.SNAPSHOT_HOME_TEAMS: {},
+            }
+            for gameday_id in gameday_ids
+        }
+        next_games_list = self._get_all_live_games(
+            self._get_filter_conditions(gameday_ids)
+        )
+        cursors = self._update_next_games_with_teamlog(next_games_list)
+        deleted_ticks = self._get_deleted_ticks(
+            [game["id"] for game in next_games_list]
+        )
+        for game in next_games_list:
+            snapshot = snapshots[game["gameday"]]
+            serialized_game = dict(LivetickerSerializer(instance=game).data)
+            snapshot[self.SNAPSHOT_GAMES].append(serialized_game)
+            snapshot[self.SNAPSHOT_HEADERS][game["id"]] = self._get_header_digest(
+                serialized_game
+            )
+            snapshot[self.SNAPSHOT_HOME_TEAMS][game["id"]] = game[
+                LivetickerSerializer.NAME_HOME
+            ]
+            snapshot[self.SNAPSHOT_CURSOR] = max(
+                snapshot[self.SNAPSHOT_CURSOR], cursors.get(game["id"], 0)
+            )
+            snapshot[self.SNAPSHOT_DELETED_TICKS] += deleted_ticks.get(game["id"], [])
+        return snapshots
 
     # noinspection PyMethodMayBeStatic
-    def _get_slot_filter(
-        self, gameday_id: int, game_finished_is_null: bool, order_by: str
-    ) -> Q:
-        time_slot = (
-            Gameinfo.objects.filter(
-                gameday=gameday_id, gameFinished__isnull=game_finished_is_null
+    def _get_filter_conditions(self, gameday_ids: list) -> Q:
+        time_slots = (
+            Gameinfo.objects.filter(gameday__in=gameday_ids)
+            .values("gameday")
+            .annotate(
+                upcoming=Min(SCHEDULED, filter=Q(gameFinished__isnull=True)),
+                latest=Max(SCHEDULED, filter=Q(gameFinished__isnull=False)),
             )
-            .order_by(order_by)
-            .first()
+            .order_by()
         )
-        return (
-            Q(gameday=gameday_id, scheduled=time_slot.scheduled) if time_slot else Q()
+        filter_conditions = [
+            Q(gameday__in=gameday_ids, status__in=LIVE_STATUS),
+        ]
+        for time_slot in time_slots:
+            for scheduled in (time_slot["upcoming"], time_slot["latest"]):
+                if scheduled is not None:
+                    filter_conditions.append(
+                        Q(gameday=time_slot["gameday"], scheduled=scheduled)
+                    )
+        return reduce(or_, filter_conditions)
+
+    # noinspection PyMethodMayBeStatic
+    def _get_all_live_games(self, filter_conditions: Q) -> list:
+        return list(
+            Gameinfo.objects.filter(filter_conditions)
+            .annotate(
+                home=FilteredRelation(
+                    "gameresult", condition=Q(gameresult__isHome=True)
+                ),
+                away=FilteredRelation(
+                    "gameresult", condition=Q(gameresult__isHome=False)
+                ),
+            )
+            .annotate(
+                name_home=F("home__team__name"),
+                full_name_home=F("home__team__description"),
+                name_away=F("away__team__name"),
+                full_name_away=F("away__team__description"),
+                score_home=F("home__fh") + F("home__sh"),
+                score_away=F("away__fh") + F("away__sh"),
+            )
+            .order_by(f"-{SCHEDULED}", "id")
+            .values(*LivetickerSerializer.ALL_VALUE_FIELDS, "gameday")
+            .distinct()
         )
 
+    def _update_next_games_with_teamlog(self, next_games_list: list) -> dict:
+        """Adds the latest ticks to every game and returns the highest tick id per game."""
+        if not next_games_list:
+            return {}
+        teamlogs_by_game = {game["id"]: [] for game in next_games_list}
+        cursors = {}
+        for teamlog in self._get_latest_teamlogs(list(teamlogs_by_game.keys())):
+            teamlogs_by_game[teamlog["gameinfo"]].append(teamlog)
+            cursors[teamlog["gameinfo"]] = max(
+                cursors.get(teamlog["gameinfo"], 0), teamlog["id"]
+            )
+        game: dict
+        for game in next_games_list:
+            game.update({LivetickerSerializer.TEAMLOG: teamlogs_by_game[game["id"]]})
+        return cursors
+
     # noinspection PyMethodMayBeStatic
-    def _get_gameresult_team_subquery(self, is_home: bool, team_column: str):
-        return Subquery(
-            Gameresult.objects.filter(gameinfo=OuterRef("id"), isHome=is_home).values(
-                team_column
-            )[:1]
+    def _get_deleted_ticks(self, game_ids: list) -> dict:
+        deleted_ticks = {}
+        if not game_ids:
+            return deleted_ticks
+        for game_id, tick_id in (
+            TeamLog.objects.filter(gameinfo__in=game_ids, isDeleted=True)
+            .order_by("id")
+            .values_list("gameinfo", "id")
+        ):
+            deleted_ticks.setdefault(game_id, []).append(tick_id)
+        return deleted_ticks
+
+    def _get_latest_teamlogs(self, game_ids: list):
+        return (
+            TeamLog.objects.filter(gameinfo__in=game_ids)
+            .exclude(isDeleted=True)
+            .annotate(
+                row_number=Window(
+                    RowNumber(),
+                    partition_by=F("gameinfo"),
+                    order_by=[F("created_time").desc(), F("id").desc()],
+                ),
+                tick_limit=Case(
+                    When(
+                        gameinfo__in=self.games_with_all_ticks,
+                        then=Value(self.ALL_TICKS),
+                    ),
+                    default=Value(self.number_of_ticks),
+                    output_field=PositiveSmallIntegerField(),
+                ),
+            )
+            .filter(row_number__lte=F("tick_limit"))
+            .order_by("gameinfo", "-created_time", "-id")
+            .values(*TeamlogSerializer.ALL_VALUE_FIELDS, "gameinfo")
         )
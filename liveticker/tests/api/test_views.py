@@ -5,7 +5,8 @@ from django.core.cache import cache
 from django.urls import reverse
 from django_webtest import WebTest
 
-from gamedays.models import Gameinfo, Gameday
+from gamedays.models import Gameinfo, Gameday, Gameresult, TeamLog
+from gamedays.service.gameday_data_version import GamedayDataVersion
 from gamedays.tests.setup_factories.db_setup import DBSetup
 from liveticker.api.urls import API_LIVETICKER_ALL
 
@@ -45,3 +46,132 @@ class TestLivetickerAPIView(WebTest):
         assert response.json[0] == expected_result
         expected_result["gameId"] = first_game_gameday_two.pk
         assert response.json[2] == expected_result
+
+
+class TestLivetickerConditionalAndDeltaAPIView(WebTest):
+    def setUp(self):
+        cache.clear()
+
+    def test_unchanged_liveticker_returns_not_modified(self):
+        gameday = DBSetup().g62_status_empty()
+        url = f"{reverse(API_LIVETICKER_ALL)}?gameday={gameday.pk}"
+        response = self.app.get(url)
+        assert response.headers["Cache-Control"] == "no-cache"
+        etag = response.headers["ETag"]
+        response = self.app.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_changed_liveticker_is_sent_again(self):
+        gameday = DBSetup().g62_status_empty()
+        url = f"{reverse(API_LIVETICKER_ALL)}?gameday={gameday.pk}"
+        etag = self.app.get(url).headers["ETag"]
+        GamedayDataVersion.bump(gameday.pk)
+        response = self.app.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["ETag"] != etag
+        assert "Last-Modified" in response.headers
+
+    def _create_ticks(self):
+        gameday = DBSetup().g62_status_empty()
+        first_game = Gameinfo.objects.filter(gameday=gameday).first()
+        home = Gameresult.objects.get(gameinfo=first_game, isHome=True)
+        away = Gameresult.objects.get(gameinfo=first_game, isHome=False)
+        DBSetup().create_teamlog_home_and_away(
+            home=home.team, away=away.team, gameinfo=first_game
+        )
+        url = f"{reverse(API_LIVETICKER_ALL)}?gameday={gameday.pk}"
+        return gameday, first_game, home, url
+
+    @staticmethod
+    def _create_touchdown(first_game, home):
+        TeamLog.objects.create(
+            gameinfo=first_game,
+            team=home.team,
+            sequence=99,
+            event="Touchdown",
+            player=23,
+            half=2,
+        )
+
+    def test_since_cursor_returns_only_changed_games(self):
+        gameday, first_game, home, url = self._create_ticks()
+        response = self.app.get(url)
+        cursor = response.headers["X-Liveticker-Cursor"]
+        assert cursor.startswith(f"{TeamLog.objects.latest('pk').pk}.")
+        game_ids = [game["gameId"] for game in response.json]
+
+        response = self.app.get(f"{url}&since={cursor}")
+        assert response.json["cursor"] == cursor
+        assert response.json["games"] == []
+        assert response.json["gameIds"] == game_ids
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._create_touchdown(first_game, home)
+        response = self.app.get(f"{url}&since={cursor}")
+        assert response.json["cursor"].startswith(f"{TeamLog.objects.latest('pk').pk}.")
+        assert response.json["deletedTicks"] == list(
+            TeamLog.objects.filter(isDeleted=True)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+        assert [game["gameId"] for game in response.json["games"]] == [first_game.pk]
+        ticks = response.json["games"][0]["ticks"]
+        assert [tick["text"] for tick in ticks] == ["Touchdown: #23"]
+        assert ticks[0]["id"] == TeamLog.objects.latest("pk").pk
+
+    def test_since_cursor_returns_games_with_changed_header(self):
+        gameday, first_game, home, url = self._create_ticks()
+        cursor = self.app.get(url).headers["X-Liveticker-Cursor"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first_game.in_possession = Gameresult.objects.get(
+                gameinfo=first_game, isHome=False
+            ).team.name
+            first_game.save()
+        response = self.app.get(f"{url}&since={cursor}")
+        assert response.json["cursor"] != cursor
+        game = response.json["games"][0]
+        assert [game["gameId"] for game in response.json["games"]] == [first_game.pk]
+        assert game["ticks"] == []
+        assert game["away"]["isInPossession"] is True
+
+    def test_since_cursor_without_headers_returns_all_games(self):
+        gameday, first_game, home, url = self._create_ticks()
+        response = self.app.get(url)
+        cursor = response.headers["X-Liveticker-Cursor"].split(".")[0]
+
+        response = self.app.get(f"{url}&since={cursor}")
+        assert len(response.json["games"]) == len(response.json["gameIds"]) == 2
+        assert [game["ticks"] for game in response.json["games"]] == [[], []]
+
+    def test_since_cursor_returns_all_new_ticks(self):
+        gameday, first_game, home, url = self._create_ticks()
+        cursor = self.app.get(url).headers["X-Liveticker-Cursor"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            for _ in range(7):
+                self._create_touchdown(first_game, home)
+        response = self.app.get(f"{url}&since={cursor}")
+        assert len(response.json["games"][0]["ticks"]) == 7
+        assert len(self.app.get(url).json[0]["ticks"]) == 5
+
+    def test_since_cursor_returns_deleted_ticks_and_score(self):
+        gameday, first_game, home, url = self._create_ticks()
+        response = self.app.get(url)
+        cursor = response.headers["X-Liveticker-Cursor"]
+        sent_tick = response.json[0]["ticks"][0]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            TeamLog.objects.filter(pk=sent_tick["id"]).update(isDeleted=True)
+            Gameresult.objects.filter(pk=home.pk).update(fh=0, sh=0)
+            GamedayDataVersion.bump_on_commit(gameday.pk)
+        response = self.app.get(f"{url}&since={cursor}")
+        assert response.json["cursor"].split(".")[0] == cursor.split(".")[0]
+        assert sent_tick["id"] in response.json["deletedTicks"]
+        game = response.json["games"][0]
+        assert game["ticks"] == []
+        assert game["home"]["score"] == 0
+        assert game["status"] == first_game.status
+
+        # without a cursor the complete liveticker is returned as before
+        assert isinstance(self.app.get(url).json, list)
@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.test import TestCase
 
 from gamedays.models import League, Gameinfo, Gameresult
@@ -6,6 +7,9 @@ from liveticker.service.liveticker_service import LivetickerService
 
 
 class TestLivetickerService(TestCase):
+    def setUp(self):
+        cache.clear()
+
     def test_no_liveticker_available(self):
         DBSetup().create_empty_gameday()
         ls = LivetickerService([], [], [])
@@ -99,3 +103,76 @@ class TestLivetickerService(TestCase):
         liveticker_service = LivetickerService([], [first_game.pk], [])
         all_livetickers = liveticker_service.get_liveticker_as_json()
         assert len(all_livetickers[0]["ticks"]) == 19
+
+    def test_liveticker_query_count_is_independent_of_number_of_gamedays(self):
+        for _ in range(3):
+            DBSetup().g62_status_empty()
+        first_game = Gameinfo.objects.first()
+        Gameinfo.objects.filter(pk=first_game.pk + 1).update(status="1. Halbzeit")
+        home = Gameresult.objects.get(gameinfo=first_game, isHome=True)
+        away = Gameresult.objects.get(gameinfo=first_game, isHome=False)
+        DBSetup().create_teamlog_home_and_away(
+            home=home.team, away=away.team, gameinfo=first_game
+        )
+        liveticker_service = LivetickerService([], [first_game.pk], [])
+        with self.assertNumQueries(4):
+            all_livetickers = liveticker_service.get_liveticker_as_json()
+        assert len(all_livetickers) == 7
+        ticks_by_game = {game["gameId"]: game["ticks"] for game in all_livetickers}
+        assert len(ticks_by_game.pop(first_game.pk)) == 19
+        assert all(ticks == [] for ticks in ticks_by_game.values())
+
+    def test_liveticker_is_served_from_snapshot_until_gameday_changes(self):
+        gameday = DBSetup().g62_status_empty()
+        first_game = Gameinfo.objects.filter(gameday=gameday).first()
+        LivetickerService([], [], [gameday.pk]).get_liveticker_as_json()
+        with self.assertNumQueries(0):
+            cached = LivetickerService([], [], [gameday.pk]).get_liveticker_as_json()
+        assert cached[0]["status"] == "Geplant"
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first_game.status = "1. Halbzeit"
+            first_game.save()
+        with self.assertNumQueries(4):
+            updated = LivetickerService([], [], [gameday.pk]).get_liveticker_as_json()
+        statuses = {game["gameId"]: game["status"] for game in updated}
+        assert statuses[first_game.pk] == "1. Halbzeit"
+
+    def test_liveticker_snapshots_are_shared_between_filter_orders(self):
+        gameday_one = DBSetup().g62_status_empty()
+        gameday_two = DBSetup().g62_status_empty()
+        LivetickerService(
+            [], [], [gameday_one.pk, gameday_two.pk]
+        ).get_liveticker_as_json()
+        with self.assertNumQueries(0):
+            liveticker = LivetickerService(
+                [], [], [gameday_two.pk, gameday_one.pk, gameday_two.pk]
+            ).get_liveticker_as_json()
+        assert len(liveticker) == 4
+        assert liveticker[0]["gameId"] in Gameinfo.objects.filter(
+            gameday=gameday_two
+        ).values_list("pk", flat=True)
+
+    def test_liveticker_snapshot_is_shared_between_cursors(self):
+        gameday = DBSetup().g62_status_empty()
+        first_game = Gameinfo.objects.filter(gameday=gameday).first()
+        home = Gameresult.objects.get(gameinfo=first_game, isHome=True)
+        away = Gameresult.objects.get(gameinfo=first_game, isHome=False)
+        DBSetup().create_teamlog_home_and_away(
+            home=home.team, away=away.team, gameinfo=first_game
+        )
+        full = LivetickerService([], [], [gameday.pk]).get_liveticker_as_json()
+        ticks = full[0]["ticks"]
+        since = sorted(tick["id"] for tick in ticks)[2]
+        with self.assertNumQueries(0):
+            liveticker_service = LivetickerService([], [], [gameday.pk], since)
+            liveticker = liveticker_service.get_liveticker_as_json()
+        assert [tick["id"] for tick in liveticker[0]["ticks"]] == [
+            tick["id"] for tick in ticks if tick["id"] > since
+        ]
+        assert liveticker_service.cursor == max(tick["id"] for tick in ticks)
+        # the cached snapshot is not changed by the cursor
+        assert (
+            LivetickerService([], [], [gameday.pk]).get_liveticker_as_json()[0]["ticks"]
+            == ticks
+        )
@@ -123,7 +123,9 @@ class PasscheckGamesListSerializer(Serializer):
         if name is None:
             game_id = obj.get('id')
             if game_id is not None:
-                name = GamedayPlaceholderService.resolve_placeholder(game_id, is_home=True)
+                name = GamedayPlaceholderService.resolve_from_context(
+                    self.context, game_id, is_home=True
+                )
             else:
                 name = "TBD"
         return self._get_team_values(
@@ -135,7 +137,9 @@ class PasscheckGamesListSerializer(Serializer):
         if name is None:
             game_id = obj.get('id')
             if game_id is not None:
-                name = GamedayPlaceholderService.resolve_placeholder(game_id, is_home=False)
+                name = GamedayPlaceholderService.resolve_from_context(
+                    self.context, game_id, is_home=False
+                )
             else:
                 name = "TBD"
         return self._get_team_values(
@@ -6,6 +6,7 @@ from django.db.models import Count, Q, Value, OuterRef, Exists, Subquery, Intege
 from gamedays.api.serializers import GamedayInfoSerializer
 from gamedays.models import Team, Gameinfo, Gameday
 from gamedays.service.model_helper import GameresultHelper
+from gamedays.service.placeholder_service import GamedayPlaceholderService
 from league_manager.utils.view_utils import UserRequestPermission
 from passcheck.api.serializers import (
     PasscheckGamesListSerializer,
@@ -82,8 +83,19 @@ class PasscheckService:
                 )
             ),
         )
+        games = gameinfo.values(*PasscheckGamesListSerializer.ALL_FIELD_VALUES)
+        gamedays_with_placeholders = [
+            game[PasscheckGamesListSerializer.GAMEDAY_ID_C]
+            for game in games
+            if game[PasscheckGamesListSerializer.HOME_C] is None
+            or game[PasscheckGamesListSerializer.AWAY_C] is None
+        ]
         return PasscheckGamesListSerializer(
-            gameinfo.values(*PasscheckGamesListSerializer.ALL_FIELD_VALUES), many=True
+            games,
+            many=True,
+            context=GamedayPlaceholderService.serializer_context(
+                gamedays_with_placeholders
+            ),
         ).data
 
     def get_passcheck_games(self, team_id, gameday_id=None):